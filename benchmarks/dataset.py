@@ -0,0 +1,66 @@
+# dataset.py
+# Synthetic saved jobs and API results for the benchmarks
+
+import json
+import random
+
+from job_records import STATUSES, job_link
+
+TITLES = ["Softwareentwickler", "Koch", "Pflegefachkraft", "Elektriker", "Buchhalter",
+          "Lagerist", "Informatiker", "Verkäufer", "Erzieher", "Mechatroniker"]
+LEVELS = ["", "Junior ", "Senior ", "Leitender ", "Auszubildender "]
+COMPANIES = ["Müller", "Schmidt", "Nordlicht", "Bergmann", "Rheinwerk", "Hansa", "Sonnenhof", "Alpen"]
+FORMS = ["GmbH", "AG", "KG", "GmbH & Co. KG", "e.V."]
+CITIES = [("Berlin", "Berlin"), ("Hamburg", "Hamburg"), ("Bayern", "München"), ("Hessen", "Frankfurt"),
+          ("Sachsen", "Leipzig"), ("Nordrhein-Westfalen", "Köln"), ("Baden-Württemberg", "Stuttgart")]
+WORDS = ("Bewerbung Gespräch Rückruf Gehalt Teilzeit Vollzeit Homeoffice Anschreiben "
+         "Lebenslauf Zeugnis Frist Kontakt Team Standort Probezeit").split()
+
+def refnr(i):
+    return f"10000-{i:07d}-S"
+
+def make_jobs(count, seed=0):
+    """count saved job entries with notes and file lists, deterministic for a seed."""
+    rnd = random.Random(seed)
+    jobs = []
+    for i in range(count):
+        region, city = rnd.choice(CITIES)
+        ref = refnr(i)
+        jobs.append({
+            "title": f"{rnd.choice(LEVELS)}{rnd.choice(TITLES)} ({i})",
+            "company": f"{rnd.choice(COMPANIES)} {rnd.choice(FORMS)}",
+            "location": f"{region}, {city}",
+            "status": rnd.choice(STATUSES),
+            "notes": " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(0, 40))),
+            "refnr": ref,
+            "link": job_link(ref),
+            "files": [f"dokumente/{ref}/{name}.pdf" for name in rnd.sample(WORDS, rnd.randint(0, 3))],
+        })
+    return jobs
+
+def write_saved_jobs(path, count, seed=0):
+    """Write a saved_jobs.json file in the app's format and return the jobs."""
+    jobs = make_jobs(count, seed)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(jobs, f, ensure_ascii=False, indent=2)
+    return jobs
+
+def make_offers(start, stop, was="", wo=""):
+    """Job offers as returned in stellenangebote by the jobsuche API."""
+    offers = []
+    for i in range(start, stop):
+        region, city = CITIES[i % len(CITIES)]
+        offers.append({
+            "titel": f"{was or TITLES[i % len(TITLES)]} {i}",
+            "arbeitgeber": f"{COMPANIES[i % len(COMPANIES)]} {FORMS[i % len(FORMS)]}",
+            "refnr": refnr(i),
+            "arbeitsort": {"region": region, "ort": wo or city,
+                           "koordinaten": {"lat": 47.5 + (i % 90) * 0.05, "lon": 6.0 + (i % 80) * 0.1}},
+        })
+    return offers
+
+if __name__ == "__main__":
+    import sys
+    for size in (int(arg) for arg in sys.argv[1:] or ["1000", "10000", "100000"]):
+        write_saved_jobs(f"saved_jobs_{size}.json", size)
+        print(f"saved_jobs_{size}.json")
@@ -0,0 +1,94 @@
+# fake_server.py
+# Local stand-in for the jobsuche endpoint, serving paged stellenangebote
+
+import json
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+from dataset import make_offers
+
+class _Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        if server.delay:
+            time.sleep(server.delay)
+        with server.lock:
+            server.requests += 1
+
+        if "/jobdetails/" in url.path:
+            ref = url.path.rsplit("/", 1)[1]
+            body = {"refnr": ref, "stellenbeschreibung": f"Beschreibung für {ref}"}
+        else:
+            size = int(query.get("size", ["25"])[0])
+            page = int(query.get("page", ["1"])[0])
+            start = (page - 1) * size
+            body = {
+                "stellenangebote": make_offers(start, min(start + size, server.total),
+                                               query.get("was", [""])[0], query.get("wo", [""])[0]),
+                "maxErgebnisse": server.total,
+                "page": page,
+                "size": size,
+            }
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+class FakeJobsuche:
+    """
+    Threaded HTTP server answering searches with `total` synthetic hits.
+    delay is added to every response to mimic network latency.
+    """
+
+    def __init__(self, total=2500, delay=0.05, host="127.0.0.1", port=0):
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.total = total
+        self.httpd.delay = delay
+        self.httpd.requests = 0
+        self.httpd.lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/pc/v4/jobs"
+
+    @property
+    def requests(self):
+        return self.httpd.requests
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Fake jobsuche server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--total", type=int, default=2500)
+    parser.add_argument("--delay", type=float, default=0.05)
+    args = parser.parse_args()
+    server = FakeJobsuche(args.total, args.delay, port=args.port)
+    print(f"JOBSUCHE_API_URL={server.url}")
+    server.httpd.serve_forever()
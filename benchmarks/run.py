@@ -0,0 +1,225 @@
+# run.py
+# Benchmark suite: storage, table population, filtering, duplicate checks, export and search
+#
+# Examples:
+#   python benchmarks/run.py --sizes 1000,10000 --output before.json
+#   python benchmarks/run.py --output after.json --compare before.json
+
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5 import QtWidgets, QtCore
+
+from dataset import make_jobs, write_saved_jobs
+from fake_server import FakeJobsuche
+from job_api import JobApiClient, fetch_all_pages
+from job_data import JsonStorage, SqliteStorage
+from job_export import write_csv
+from job_records import JobRecord
+from job_dedupe import NearDuplicateGrouper, NearDuplicateIndex, signature
+from job_repository import SavedJobRepository
+from table_models import SavedJobsModel, ResultsTableModel, JobFilterProxyModel
+
+FILTER_QUERIES = ["koch", "berlin", "status:applied", "senior informatiker", "gmbh frist", "nichtvorhanden"]
+TYPING = ["s", "se", "sen", "seni", "senio", "senior"]
+
+class Suite:
+    def __init__(self, repeat, workdir):
+        self.repeat = repeat
+        self.workdir = workdir
+        self.results = []
+
+    def measure(self, name, size, func, repeat=None):
+        """Run func repeat times and record the timings."""
+        runs = []
+        for _ in range(repeat or self.repeat):
+            start = time.perf_counter()
+            func()
+            runs.append((time.perf_counter() - start) * 1000)
+        result = {
+            "name": name,
+            "size": size,
+            "median_ms": round(statistics.median(runs), 3),
+            "min_ms": round(min(runs), 3),
+            "max_ms": round(max(runs), 3),
+            "runs": len(runs),
+        }
+        self.results.append(result)
+        print(f"{name:<24} {size:>8} {result['median_ms']:>10.1f} ms", file=sys.stderr)
+        return result
+
+def bench_storage(suite, jobs):
+    size = len(jobs)
+    json_path = os.path.join(suite.workdir, f"saved_jobs_{size}.json")
+    write_saved_jobs(json_path, size)
+    json_storage = JsonStorage(json_path)
+    suite.measure("load_jobs_json", size, json_storage.load)
+    out = JsonStorage(os.path.join(suite.workdir, "save_test.json"))
+    suite.measure("save_jobs_json", size, lambda: out.save_all(jobs))
+
+    db_path = os.path.join(suite.workdir, f"saved_jobs_{size}.db")
+    sqlite = SqliteStorage(db_path, json_path=os.path.join(suite.workdir, "none.json"))
+    suite.measure("save_jobs_sqlite", size, lambda: sqlite.save_all(jobs))
+    suite.measure("load_jobs_sqlite", size, sqlite.load)
+    changed = dict(jobs[size // 2], status="Applied")
+    suite.measure("upsert_job_sqlite", size, lambda: sqlite.upsert(changed, jobs), repeat=suite.repeat * 10)
+    sqlite.close()
+
+def bench_table(suite, jobs):
+    size = len(jobs)
+
+    def populate():
+        model = SavedJobsModel(SavedJobRepository())
+        proxy = JobFilterProxyModel()
+        proxy.setSourceModel(model)
+        view = QtWidgets.QTableView()
+        view.setModel(proxy)
+        model.set_jobs([dict(job) for job in jobs])
+        return model, proxy, view
+
+    suite.measure("table_populate", size, populate)
+    model, proxy, view = populate()
+    suite.measure("resize_columns", size, view.resizeColumnsToContents, repeat=1)
+    suite.measure("index_build", size, lambda: model.search_index.build_pending(len(jobs)), repeat=1)
+
+    def run_queries():
+        for text in FILTER_QUERIES:
+            proxy.set_filter_text(text)
+            proxy.set_filter_text("")
+
+    suite.measure("filter_queries", size, run_queries)
+
+    def typing():
+        for text in TYPING:
+            proxy.set_filter_text(text)
+        proxy.set_filter_text("")
+
+    suite.measure("filter_typing", size, typing)
+    proxy.sort(0, QtCore.Qt.AscendingOrder)
+    suite.measure("filter_sorted", size, run_queries)
+
+def bench_duplicates(suite, jobs):
+    size = len(jobs)
+    repo = SavedJobRepository(jobs)
+    # Half already saved, half new
+    fresh = make_jobs(size, seed=1)
+    candidates = [dict(job) for job in jobs[::2]] + [dict(job, refnr=job["refnr"] + "X", title=job["title"] + "X")
+                                                      for job in fresh[::2]]
+    suite.measure("duplicate_check", size, lambda: sum(map(repo.is_duplicate, candidates)))
+
+    index = NearDuplicateIndex()
+
+    def build():
+        index.clear()
+        for job in jobs:
+            index.add_text(id(job), job["title"], job["company"], job["location"])
+        index.build_pending(len(jobs))
+
+    suite.measure("near_duplicate_index", size, build, repeat=1)
+    signatures = [signature(job["title"], job["company"], job["location"]) for job in candidates]
+    suite.measure("near_duplicate_check", size, lambda: sum(1 for sig in signatures if index.similar(sig)))
+
+def bench_export(suite, jobs):
+    path = os.path.join(suite.workdir, "export.csv")
+    suite.measure("csv_export", len(jobs), lambda: write_csv(jobs, path))
+
+def bench_search(suite, hits, delay):
+    app = QtWidgets.QApplication.instance()
+    with FakeJobsuche(total=hits, delay=delay) as server:
+        def search():
+            client = JobApiClient(url=server.url, cache=False, rate=1000.0, burst=1000)
+            model = ResultsTableModel()
+            grouper = NearDuplicateGrouper()
+            for jobs in fetch_all_pages({"wo": "Berlin", "was": "Koch"}, client=client):
+                records = [JobRecord.from_api(job) for job in jobs]
+                grouper.assign(records)
+                model.append_jobs(records)
+                app.processEvents()
+            client.close()
+            assert len(model.jobs) == hits, len(model.jobs)
+
+        suite.measure("search_end_to_end", hits, search)
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def compare(results, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["name"], r["size"]): r for r in json.load(f)["results"]}
+    print(f"\n{'':<24} {'size':>8} {'before':>10} {'after':>10} {'ratio':>7}", file=sys.stderr)
+    for r in results:
+        old = baseline.get((r["name"], r["size"]))
+        if old and old["median_ms"]:
+            ratio = r["median_ms"] / old["median_ms"]
+            print(f"{r['name']:<24} {r['size']:>8} {old['median_ms']:>10.1f} {r['median_ms']:>10.1f} "
+                  f"{ratio:>6.2f}x", file=sys.stderr)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Job Tracker Benchmarks")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Anzahl gespeicherter Jobs, kommagetrennt")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--search-hits", type=int, default=2500)
+    parser.add_argument("--delay", type=float, default=0.05, help="Antwortzeit des Testservers in Sekunden")
+    parser.add_argument("--only", help="Nur diese Gruppen: storage,table,duplicates,export,search")
+    parser.add_argument("--output", help="JSON-Ergebnisdatei (sonst stdout)")
+    parser.add_argument("--compare", help="Frühere JSON-Ergebnisdatei zum Vergleich")
+    args = parser.parse_args(argv)
+
+    groups = {"storage": bench_storage, "table": bench_table, "duplicates": bench_duplicates,
+              "export": bench_export}
+    only = set(args.only.split(",")) if args.only else set(groups) | {"search"}
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    workdir = tempfile.mkdtemp(prefix="jobtracker-bench-")
+    suite = Suite(args.repeat, workdir)
+    try:
+        for size in (int(s) for s in args.sizes.split(",") if s):
+            jobs = make_jobs(size)
+            for name, bench in groups.items():
+                if name in only:
+                    bench(suite, jobs)
+        if "search" in only:
+            bench_search(suite, args.search_hits, args.delay)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "qt": QtCore.QT_VERSION_STR,
+            "platform": platform.platform(),
+            "qpa": os.environ.get("QT_QPA_PLATFORM"),
+            "repeat": args.repeat,
+        },
+        "results": suite.results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    if args.compare:
+        compare(suite.results, args.compare)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+# cli.py
+# Command line interface for scripted searches, bulk saves and exports (no Qt required)
+#
+# Examples:
+#   python cli.py search --wo Berlin --was Informatiker --format json
+#   python cli.py search --wo Hamburg --was Koch --save --status Interested
+#   python cli.py list --status Applied
+#   python cli.py export saved_jobs.csv
+#   python cli.py export saved_jobs.jsonl.gz
+#   python cli.py import export.csv
+
+import sys
+import json
+import argparse
+
+OFFER_TYPES = {"arbeit": "1", "selbststaendigkeit": "2", "ausbildung": "4", "praktikum": "34"}
+
+def _write_rows(rows, fmt, out):
+    # rows are saved-job style dicts
+    from job_export import export_row
+    from job_records import FIELDS
+    if fmt == "json":
+        for row in rows:
+            out.write(json.dumps(row, ensure_ascii=False) + "\n")
+    elif fmt == "csv":
+        import csv
+        writer = csv.DictWriter(out, fieldnames=FIELDS)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(export_row(row))
+    else:
+        for row in rows:
+            out.write("\t".join(str(row.get(f, "")) for f in ("title", "company", "location", "status", "refnr")) + "\n")
+
+def _store():
+    # Saved jobs with the GUI's edit journal, so CLI edits keep their status history
+    from job_repository import SavedJobStore
+    from job_journal import JobJournal
+    return SavedJobStore(journal=JobJournal())
+
+def cmd_search(args):
+    from job_api import fetch_all_pages
+    from job_records import JobRecord, build_search_queries, has_refnr
+
+    queries = build_search_queries(args.was, args.wo, args.berufsfeld,
+                                   OFFER_TYPES.get(args.angebotsart, args.angebotsart or ""), args.umkreis or "")
+    entries = []
+    seen = set()
+    for label, params in queries:
+        def truncated(limit, total, label=label):
+            print(f"{label or 'Suche'}: nur die ersten {limit} von {total} Treffern geladen", file=sys.stderr)
+
+        for jobs in fetch_all_pages(params, max_pages=args.max_pages, on_truncated=truncated,
+                                    force_refresh=args.refresh):
+            for job in jobs:
+                record = JobRecord.from_api(job, label)
+                if has_refnr(record.refnr):
+                    if record.refnr in seen:
+                        continue
+                    seen.add(record.refnr)
+                entries.append(record.to_entry(status=args.status))
+
+    if args.save:
+        store = _store()
+        added = sum(1 for entry in entries if store.add(entry))
+        store.commit()
+        print(f"{added} von {len(entries)} Jobs gespeichert", file=sys.stderr)
+    else:
+        _write_rows(entries, args.format, sys.stdout)
+    return 0
+
+def cmd_list(args):
+    jobs = _store().jobs
+    if args.status:
+        jobs = [job for job in jobs if job.get("status") == args.status]
+    _write_rows(jobs, args.format, sys.stdout)
+    return 0
+
+def cmd_export(args):
+    from job_export import export_jobs
+    count = export_jobs(_store().jobs, args.path)
+    print(f"{count} Jobs exportiert nach {args.path}", file=sys.stderr)
+    return 0
+
+def cmd_import(args):
+    from job_import import read_records, collect_new
+    store = _store()
+    result = collect_new(read_records(args.path), store.repository)
+    for entry in result.jobs:
+        store.add(entry)
+    store.commit()
+    print(result.summary(), file=sys.stderr)
+    return 0
+
+def cmd_set_status(args):
+    store = _store()
+    missing = [ref for ref in args.refnr if not store.update(ref, status=args.status)]
+    store.commit()
+    for ref in missing:
+        print(f"Nicht gefunden: {ref}", file=sys.stderr)
+    return 1 if missing else 0
+
+def cmd_delete(args):
+    store = _store()
+    missing = [ref for ref in args.refnr if not store.delete(ref)]
+    store.commit()
+    for ref in missing:
+        print(f"Nicht gefunden: {ref}", file=sys.stderr)
+    return 1 if missing else 0
+
+def build_parser():
+    from job_records import STATUSES
+
+    parser = argparse.ArgumentParser(description="Arbeitsagentur Job Tracker ohne Oberfläche")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    search = sub.add_parser("search", help="Jobs suchen")
+    search.add_argument("--wo", required=True, help="Ort, mehrere mit Komma")
+    search.add_argument("--was", default="", help="Jobtitel, mehrere mit Komma")
+    search.add_argument("--berufsfeld", default="")
+    search.add_argument("--angebotsart", default="", help="arbeit, selbststaendigkeit, ausbildung, praktikum")
+    search.add_argument("--umkreis", type=int, help="Suchradius um den Ort in km")
+    search.add_argument("--max-pages", type=int, default=40)
+    search.add_argument("--refresh", action="store_true", help="Cache nicht verwenden")
+    search.add_argument("--format", choices=["tsv", "json", "csv"], default="tsv")
+    search.add_argument("--save", action="store_true", help="Ergebnisse als gespeicherte Jobs übernehmen")
+    search.add_argument("--status", choices=STATUSES, default="New")
+    search.set_defaults(func=cmd_search)
+
+    listing = sub.add_parser("list", help="Gespeicherte Jobs anzeigen")
+    listing.add_argument("--status", choices=STATUSES)
+    listing.add_argument("--format", choices=["tsv", "json", "csv"], default="tsv")
+    listing.set_defaults(func=cmd_list)
+
+    export = sub.add_parser("export", help="Gespeicherte Jobs als CSV oder JSONL exportieren")
+    export.add_argument("path", help="Dateiendung .csv, .jsonl, optional mit .gz")
+    export.set_defaults(func=cmd_export)
+
+    importer = sub.add_parser("import", help="Jobs aus einem CSV- oder JSONL-Export übernehmen")
+    importer.add_argument("path", help="Dateiendung .csv, .jsonl, optional mit .gz")
+    importer.set_defaults(func=cmd_import)
+
+    status = sub.add_parser("set-status", help="Status gespeicherter Jobs ändern")
+    status.add_argument("status", choices=STATUSES)
+    status.add_argument("refnr", nargs="+")
+    status.set_defaults(func=cmd_set_status)
+
+    delete = sub.add_parser("delete", help="Gespeicherte Jobs löschen")
+    delete.add_argument("refnr", nargs="+")
+    delete.set_defaults(func=cmd_delete)
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except Exception as e:
+        print(f"Fehler: {e}", file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+# detail_fetcher.py
+# Loads full job postings on a small thread pool, with prefetch for visible rows
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5 import QtCore
+import job_api
+
+DETAIL_WORKERS = 3       # Parallel detail requests
+MEMORY_ENTRIES = 300     # Postings kept in memory for instant reopening
+
+class DetailFetcher(QtCore.QObject):
+    """
+    Fetches job details by refnr and reports them through signals.
+
+    request() is for the posting the user opened; prefetch() takes the
+    refnrs of the rows currently on screen and drops queued fetches for
+    rows that scrolled away. Prefetches are background requests, which
+    leave part of the client's rate budget to searches. Requests that
+    already started cannot be stopped, their result simply lands in the
+    cache. Recently used postings stay in memory, older ones come from the
+    client's disk cache.
+    """
+
+    details_ready = QtCore.pyqtSignal(str, dict)
+    details_failed = QtCore.pyqtSignal(str, str)
+
+    def __init__(self, client=None, max_workers=DETAIL_WORKERS, memory_entries=MEMORY_ENTRIES, parent=None):
+        super().__init__(parent)
+        self.client = client
+        self.memory_entries = memory_entries
+        self._memory = OrderedDict()     # refnr -> details, most recently used last
+        self._pending = {}               # refnr -> Future, touched on the GUI thread only
+        self._wanted = set()             # refnrs someone is waiting for
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="details")
+        self.details_ready.connect(self._remember)
+        self.details_failed.connect(self._forget)
+
+    def cached(self, refnr):
+        """Details from memory or None."""
+        details = self._memory.get(refnr)
+        if details is not None:
+            self._memory.move_to_end(refnr)
+        return details
+
+    def request(self, refnr):
+        """Load details for refnr; details_ready fires (possibly right away) when they are there."""
+        details = self.cached(refnr)
+        if details is not None:
+            self.details_ready.emit(refnr, details)
+            return
+        self._wanted.add(refnr)
+        self._submit(refnr, background=False)
+
+    def prefetch(self, refnrs):
+        """Warm the cache for these refnrs and cancel queued prefetches for all others."""
+        refnrs = [ref for ref in refnrs if ref and ref not in self._memory]
+        keep = set(refnrs) | self._wanted
+        for ref, future in list(self._pending.items()):
+            if ref not in keep and future.cancel():
+                del self._pending[ref]
+        for ref in refnrs:
+            self._submit(ref, background=True)
+
+    def _submit(self, refnr, background):
+        if refnr in self._pending:
+            return
+        client = self.client or job_api.get_client()
+        future = self._pool.submit(client.job_details, refnr, background=background)
+        self._pending[refnr] = future
+        future.add_done_callback(lambda f, ref=refnr: self._done(ref, f))
+
+    def _done(self, refnr, future):
+        # Runs on a pool thread; the signals are delivered on the GUI thread
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.details_failed.emit(refnr, str(error))
+        else:
+            self.details_ready.emit(refnr, future.result() or {})
+
+    def _remember(self, refnr, details):
+        self._pending.pop(refnr, None)
+        self._wanted.discard(refnr)
+        self._memory[refnr] = details
+        self._memory.move_to_end(refnr)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _forget(self, refnr, message):
+        self._pending.pop(refnr, None)
+        self._wanted.discard(refnr)
+
+    def shutdown(self):
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._pool.shutdown(wait=False)
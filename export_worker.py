@@ -0,0 +1,38 @@
+# export_worker.py
+# Writes exports off the GUI thread and reports progress
+
+from PyQt5 import QtCore
+from job_export import export_jobs, ExportCancelled
+
+class ExportWorker(QtCore.QThread):
+    progress = QtCore.pyqtSignal(int, int)      # rows written, total rows
+    export_done = QtCore.pyqtSignal(int, str)   # rows written, path
+    export_failed = QtCore.pyqtSignal(str)
+    export_cancelled = QtCore.pyqtSignal()
+
+    def __init__(self, jobs, path, parent=None):
+        super().__init__(parent)
+        # jobs holds references to the job dicts; rows are built while writing
+        self.jobs = jobs
+        self.path = path
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        total = len(self.jobs)
+        try:
+            count = export_jobs(self.jobs, self.path,
+                                progress=lambda done: self.progress.emit(done, total),
+                                is_cancelled=self.is_cancelled)
+        except ExportCancelled:
+            self.export_cancelled.emit()
+            return
+        except Exception as e:
+            self.export_failed.emit(str(e))
+            return
+        self.export_done.emit(count, self.path)
@@ -0,0 +1,142 @@
+# instrumentation.py
+# Spans and counters for the hot paths, exportable as a Chrome trace (no Qt imports)
+#
+# Tracing is off unless JOBTRACKER_TRACE is set (to 1 or to the trace file path)
+# or switched on at runtime with enable(). While off, span() hands out one shared
+# no-op context manager and count() returns right away.
+
+import os
+import json
+import time
+import threading
+import functools
+from collections import deque
+
+TRACE_FILE = "jobtracker_trace.json"
+MAX_EVENTS = 200000     # Oldest trace events are dropped beyond this
+WINDOW = 500            # Durations kept per span name for the percentiles
+
+_setting = os.environ.get("JOBTRACKER_TRACE", "")
+enabled = _setting not in ("", "0")
+trace_path = _setting if enabled and _setting != "1" else TRACE_FILE
+
+_lock = threading.Lock()
+_events = deque(maxlen=MAX_EVENTS)
+_durations = {}     # span name -> deque of recent durations in ms
+_counters = {}      # counter name -> value
+_pid = os.getpid()
+_origin = time.perf_counter()
+
+def _now_us():
+    return (time.perf_counter() - _origin) * 1e6
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL = _NullSpan()
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = _now_us()
+        return self
+
+    def __exit__(self, *exc):
+        end = _now_us()
+        _record(self.name, self.start, end - self.start, self.args)
+        return False
+
+def _record(name, start, duration, args=None):
+    event = {"name": name, "ph": "X", "ts": start, "dur": duration,
+             "pid": _pid, "tid": threading.get_ident()}
+    if args:
+        event["args"] = args
+    with _lock:
+        _events.append(event)
+        window = _durations.get(name)
+        if window is None:
+            window = _durations[name] = deque(maxlen=WINDOW)
+        window.append(duration / 1000)
+
+def span(name, **args):
+    """Context manager timing a block: `with span("http.get"): ...`."""
+    if not enabled:
+        return _NULL
+    return _Span(name, args)
+
+def traced(name):
+    """Decorator form of span()."""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not enabled:
+                return func(*args, **kwargs)
+            with _Span(name, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def count(name, n=1):
+    """Add n to a counter; the new value also goes into the trace."""
+    if not enabled:
+        return
+    with _lock:
+        value = _counters[name] = _counters.get(name, 0) + n
+        _events.append({"name": name, "ph": "C", "ts": _now_us(), "pid": _pid,
+                        "tid": threading.get_ident(), "args": {"value": value}})
+
+def enable(on=True):
+    global enabled
+    enabled = on
+
+def reset():
+    with _lock:
+        _events.clear()
+        _durations.clear()
+        _counters.clear()
+
+def counters():
+    with _lock:
+        return dict(_counters)
+
+def percentile(ordered, p):
+    """Nearest-rank percentile p (0-100) of a sorted, non-empty list."""
+    index = max(0, min(len(ordered) - 1, round(p / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+def percentiles(points=(50, 90, 99)):
+    """{span name: {"count", "p50", ...}} over the recent durations in ms."""
+    with _lock:
+        windows = {name: sorted(window) for name, window in _durations.items()}
+    summary = {}
+    for name, ordered in sorted(windows.items()):
+        if not ordered:
+            continue
+        row = {"count": len(ordered)}
+        for p in points:
+            row[f"p{p}"] = round(percentile(ordered, p), 3)
+        summary[name] = row
+    return summary
+
+def write_trace(path=None):
+    """Write the recorded events as Chrome trace JSON (chrome://tracing, Perfetto); returns the path."""
+    path = path or trace_path
+    with _lock:
+        events = list(_events)
+    for thread in threading.enumerate():
+        events.append({"name": "thread_name", "ph": "M", "pid": _pid, "tid": thread.ident,
+                       "args": {"name": thread.name}})
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    return path
@@ -0,0 +1,303 @@
+# job_api.py
+# Access to the Arbeitsagentur jobsuche API, including multi-page fetching
+
+import os
+import math
+import base64
+import time
+import random
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from job_cache import ResponseCache, cache_key, CACHE_DIR
+from instrumentation import span, count
+
+API_URL = os.environ.get(
+    "JOBSUCHE_API_URL", "https://rest.arbeitsagentur.de/jobboerse/jobsuche-service/pc/v4/jobs"
+)
+API_HEADERS = {"X-API-Key": "jobboerse-jobsuche"}
+# {} is replaced by the base64-encoded refnr
+DETAILS_URL = os.environ.get(
+    "JOBSUCHE_DETAILS_URL", "https://rest.arbeitsagentur.de/jobboerse/jobsuche-service/pc/v2/jobdetails/{}"
+)
+
+PAGE_SIZE = 250      # Results per request
+MAX_WORKERS = 4      # Parallel page requests
+MAX_IN_FLIGHT = 8    # Pages submitted but not yet merged
+MAX_PAGES = 40       # Upper bound for a single search
+
+TIMEOUT = (5, 30)    # Connect and read timeout in seconds
+MAX_RETRIES = 4
+RETRY_STATUS = {429, 500, 502, 503, 504}
+RATE_LIMIT = 8.0     # Requests per second on average
+RATE_BURST = 16      # Requests allowed back to back
+BACKGROUND_RESERVE = RATE_BURST // 2   # Tokens background requests leave for searches and opened postings
+POOL_SIZE = 16       # Keep-alive connections held by the session
+DETAILS_TTL = 7 * 24 * 60 * 60           # Job details change rarely
+DETAILS_MAX_BYTES = 20 * 1024 * 1024
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() blocks until a request may be sent."""
+
+    def __init__(self, rate=RATE_LIMIT, capacity=RATE_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, reserve=0):
+        """Take one token; with reserve, wait until that many more are left for other callers."""
+        needed = 1 + min(reserve, self.capacity - 1)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= needed:
+                    self._tokens -= 1
+                    return
+                wait_time = (needed - self._tokens) / self.rate
+            time.sleep(wait_time)
+
+class JobApiClient:
+    """
+    Shared access point for the jobsuche API.
+
+    Owns one pooled requests.Session, applies timeouts, retries 429/5xx and
+    connection errors with jittered exponential backoff, limits the request
+    rate with a token bucket and lets identical concurrent requests share a
+    single HTTP round trip. Responses go through the on-disk cache.
+    """
+
+    def __init__(self, url=None, headers=API_HEADERS, timeout=TIMEOUT, max_retries=MAX_RETRIES,
+                 backoff_base=0.5, backoff_max=20.0, rate=RATE_LIMIT, burst=RATE_BURST,
+                 pool_size=POOL_SIZE, cache=None, details_url=None, details_cache=None):
+        self.url = url or API_URL
+        self.details_url = details_url or DETAILS_URL
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.bucket = TokenBucket(rate, burst)
+        # cache=False disables caching, None uses the default cache directory
+        self.cache = ResponseCache() if cache is None else cache
+        if details_cache is None and cache is not False:
+            details_cache = ResponseCache(os.path.join(CACHE_DIR, "details"), DETAILS_TTL, DETAILS_MAX_BYTES)
+        self.details_cache = details_cache or None
+
+        # requests is imported here so starting the app does not pay for it
+        import requests
+        from requests.adapters import HTTPAdapter
+        self._requests = requests
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.requests_sent = 0
+        self.retries = 0
+        self.merged = 0
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+
+    def get_json(self, url, params=None, force_refresh=False, use_cache=True, cache=None, background=False):
+        """
+        GET a JSON resource, using the cache and merging identical in-flight requests.
+        background requests (prefetching) only use rate budget beyond BACKGROUND_RESERVE.
+        """
+        params = params or {}
+        key = cache_key(url, params)
+        cache = self.cache if cache is None else cache
+        if use_cache and cache and not force_refresh:
+            cached = cache.get(key)
+            if cached is not None:
+                count("cache.hit")
+                return cached
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+            else:
+                self.merged += 1
+                count("http.merged")
+        if not leader:
+            return future.result()
+
+        try:
+            payload = self._request(url, params, background)
+            if use_cache and cache:
+                cache.put(key, payload)
+            future.set_result(payload)
+            return payload
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _send(self, url, params, headers=None, background=False):
+        # GET with rate limiting and retries; returns the last response
+        attempt = 0
+        while True:
+            self.bucket.acquire(BACKGROUND_RESERVE if background else 0)
+            self.requests_sent += 1
+            count("http.requests")
+            try:
+                with span("http.get", page=params.get("page")):
+                    res = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+            except (self._requests.ConnectionError, self._requests.Timeout):
+                if attempt >= self.max_retries:
+                    raise
+                self._backoff(attempt)
+                attempt += 1
+                continue
+
+            if res.status_code in RETRY_STATUS and attempt < self.max_retries:
+                self._backoff(attempt, res.headers.get("Retry-After"))
+                attempt += 1
+                continue
+            return res
+
+    def _request(self, url, params, background=False):
+        res = self._send(url, params, background=background)
+        res.raise_for_status()
+        with span("json.decode", bytes=len(res.content)):
+            return res.json()
+
+    def _backoff(self, attempt, retry_after=None):
+        self.retries += 1
+        count("http.retries")
+        delay = None
+        if retry_after:
+            try:
+                delay = min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        if delay is None:
+            # Exponential backoff with full jitter
+            delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        time.sleep(delay)
+
+    def search_page(self, params, page=1, size=PAGE_SIZE, force_refresh=False):
+        """Fetch one page of search results."""
+        return self.get_json(self.url, dict(params, page=page, size=size), force_refresh)
+
+    def job_details(self, refnr, force_refresh=False, background=False):
+        """Full posting for a refnr from the jobdetails endpoint, cached separately from searches."""
+        encoded = base64.b64encode(str(refnr).encode("utf-8")).decode("ascii")
+        return self.get_json(self.details_url.format(encoded), force_refresh=force_refresh,
+                             cache=self.details_cache or False, background=background)
+
+    def job_online(self, refnr, etag=None):
+        """
+        Whether the posting still exists: returns (online, etag).
+
+        Sends If-None-Match when an ETag from an earlier check is known, so an
+        unchanged posting costs a 304 without a body. A fresh body also goes
+        into the details cache. Checks run in bulk, so they only use the rate
+        budget that searches and opened postings leave (BACKGROUND_RESERVE).
+        """
+        encoded = base64.b64encode(str(refnr).encode("utf-8")).decode("ascii")
+        url = self.details_url.format(encoded)
+        res = self._send(url, {}, {"If-None-Match": etag} if etag else None, background=True)
+        if res.status_code == 304:
+            return True, etag
+        if res.status_code in (404, 410):
+            return False, None
+        res.raise_for_status()
+        if self.details_cache:
+            try:
+                self.details_cache.put(cache_key(url, {}), res.json())
+            except ValueError:
+                pass
+        return True, res.headers.get("ETag")
+
+    def stats(self):
+        return {"requests": self.requests_sent, "retries": self.retries, "merged": self.merged,
+                "cache_hits": self.cache.hits if self.cache else 0,
+                "cache_misses": self.cache.misses if self.cache else 0}
+
+    def close(self):
+        self.session.close()
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    """Return the client shared by all searches in this process."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = JobApiClient()
+        return _client
+
+def total_hits(payload):
+    """Total number of hits reported by the API (0 if missing)."""
+    try:
+        return int(payload.get("maxErgebnisse") or 0)
+    except (TypeError, ValueError):
+        return 0
+
+def fetch_all_pages(params, page_size=PAGE_SIZE, max_workers=MAX_WORKERS,
+                    max_in_flight=MAX_IN_FLIGHT, max_pages=MAX_PAGES,
+                    is_cancelled=None, on_total=None, on_truncated=None, force_refresh=False, client=None):
+    """
+    Generator over all result pages of a search.
+
+    The first page is fetched on its own to learn the hit count, the remaining
+    pages are requested concurrently. Yields lists of job offers in the order
+    pages complete, with duplicates (same refnr) already removed.
+    At most max_pages pages are fetched; when the search has more hits,
+    on_truncated(limit, total) is called with the number of hits fetched.
+    """
+    is_cancelled = is_cancelled or (lambda: False)
+    client = client or get_client()
+    seen = set()
+
+    def unique(jobs):
+        fresh = []
+        for job in jobs:
+            ref = job.get("refnr")
+            if ref:
+                if ref in seen:
+                    continue
+                seen.add(ref)
+            fresh.append(job)
+        return fresh
+
+    first = client.search_page(params, 1, page_size, force_refresh)
+    total = total_hits(first)
+    if on_total:
+        on_total(total)
+    jobs = first.get("stellenangebote", [])
+    yield unique(jobs)
+
+    last_page = min(math.ceil(total / page_size), max_pages) if page_size else 1
+    if on_truncated and page_size and total > last_page * page_size:
+        on_truncated(last_page * page_size, total)
+    if len(jobs) < page_size or last_page <= 1 or is_cancelled():
+        return
+
+    pool = ThreadPoolExecutor(max_workers=max_workers)
+    pending = set()
+    next_page = 2
+    try:
+        while next_page <= last_page or pending:
+            # Keep at most max_in_flight pages queued in the pool
+            while next_page <= last_page and len(pending) < max_in_flight:
+                pending.add(pool.submit(client.search_page, params, next_page, page_size, force_refresh))
+                next_page += 1
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if is_cancelled():
+                    return
+                yield unique(future.result().get("stellenangebote", []))
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
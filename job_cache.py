@@ -0,0 +1,130 @@
+# job_cache.py
+# Persistent on-disk cache for API responses, with TTL and LRU size limit
+
+import os
+import json
+import gzip
+import time
+import hashlib
+import threading
+
+CACHE_DIR = os.path.join("saved_jobs", "cache")
+DEFAULT_TTL = 24 * 60 * 60        # Seconds an entry stays valid
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+def cache_key(url, params):
+    """Stable key for a request: same URL and same non-empty params give the same key."""
+    normalized = {str(k): str(v) for k, v in params.items() if v not in (None, "")}
+    raw = json.dumps([url, normalized], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+class ResponseCache:
+    """
+    Stores gzip-compressed JSON payloads as one file per entry.
+
+    The file modification time records the last access and drives LRU
+    eviction; the write time and TTL are stored inside the entry itself.
+    """
+
+    def __init__(self, directory=CACHE_DIR, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries = None  # key -> [size, last_access], loaded on first use
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".json.gz")
+
+    def _load_index(self):
+        if self._entries is not None:
+            return
+        self._entries = {}
+        if not os.path.isdir(self.directory):
+            return
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".json.gz"):
+                st = entry.stat()
+                self._entries[entry.name[:-len(".json.gz")]] = [st.st_size, st.st_mtime]
+
+    def get(self, key):
+        """Return the cached payload or None if missing or expired."""
+        with self._lock:
+            self._load_index()
+            if key not in self._entries:
+                self.misses += 1
+                return None
+            path = self._path(key)
+            try:
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                self._remove(key)
+                self.misses += 1
+                return None
+            if time.time() - entry.get("stored", 0) > entry.get("ttl", self.ttl):
+                self._remove(key)
+                self.misses += 1
+                return None
+            # Touch the file so it counts as recently used
+            now = time.time()
+            try:
+                os.utime(path, (now, now))
+            except OSError:
+                pass
+            self._entries[key][1] = now
+            self.hits += 1
+            return entry.get("payload")
+
+    def put(self, key, payload, ttl=None):
+        """Store a payload and evict least recently used entries if over budget."""
+        entry = {"stored": time.time(), "ttl": self.ttl if ttl is None else ttl, "payload": payload}
+        data = gzip.compress(json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+        with self._lock:
+            self._load_index()
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(key)
+            tmp_path = path + ".tmp"
+            try:
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                print(f"Fehler beim Schreiben des Caches: {e}")
+                return
+            self._entries[key] = [len(data), time.time()]
+            self._evict()
+
+    def _remove(self, key):
+        self._entries.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _evict(self):
+        total = sum(size for size, _ in self._entries.values())
+        if total <= self.max_bytes:
+            return
+        for key, (size, _) in sorted(self._entries.items(), key=lambda kv: kv[1][1]):
+            self._remove(key)
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        with self._lock:
+            self._load_index()
+            for key in list(self._entries):
+                self._remove(key)
+
+    def size_bytes(self):
+        with self._lock:
+            self._load_index()
+            return sum(size for size, _ in self._entries.values())
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries or {}),
+                "bytes": self.size_bytes()}
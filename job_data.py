@@ -1,30 +1,214 @@
 # job_data.py
-# Handles loading and saving of saved job entries to a local JSON file
+# Handles loading and saving of saved job entries (SQLite database or JSON file)
 
 import os
 import json
+import sqlite3
+import threading
+
+from instrumentation import span
 
 SAVE_DIR = "saved_jobs"
 SAVE_FILE = os.path.join(SAVE_DIR, "saved_jobs.json")
+DB_FILE = os.path.join(SAVE_DIR, "saved_jobs.db")
+
+# "sqlite" (default) or "json"
+STORAGE_BACKEND = os.environ.get("JOBTRACKER_STORAGE", "sqlite").lower()
+
+class JsonStorage:
+    """Original storage: the whole list in one JSON file."""
+
+    rewrites_all = True
+
+    def __init__(self, path=SAVE_FILE):
+        self.path = path
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return []
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                content = f.read().strip()
+                if not content:
+                    return []
+                return json.loads(content)
+        except (json.JSONDecodeError, IOError):
+            return []
+
+    def save_all(self, jobs):
+        # Write to a temporary file and swap it in, so a crash never leaves half a file;
+        # returns False if the write failed
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(jobs, f, ensure_ascii=False, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except IOError as e:
+            print(f"Fehler beim Speichern der Datei: {e}")
+            return False
+        return True
+
+    # A JSON file can only be rewritten as a whole
+    def upsert(self, job, jobs):
+        self.save_all(jobs)
+
+    def delete(self, refnr, jobs):
+        self.save_all(jobs)
+
+    def apply(self, upserts, deletes, jobs):
+        return self.save_all(jobs)
+
+class SqliteStorage:
+    """
+    One row per saved job, keyed by refnr (entries without one carry a unique
+    stand-in, see job_records.entry_refnr). The full entry is kept as JSON in
+    the data column; title, company and status are copied into their own
+    columns for indexing. Single edits touch a single row.
+    """
+
+    rewrites_all = False
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            refnr TEXT PRIMARY KEY,
+            position INTEGER NOT NULL,
+            title TEXT,
+            company TEXT,
+            status TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+        CREATE INDEX IF NOT EXISTS idx_jobs_position ON jobs(position);
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    """
+
+    UPSERT = """
+        INSERT INTO jobs (refnr, position, title, company, status, data)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(refnr) DO UPDATE SET
+            title = excluded.title, company = excluded.company,
+            status = excluded.status, data = excluded.data
+    """
+
+    def __init__(self, path=DB_FILE, json_path=SAVE_FILE):
+        self.path = path
+        self.json_path = json_path
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(self.SCHEMA)
+            self._conn = conn
+            self._import_json()
+        return self._conn
+
+    def _import_json(self):
+        # One-time migration of an existing saved_jobs.json
+        from job_records import entry_refnr   # job_records -> job_geo imports this module
+        conn = self._conn
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'json_imported'").fetchone():
+            return
+        jobs = JsonStorage(self.json_path).load()
+        for job in jobs:
+            # The JSON file could hold several entries without a refnr; rows need distinct keys
+            if isinstance(job, dict) and job.get("refnr"):
+                job["refnr"] = entry_refnr(str(job["refnr"]))
+        with conn:
+            if jobs and not conn.execute("SELECT 1 FROM jobs LIMIT 1").fetchone():
+                conn.executemany(self.UPSERT, [self._row(job, i) for i, job in enumerate(jobs)
+                                               if isinstance(job, dict) and job.get("refnr")])
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_imported', '1')")
+
+    @staticmethod
+    def _row(job, position):
+        return (str(job.get("refnr")), position, job.get("title"), job.get("company"),
+                job.get("status"), json.dumps(job, ensure_ascii=False))
+
+    def load(self):
+        with self._lock:
+            rows = self._connect().execute("SELECT data FROM jobs ORDER BY position").fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def save_all(self, jobs):
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute("DELETE FROM jobs")
+                    conn.executemany(self.UPSERT, [self._row(job, i) for i, job in enumerate(jobs)
+                                                   if job.get("refnr")])
+        except sqlite3.Error as e:
+            print(f"Fehler beim Speichern der Datenbank: {e}")
+            return False
+        return True
+
+    def upsert(self, job, jobs=None):
+        if not job.get("refnr"):
+            return
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    # New entries go to the end, existing ones keep their position
+                    (position,) = conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM jobs").fetchone()
+                    conn.execute(self.UPSERT, self._row(job, position))
+        except sqlite3.Error as e:
+            print(f"Fehler beim Speichern der Datenbank: {e}")
+
+    def delete(self, refnr, jobs=None):
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    conn.execute("DELETE FROM jobs WHERE refnr = ?", (str(refnr),))
+        except sqlite3.Error as e:
+            print(f"Fehler beim Speichern der Datenbank: {e}")
+
+    def apply(self, upserts, deletes, jobs=None):
+        """Write a batch of changed and removed entries in one transaction; False if it failed."""
+        try:
+            with self._lock:
+                conn = self._connect()
+                with conn:
+                    if deletes:
+                        conn.executemany("DELETE FROM jobs WHERE refnr = ?", [(str(ref),) for ref in deletes])
+                    (position,) = conn.execute("SELECT COALESCE(MAX(position), -1) + 1 FROM jobs").fetchone()
+                    conn.executemany(self.UPSERT, [self._row(job, position + i) for i, job in enumerate(upserts)
+                                                   if job.get("refnr")])
+        except sqlite3.Error as e:
+            print(f"Fehler beim Speichern der Datenbank: {e}")
+            return False
+        return True
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+_storage = None
+
+def get_storage():
+    """Storage backend selected by JOBTRACKER_STORAGE."""
+    global _storage
+    if _storage is None:
+        _storage = JsonStorage() if STORAGE_BACKEND == "json" else SqliteStorage()
+    return _storage
 
 def load_jobs():
-    """Load saved jobs from JSON file."""
-    if not os.path.exists(SAVE_FILE):
-        return []
-    try:
-        with open(SAVE_FILE, "r", encoding="utf-8") as f:
-            content = f.read().strip()
-            if not content:
-                return []
-            return json.loads(content)
-    except (json.JSONDecodeError, IOError):
-        return []
+    """Load saved jobs from storage."""
+    with span("load_jobs"):
+        return get_storage().load()
 
 def save_jobs(jobs):
-    """Save job entries to JSON file."""
-    os.makedirs(SAVE_DIR, exist_ok=True)
-    try:
-        with open(SAVE_FILE, "w", encoding="utf-8") as f:
-            json.dump(jobs, f, ensure_ascii=False, indent=2)
-    except IOError as e:
-        print(f"Fehler beim Speichern der Datei: {e}")
+    """Save all job entries to storage."""
+    with span("save_jobs", jobs=len(jobs)):
+        get_storage().save_all(jobs)
@@ -0,0 +1,243 @@
+# job_dedupe.py
+# Near-duplicate postings via shingling, MinHash and LSH banding (no Qt imports)
+#
+# The same position is often posted several times under different refnrs,
+# with small changes to the title. Every posting gets a MinHash signature
+# made of one part per field (title, company, location), each over the
+# character shingles of that field. LSH bands take values of every part, so
+# candidates are found with a few dict lookups instead of a comparison with
+# every other posting; each field then has to be similar on its own, and the
+# numbers and seniority words of the title have to match exactly.
+
+import re
+import zlib
+import random
+from array import array
+from functools import lru_cache
+from operator import eq
+
+SHINGLE = 4             # Characters per shingle
+PART = 32               # Signature values per field
+ROWS = 4                # Values per field and LSH band, PART // ROWS bands
+FIELDS = 3              # title, company, location
+# Estimated Jaccard similarity each field needs for a near duplicate
+THRESHOLDS = (0.8, 0.8, 0.8)
+MAX_BUCKET = 50         # Keys per LSH bucket; more only repeat what the bucket already finds
+
+# Title words that make a different position even when the rest of the title
+# is the same ("Senior ..." vs "Junior ...", "Filiale 12" vs "Filiale 13");
+# together with the numbers in the title they must match exactly
+LEVEL_WORDS = {
+    "junior", "senior", "lead", "head", "leiter", "leiterin", "leitung", "leitend", "leitende", "leitender",
+    "teamleiter", "teamleiterin", "teamleitung", "trainee", "praktikant", "praktikantin", "praktikum",
+    "werkstudent", "werkstudentin", "azubi", "auszubildende", "auszubildender", "ausbildung", "aushilfe",
+}
+
+_EMPTY = 0xFFFFFFFF
+_rng = random.Random(20240501)      # Fixed, so signatures do not depend on the process
+_PERMS = [(_rng.randrange(1, 1 << 32) | 1, _rng.randrange(1 << 32)) for _ in range(PART)]
+_GENDER = re.compile(r"\(?\b[mwdfhx]\s*/\s*[mwdfhx](\s*/\s*[mwdfhx])?\b\)?")
+_LEGAL_FORM = re.compile(r"\b(gmbh|mbh|ag|kg|kgaa|se|ug|ohg|gbr|e ?v|co|haftungsbeschränkt)\b")
+_NON_WORD = re.compile(r"[\W_]+")
+
+def normalize(text):
+    """Lowercase, without gender tags like "(m/w/d)" and punctuation."""
+    text = _GENDER.sub(" ", str(text or "").lower())
+    return _NON_WORD.sub(" ", text).strip()
+
+def normalize_company(text):
+    """normalize() without legal forms, which many unrelated companies share."""
+    return _NON_WORD.sub(" ", _LEGAL_FORM.sub(" ", normalize(text))).strip()
+
+def shingles(text):
+    """
+    crc32 hashes of the character shingles of a normalized text, padded with
+    spaces so the first and last characters of a word get shingles of their own.
+    """
+    if not text:
+        return set()
+    text = f" {text} "
+    return {zlib.crc32(text[i:i + SHINGLE].encode("utf-8")) for i in range(len(text) - SHINGLE + 1)}
+
+def title_key(title):
+    """Hash of the numbers and LEVEL_WORDS in a normalized title."""
+    words = sorted({word for word in title.split() if word.isdigit() or word in LEVEL_WORDS})
+    return zlib.crc32(" ".join(words).encode("utf-8"))
+
+def _min_hashes(hashes):
+    """PART MinHash values of a shingle set, one hash function per value."""
+    mins = array("I", [_EMPTY]) * PART
+    if hashes:
+        for i, (a, b) in enumerate(_PERMS):
+            mins[i] = min([(a * h + b) & 0xFFFFFFFF for h in hashes])
+    return mins
+
+def signature(title, company, location):
+    """
+    MinHash signature as array("I"): the title, company and location parts in
+    a row, then the title_key(); None without any text.
+    """
+    texts = (normalize(title), normalize_company(company), normalize(location))
+    if not any(texts):
+        return None
+    sig = array("I")
+    sig.frombytes(_part(texts[0]) + _part(texts[1]) + _part(texts[2]))
+    sig.append(title_key(texts[0]))
+    return sig
+
+# Companies, places and many titles repeat across the results of a search
+@lru_cache(maxsize=8192)
+def _part(text):
+    return _min_hashes(shingles(text)).tobytes()
+
+def split(sig):
+    """The title, company and location parts and the title key of a signature as tuples, for comparing."""
+    return tuple(tuple(sig[start:start + PART]) for start in range(0, FIELDS * PART, PART)) + (sig[FIELDS * PART],)
+
+def field_similarities(parts1, parts2):
+    """Estimated Jaccard similarity of title, company and location."""
+    return [sum(map(eq, part1, part2)) / PART for part1, part2 in zip(parts1[:FIELDS], parts2[:FIELDS])]
+
+def is_near_duplicate(parts1, parts2):
+    if parts1[FIELDS] != parts2[FIELDS]:
+        return False
+    for part1, part2, threshold in zip(parts1, parts2, THRESHOLDS):
+        if sum(map(eq, part1, part2)) < threshold * PART:
+            return False
+    return True
+
+def similarity(parts1, parts2):
+    """Overall similarity of two postings, the mean over the fields."""
+    return sum(field_similarities(parts1, parts2)) / FIELDS
+
+def _bands(parts):
+    # Band i holds the same ROWS values of every field part, and the title key
+    title, company, location, key = parts
+    return [(start, title[start:start + ROWS] + company[start:start + ROWS] + location[start:start + ROWS] + (key,))
+            for start in range(0, PART, ROWS)]
+
+class NearDuplicateIndex:
+    """
+    LSH buckets of MinHash signatures, keyed by a caller-chosen key. An
+    optional item per key (e.g. the saved job dict) is kept in `items`.
+
+    add() takes a ready signature (search results compute theirs when they
+    are decoded); add_text() only stores the fields and build_pending()
+    computes the signatures in chunks, like SearchIndex does for saved jobs.
+    Signatures are kept split() for the comparisons.
+    """
+
+    def __init__(self):
+        self.parts = {}           # key -> split signature
+        self.pending = {}         # key -> (title, company, location), signature not yet computed
+        self.items = {}           # key -> item given to add() or add_text()
+        self._buckets = {}        # band -> set of keys
+
+    def __len__(self):
+        return len(self.parts) + len(self.pending)
+
+    def add(self, key, sig, item=None):
+        self.remove(key)
+        if item is not None:
+            self.items[key] = item
+        if sig is None:
+            return
+        parts = self.parts[key] = split(sig)
+        for bucket in _bands(parts):
+            keys = self._buckets.get(bucket)
+            if keys is None:
+                self._buckets[bucket] = {key}
+            elif len(keys) < MAX_BUCKET:
+                keys.add(key)
+
+    def add_text(self, key, title, company, location, item=None):
+        self.remove(key)
+        if item is not None:
+            self.items[key] = item
+        self.pending[key] = (title, company, location)
+
+    def build_pending(self, limit=200):
+        """Compute up to limit waiting signatures; returns how many are left."""
+        while self.pending and limit > 0:
+            key = next(iter(self.pending))
+            fields = self.pending.pop(key)
+            limit -= 1
+            self.add(key, signature(*fields), self.items.get(key))
+        return len(self.pending)
+
+    def remove(self, key):
+        self.pending.pop(key, None)
+        self.items.pop(key, None)
+        parts = self.parts.pop(key, None)
+        if parts is None:
+            return
+        for bucket in _bands(parts):
+            keys = self._buckets.get(bucket)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._buckets[bucket]
+
+    def clear(self):
+        self.parts.clear()
+        self.pending.clear()
+        self.items.clear()
+        self._buckets.clear()
+
+    def candidates(self, parts):
+        """Keys sharing at least one LSH band with parts (a split signature), not yet verified."""
+        found = set()
+        for bucket in _bands(parts):
+            keys = self._buckets.get(bucket)
+            if keys:
+                found |= keys
+        return found
+
+    def similar(self, sig, exclude=None):
+        """[(similarity, key)] of indexed postings near sig, most similar first."""
+        if sig is None:
+            return []
+        parts = split(sig)
+        candidates = self.candidates(parts)
+        candidates.discard(exclude)
+        found = []
+        for key in candidates:
+            other = self.parts[key]
+            if is_near_duplicate(parts, other):
+                found.append((similarity(parts, other), key))
+        found.sort(key=lambda item: item[0], reverse=True)
+        return found
+
+class NearDuplicateGrouper:
+    """
+    Groups postings as they arrive. Each posting is compared with the
+    representatives of the groups so far (the posting that started the group),
+    never with the other members, so groups do not chain from one posting to
+    the next. assign() sets record.near_of to the representative JobRecord a
+    posting joins, None for postings that start a group of their own.
+    Runs on the search worker thread; the model only counts the members.
+    Signatures are computed here and only the representatives' are kept.
+    """
+
+    def __init__(self):
+        self.index = NearDuplicateIndex()   # Representatives only
+        self._exact = {}                    # signature bytes -> representative
+
+    def assign(self, records):
+        for record in records:
+            record.near_of = None
+            sig = signature(record.title, record.company, record.location)
+            if sig is None:
+                continue
+            key = sig.tobytes()
+            representative = self._exact.get(key)
+            if representative is None:
+                found = self.index.similar(sig)
+                if found:
+                    representative = self.index.items[found[0][1]]
+            if representative is not None:
+                record.near_of = representative
+                self._exact[key] = representative
+            else:
+                self._exact[key] = record
+                self.index.add(id(record), sig, record)
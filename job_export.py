@@ -0,0 +1,73 @@
+# job_export.py
+# Streaming export of saved jobs to CSV or JSONL, optionally gzip-compressed (no Qt imports)
+
+import os
+import csv
+import gzip
+import json
+
+from job_records import FIELDS
+
+PROGRESS_EVERY = 500  # Rows between progress callbacks
+
+class ExportCancelled(Exception):
+    pass
+
+def export_row(job):
+    """Flat row for export; the files list is joined with "; "."""
+    row = {field: job.get(field, "") for field in FIELDS}
+    row["files"] = "; ".join(job.get("files", []))
+    return row
+
+def export_format(path):
+    """("csv" or "jsonl", compressed) derived from the file name."""
+    name = path.lower()
+    compressed = name.endswith(".gz")
+    if compressed:
+        name = name[:-3]
+    return ("jsonl" if name.endswith((".jsonl", ".ndjson")) else "csv"), compressed
+
+def export_jobs(jobs, path, fmt=None, compress=None, progress=None, is_cancelled=None):
+    """
+    Stream jobs (any iterable) to path and return the number of rows written.
+
+    Rows are built one at a time while writing. The output goes to a
+    temporary file that replaces path at the end, so a cancelled or failed
+    export leaves no half-written file. progress(count) is called every
+    PROGRESS_EVERY rows; is_cancelled() is checked just as often and stops
+    the export with ExportCancelled.
+    """
+    guessed_fmt, guessed_compress = export_format(path)
+    fmt = fmt or guessed_fmt
+    compress = guessed_compress if compress is None else compress
+    tmp_path = path + ".tmp"
+    opener = gzip.open if compress else open
+    count = 0
+    try:
+        with opener(tmp_path, "wt", newline="", encoding="utf-8") as f:
+            if fmt == "jsonl":
+                write = lambda job: f.write(json.dumps(job, ensure_ascii=False) + "\n")
+            else:
+                writer = csv.DictWriter(f, fieldnames=FIELDS)
+                writer.writeheader()
+                write = lambda job: writer.writerow(export_row(job))
+            for job in jobs:
+                write(job)
+                count += 1
+                if count % PROGRESS_EVERY == 0:
+                    if is_cancelled and is_cancelled():
+                        raise ExportCancelled()
+                    if progress:
+                        progress(count)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if progress:
+        progress(count)
+    return count
+
+def write_csv(jobs, path):
+    """Write jobs to a CSV file and return the number of rows written."""
+    return export_jobs(jobs, path, "csv", False)
@@ -0,0 +1,100 @@
+# job_geo.py
+# Distances between job locations and the home location (no Qt imports, NumPy optional)
+
+import os
+import json
+import math
+from array import array
+
+from job_data import SAVE_DIR
+
+HOME_FILE = os.path.join(SAVE_DIR, "home.json")
+EARTH_RADIUS_KM = 6371.0
+NAN = float("nan")
+_numpy = None           # numpy module once imported, False if it is not installed
+
+def coordinates(arbeitsort):
+    """(lat, lon) from the arbeitsort object of an API result, NaN when missing."""
+    coords = (arbeitsort or {}).get("koordinaten") or {}
+    try:
+        return float(coords["lat"]), float(coords["lon"])
+    except (KeyError, TypeError, ValueError):
+        return NAN, NAN
+
+def _np():
+    # NumPy is imported on the first distance calculation, so starting the app does not pay for it
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:  # Optional; the array module fallback gives the same results
+            numpy = False
+        _numpy = numpy
+    return _numpy
+
+def distances_km(home, lats, lons):
+    """
+    Great-circle distances from home (lat, lon) to every point as array("d"),
+    computed in one vectorized haversine pass; NaN where a point is unknown.
+    """
+    if home is None:
+        return array("d", [NAN] * len(lats))
+    lat0, lon0 = math.radians(home[0]), math.radians(home[1])
+    np = _np()
+    if np:
+        lat = np.radians(np.asarray(lats, dtype=np.float64))
+        lon = np.radians(np.asarray(lons, dtype=np.float64))
+        a = np.sin((lat - lat0) / 2) ** 2 + math.cos(lat0) * np.cos(lat) * np.sin((lon - lon0) / 2) ** 2
+        result = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+        return array("d", result.tobytes())
+    cos0 = math.cos(lat0)
+    sin, cos, radians = math.sin, math.cos, math.radians
+    result = array("d", bytes(8 * len(lats)))
+    for i, (lat, lon) in enumerate(zip(lats, lons)):
+        if lat != lat or lon != lon:
+            result[i] = NAN
+            continue
+        lat, lon = radians(lat), radians(lon)
+        a = sin((lat - lat0) / 2) ** 2 + cos0 * cos(lat) * sin((lon - lon0) / 2) ** 2
+        result[i] = 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(a, 1.0)))
+    return result
+
+def parse_home(text, records=()):
+    """
+    (lat, lon, label) from "52.52, 13.40" or from a place name that appears
+    in the locations of records (JobRecords); None if neither works.
+    """
+    text = text.strip()
+    parts = text.replace(";", ",").split(",")
+    if len(parts) == 2:
+        try:
+            lat, lon = float(parts[0]), float(parts[1])
+        except ValueError:
+            pass
+        else:
+            if -90 <= lat <= 90 and -180 <= lon <= 180:
+                return lat, lon, f"{lat:.4f}, {lon:.4f}"
+    name = text.lower()
+    if name:
+        for record in records:
+            if record is not None and record.lat == record.lat and name in record.location.lower():
+                return record.lat, record.lon, record.location
+    return None
+
+def load_home(path=HOME_FILE):
+    """Saved home location as (lat, lon, label) or None."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return float(data["lat"]), float(data["lon"]), str(data.get("label", ""))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def save_home(home, path=HOME_FILE):
+    if home is None:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"lat": home[0], "lon": home[1], "label": home[2]}, f, ensure_ascii=False)
@@ -0,0 +1,79 @@
+# job_import.py
+# Bulk import of saved jobs from CSV or JSONL files as written by the export (no Qt imports)
+
+import csv
+import gzip
+import json
+
+from job_export import export_format
+from job_records import FIELDS, STATUSES, entry_refnr, has_refnr, is_valid_job, job_link
+
+def _entry(record):
+    # Saved job entry from an imported record; unknown fields are dropped
+    entry = {field: record.get(field) or "" for field in FIELDS}
+    files = record.get("files") or []
+    if isinstance(files, str):
+        files = [f for f in files.split("; ") if f]
+    entry["files"] = list(files)
+    entry["refnr"] = entry_refnr(str(entry["refnr"]))
+    if entry["status"] not in STATUSES:
+        entry["status"] = "New"
+    if not entry["link"] and has_refnr(entry["refnr"]):
+        entry["link"] = job_link(entry["refnr"])
+    return entry
+
+def read_records(path):
+    """Yield entries from a .csv or .jsonl file (optionally .gz), one at a time."""
+    fmt, compressed = export_format(path)
+    opener = gzip.open if compressed else open
+    with opener(path, "rt", newline="", encoding="utf-8-sig") as f:
+        if fmt == "jsonl":
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    yield None
+                    continue
+                yield _entry(record) if isinstance(record, dict) else None
+        else:
+            for record in csv.DictReader(f):
+                yield _entry(record)
+
+class ImportResult:
+    def __init__(self):
+        self.jobs = []          # New entries in file order
+        self.read = 0
+        self.invalid = 0
+        self.duplicates = 0
+
+    def summary(self):
+        return (f"{len(self.jobs)} neu, {self.duplicates} Duplikate, "
+                f"{self.invalid} ungültig ({self.read} gelesen)")
+
+def collect_new(records, repository):
+    """
+    Valid entries from records that are neither saved in repository nor
+    repeated earlier in records. Checks are by refnr and (title, company),
+    each a set or dict lookup, so the cost per record does not grow with
+    the number of saved jobs. The repository is not changed.
+    """
+    result = ImportResult()
+    refs = set()
+    keys = set()
+    for entry in records:
+        result.read += 1
+        if not is_valid_job(entry):
+            result.invalid += 1
+            continue
+        ref = entry["refnr"]
+        key = (entry["title"], entry["company"])
+        if repository.is_duplicate(entry) or (has_refnr(ref) and ref in refs) or key in keys:
+            result.duplicates += 1
+            continue
+        refs.add(ref)
+        keys.add(key)
+        result.jobs.append(entry)
+    return result
@@ -0,0 +1,189 @@
+# job_index.py
+# Trigram search index for filtering the job tables
+
+FIELDS = ("title", "company", "location", "status", "notes", "refnr")
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def parse_query(text):
+    """
+    Split a filter string into (field, value) terms. "status:Applied" limits a
+    term to one field, plain words match any field. All terms must match.
+    """
+    terms = []
+    for part in text.lower().split():
+        field, sep, value = part.partition(":")
+        if sep and field in FIELDS:
+            if value:
+                terms.append((field, value))
+        else:
+            terms.append((None, part))
+    return terms
+
+def narrows(old_terms, new_terms):
+    """True if every match of new_terms is guaranteed to be a match of old_terms."""
+    for old_field, old_value in old_terms:
+        if not any(field == old_field and old_value in value for field, value in new_terms):
+            return False
+    return True
+
+class SearchIndex:
+    """
+    Maps trigrams of each field to the documents containing them.
+
+    Documents are identified by a key chosen by the caller (the tables use
+    id() of the job dict, which survives row moves). `texts` holds the
+    lowercased field values used to confirm a candidate match.
+
+    Adding a document only stores its text; the trigram postings are built
+    later in chunks by build_pending(). Until then the document is checked
+    by a plain substring scan, so results are the same either way.
+    """
+
+    def __init__(self, fields=FIELDS):
+        self.fields = fields
+        self.texts = {}                               # key -> {field: text}
+        self.joined = {}                              # key -> all fields in one string
+        self.postings = {f: {} for f in fields}       # field -> trigram -> set(keys)
+        self.modified = {}                            # key -> version of last change
+        self.pending = {}                             # keys without postings yet (ordered)
+        self.version = 0
+        self._last_terms = None
+        self._last_result = None
+        self._last_version = 0
+
+    def __len__(self):
+        return len(self.texts)
+
+    def add(self, key, values):
+        """Index a document; values maps field names to display text."""
+        if key in self.texts:
+            self.remove(key)
+        self.version += 1
+        texts = {f: str(values.get(f) or "").lower() for f in self.fields}
+        self.texts[key] = texts
+        self.joined[key] = "\n".join(texts.values())
+        self.modified[key] = self.version
+        self.pending[key] = None
+
+    def build_pending(self, limit=500):
+        """Build postings for up to limit waiting documents; returns how many are left."""
+        while self.pending and limit > 0:
+            key = next(iter(self.pending))
+            del self.pending[key]
+            limit -= 1
+            for field, text in self.texts[key].items():
+                postings = self.postings[field]
+                for gram in trigrams(text):
+                    keys = postings.get(gram)
+                    if keys is None:
+                        postings[gram] = {key}
+                    else:
+                        keys.add(key)
+        return len(self.pending)
+
+    def remove(self, key):
+        texts = self.texts.pop(key, None)
+        if texts is None:
+            return
+        self.version += 1
+        self.joined.pop(key, None)
+        self.modified.pop(key, None)
+        if key in self.pending:
+            del self.pending[key]
+            return
+        for field, text in texts.items():
+            postings = self.postings[field]
+            for gram in trigrams(text):
+                keys = postings.get(gram)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del postings[gram]
+
+    def clear(self):
+        self.texts.clear()
+        self.joined.clear()
+        self.pending.clear()
+        self.modified.clear()
+        for postings in self.postings.values():
+            postings.clear()
+        self.version += 1
+        self._last_terms = self._last_result = None
+
+    def _candidates(self, field, value):
+        # Documents containing all trigrams of value; None means "no restriction"
+        grams = trigrams(value)
+        if not grams:
+            return None
+        fields = self.fields if field is None else (field,)
+        result = set()
+        for f in fields:
+            postings = self.postings[f]
+            sets = [postings.get(g) for g in grams]
+            if any(s is None for s in sets):
+                continue
+            sets.sort(key=len)
+            found = set(sets[0])
+            for s in sets[1:]:
+                found &= s
+                if not found:
+                    break
+            result |= found
+        return result
+
+    def matches(self, key, terms):
+        """Check one document against parsed terms."""
+        texts = self.texts.get(key)
+        if texts is None:
+            return False
+        for field, value in terms:
+            if field is None:
+                if value not in self.joined[key]:
+                    return False
+            elif value not in texts.get(field, ""):
+                return False
+        return True
+
+    def query(self, text):
+        """Return the set of keys matching the filter text, or None for "everything"."""
+        terms = parse_query(text)
+        if not terms:
+            self._last_terms = self._last_result = None
+            return None
+
+        # A longer query can only remove rows: start from the previous result,
+        # and let the trigram postings cut it down further
+        candidates = None
+        if (self._last_terms is not None and self._last_version == self.version
+                and narrows(self._last_terms, terms)):
+            candidates = self._last_result
+        for field, value in sorted(terms, key=lambda t: -len(t[1])):
+            if candidates is not None and not candidates:
+                break
+            found = self._candidates(field, value)
+            if found is None:
+                continue
+            if self.pending:
+                # Documents without postings yet have to be scanned
+                found |= self.pending.keys()
+            candidates = found if candidates is None else candidates & found
+        if candidates is None:
+            candidates = self.texts.keys()
+
+        if all(field is None for field, _ in terms):
+            # Plain words, the usual case: one substring test per word on the joined fields
+            joined = self.joined
+            values = [value for _, value in terms]
+            if len(values) == 1:
+                value = values[0]
+                result = {key for key in candidates if value in joined[key]}
+            else:
+                result = {key for key in candidates if all(value in joined[key] for value in values)}
+        else:
+            result = {key for key in candidates if self.matches(key, terms)}
+        self._last_terms = terms
+        self._last_result = result
+        self._last_version = self.version
+        return result
@@ -0,0 +1,210 @@
+# job_journal.py
+# Append-only journal of changes to saved jobs, compacted into the main store (no Qt imports)
+#
+# Status and note edits are appended to journal.jsonl as one line each instead
+# of rewriting the store. compact() moves the journal aside and hands the
+# changed jobs to the SaveScheduler in one batch; the old segment is removed
+# once the scheduler reports that write as stored, and handed over again if
+# the write failed. At startup both files are replayed, so edits of a session
+# that ended without compaction, or with a failed write, are not lost.
+
+import os
+import json
+import time
+import threading
+
+from job_data import SAVE_DIR
+from instrumentation import span
+
+JOURNAL_FILE = os.path.join(SAVE_DIR, "journal.jsonl")
+COMPACT_EVENTS = 500          # Compact once this many events are waiting
+COMPACT_AGE = 5 * 60          # ... or once the oldest waiting event is this old (seconds)
+
+def status_history(job):
+    """[[epoch seconds, status], ...] of a saved job, oldest first."""
+    history = job.get("history")
+    return history if isinstance(history, list) else []
+
+def apply_event(job, event):
+    """Apply one journal event to a job dict; False if it was already applied."""
+    kind = event.get("event")
+    if kind == "status":
+        history = job.setdefault("history", [])
+        if any(entry[0] == event["ts"] for entry in history):
+            return False
+        history.append([event["ts"], event["new"]])
+        history.sort(key=lambda entry: entry[0])
+        job["status"] = history[-1][1]
+        return True
+    if kind == "notes":
+        if job.get("notes") == event.get("notes"):
+            return False
+        job["notes"] = event.get("notes", "")
+        return True
+    return False
+
+class JobJournal:
+    """
+    Append-only log of saved job changes.
+
+    Every event is one JSON line {"ts", "event", "refnr", ...} written with a
+    single append, so an edit costs the same with 10 or 100000 saved jobs.
+    Listeners are called with each new event (e.g. the pipeline statistics).
+    """
+
+    def __init__(self, path=JOURNAL_FILE):
+        self.path = path
+        self.segment_path = path + ".1"   # Journal being compacted
+        self.listeners = []
+        self.waiting = 0            # Events since the last compaction
+        self.oldest_waiting = None
+        self._dirty = {}            # refnr -> job changed since the last compaction
+        self._segment_jobs = []     # Jobs of the segment, written by ...
+        self._segment_write = None  # ... this SaveScheduler generation; None for a segment left by the last run
+        self._file = None
+        self._lock = threading.Lock()
+        self._replayed = False      # No compaction before the journal was applied to the loaded jobs
+
+    # --- Writing ---
+
+    def _append(self, events, dirty=()):
+        # One write and flush for the whole batch
+        text = "".join(json.dumps(event, ensure_ascii=False) + "\n" for event in events)
+        with self._lock:
+            if self._file is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._file = open(self.path, "a", encoding="utf-8")
+            self._file.write(text)
+            self._file.flush()
+        for job in dirty:
+            self._dirty[job.get("refnr")] = job
+        if events:
+            self.waiting += len(events)
+            if self.oldest_waiting is None:
+                self.oldest_waiting = events[0]["ts"]
+        for event in events:
+            for listener in self.listeners:
+                listener(event)
+        return events
+
+    def _event(self, kind, refnr, **fields):
+        return dict({"ts": round(time.time(), 3), "event": kind, "refnr": refnr}, **fields)
+
+    def added(self, jobs):
+        """Jobs were saved; starts their status history. The caller stores them."""
+        events = []
+        for job in jobs:
+            event = self._event("added", job.get("refnr"), status=job.get("status", "New"))
+            job["history"] = [[event["ts"], event["status"]]]
+            events.append(event)
+        return self._append(events)
+
+    def status_changed(self, job, old):
+        """job["status"] was changed from old; the store is updated at compaction."""
+        new = job.get("status", "New")
+        if new == old:
+            return None
+        event = self._event("status", job.get("refnr"), old=old, new=new)
+        job.setdefault("history", []).append([event["ts"], new])
+        return self._append([event], [job])
+
+    def notes_changed(self, job):
+        return self._append([self._event("notes", job.get("refnr"), notes=job.get("notes", ""))], [job])
+
+    def deleted(self, job):
+        """A job was removed; the caller deletes it from the store."""
+        self._dirty.pop(job.get("refnr"), None)
+        return self._append([self._event("deleted", job.get("refnr"), status=job.get("status", "New"))])
+
+    # --- Replay and compaction ---
+
+    def read(self):
+        """Events of the segment being compacted and the current journal, oldest first."""
+        events = []
+        for path in (self.segment_path, self.path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            events.append(json.loads(line))
+                        except ValueError:
+                            continue    # Torn last line after a crash
+            except OSError:
+                continue
+        return events
+
+    def replay(self, jobs):
+        """Apply journaled edits to freshly loaded jobs; returns the jobs that changed."""
+        with span("journal.replay"):
+            by_ref = {job.get("refnr"): job for job in jobs}
+            changed = {}
+            for event in self.read():
+                job = by_ref.get(event.get("refnr"))
+                if job is not None and apply_event(job, event):
+                    changed[event["refnr"]] = job
+                    self._dirty[event["refnr"]] = job
+        self._replayed = True
+        return list(changed.values())
+
+    def due(self, now=None):
+        """Whether compact() should run now."""
+        if os.path.exists(self.segment_path):
+            return True     # The last compaction still has a segment to remove
+        if not self.waiting:
+            return False
+        if self.waiting >= COMPACT_EVENTS:
+            return True
+        return self.oldest_waiting is not None and (now or time.time()) - self.oldest_waiting >= COMPACT_AGE
+
+    def compact(self, persistence, jobs):
+        """
+        Fold the journal into the store; returns False while the previous
+        segment is still waiting for its write.
+        """
+        if not self._replayed:
+            return False
+        segment = os.path.exists(self.segment_path)
+        if segment and self._segment_write is not None:
+            if not persistence.stored(self._segment_write):
+                if persistence.idle():
+                    # The write failed and nothing is pending any more: hand the jobs over again
+                    self._segment_write = persistence.upsert_many(self._segment_jobs, jobs)
+                return False
+            os.remove(self.segment_path)
+            segment = False
+        self._segment_jobs = []
+        self._segment_write = None
+        if not self._dirty and not self.waiting and not segment:
+            return True
+        with span("journal.compact", jobs=len(self._dirty)):
+            with self._lock:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                if os.path.exists(self.path):
+                    if segment:
+                        # A segment of the last run was replayed into _dirty; it is written along
+                        with open(self.path, encoding="utf-8") as src, \
+                                open(self.segment_path, "a", encoding="utf-8") as dst:
+                            dst.write("\n" + src.read())     # The segment may end in a torn line
+                        os.remove(self.path)
+                    else:
+                        os.replace(self.path, self.segment_path)
+            self._segment_jobs = list(self._dirty.values())
+            self._segment_write = persistence.upsert_many(self._segment_jobs, jobs)
+            self._dirty.clear()
+            self.waiting = 0
+            self.oldest_waiting = None
+        return True
+
+    def close(self, persistence, jobs):
+        """Compact, wait for the store and drop the journal."""
+        if not self.compact(persistence, jobs):
+            persistence.flush()
+            self.compact(persistence, jobs)
+        persistence.flush()
+        self.compact(persistence, jobs)     # Removes the written segment
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,55 @@
+# job_liveness.py
+# Checks whether saved postings are still online (no Qt imports)
+
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+import job_api
+from job_records import has_refnr
+
+CHECK_MAX_AGE = 24 * 60 * 60   # Seconds before a checked entry is checked again
+CHECK_WORKERS = 4
+TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+def checked_at(job):
+    """Epoch seconds of the last check or 0."""
+    try:
+        return time.mktime(time.strptime(job.get("last_checked", ""), TIME_FORMAT))
+    except (TypeError, ValueError, OverflowError):
+        return 0.0
+
+def due_jobs(jobs, max_age=CHECK_MAX_AGE, now=None):
+    """Jobs with a real refnr that were not checked within max_age seconds."""
+    limit = (now or time.time()) - max_age
+    return [job for job in jobs
+            if has_refnr(job.get("refnr")) and checked_at(job) < limit]
+
+def check_jobs(refnrs, client=None, max_workers=CHECK_WORKERS, etags=None, is_cancelled=None):
+    """
+    Check refnrs concurrently and yield (refnr, online, etag, checked) as
+    results come in. online is None when the check itself failed. At most
+    max_workers requests are queued at a time, so cancelling stops quickly.
+    """
+    client = client or job_api.get_client()
+    etags = etags or {}
+    is_cancelled = is_cancelled or (lambda: False)
+    pending = {}
+    refnrs = iter(refnrs)
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="liveness") as pool:
+        while True:
+            while len(pending) < max_workers * 2 and not is_cancelled():
+                ref = next(refnrs, None)
+                if ref is None:
+                    break
+                pending[pool.submit(client.job_online, ref, etags.get(ref))] = ref
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                ref = pending.pop(future)
+                stamp = time.strftime(TIME_FORMAT)
+                try:
+                    online, etag = future.result()
+                except Exception:
+                    online, etag = None, etags.get(ref)
+                yield ref, online, etag, stamp
@@ -0,0 +1,188 @@
+# job_records.py
+# Job record helpers shared by the GUI and the command line (no Qt imports)
+
+import uuid
+
+from job_geo import NAN, coordinates
+
+STATUSES = ["New", "Interested", "Applied", "Interview", "Rejected", "Accepted"]
+
+# Columns of a saved job entry, in export order
+FIELDS = ["title", "company", "location", "status", "notes", "refnr", "link", "files"]
+
+LINK_TEMPLATE = "https://www.arbeitsagentur.de/jobsuche/jobdetail/{}"
+
+NO_REFNR = "N/A"    # Shown for postings without a reference number
+
+def is_valid_job(job):
+    return bool(
+        job and
+        job.get("title") and
+        job.get("company") and
+        job.get("refnr") and
+        isinstance(job.get("title"), str) and
+        isinstance(job.get("company"), str)
+    )
+
+def format_location(arbeitsort):
+    """"region, ort" from the arbeitsort object of an API result."""
+    loc = arbeitsort or {}
+    return f"{loc.get('region', '')}, {loc.get('ort', '')}".strip(", ")
+
+def job_link(refnr):
+    return LINK_TEMPLATE.format(refnr)
+
+def has_refnr(refnr):
+    """True for a reference number of the API, False for NO_REFNR and its entry_refnr() stand-ins."""
+    refnr = str(refnr or "")
+    return bool(refnr) and refnr != NO_REFNR and not refnr.startswith(NO_REFNR + "-")
+
+def entry_refnr(refnr):
+    """
+    refnr for a new saved entry. Storage, journal and save queue key entries
+    by refnr, so NO_REFNR becomes a unique stand-in like "N/A-1a2b3c4d".
+    """
+    return f"{NO_REFNR}-{uuid.uuid4().hex[:8]}" if refnr == NO_REFNR else refnr
+
+# Labels and keys of the jobdetails payload shown above the description
+DETAIL_FIELDS = [
+    ("Eintritt", "eintrittsdatum"),
+    ("Arbeitszeit", "arbeitszeitmodelle"),
+    ("Befristung", "befristung"),
+    ("Vergütung", "verguetung"),
+    ("Veröffentlicht", "aktuelleVeroeffentlichungsdatum"),
+]
+
+def format_details(details):
+    """Plain text for the detail panel from a jobdetails payload."""
+    lines = []
+    for label, key in DETAIL_FIELDS:
+        value = details.get(key)
+        if isinstance(value, list):
+            value = ", ".join(str(v) for v in value)
+        if value:
+            lines.append(f"{label}: {value}")
+    description = details.get("stellenbeschreibung") or details.get("stellenangebotsBeschreibung") or ""
+    if description:
+        lines += ["", description]
+    return "\n".join(lines).strip() or "Keine Details vorhanden."
+
+class JobRecord:
+    """
+    One search result, decoded once from the API payload.
+
+    Keeps only what the results table, the detail panel and saving use;
+    location and link are formatted up front. queries lists the labels of
+    the fan-out queries that returned the posting. lat/lon are NaN when the
+    posting has no coordinates. near_of is the record that started the
+    record's near-duplicate group, set by job_dedupe.NearDuplicateGrouper
+    (None for the first of a group); the MinHash signatures stay in the
+    grouper and its index.
+    """
+
+    __slots__ = ("title", "company", "location", "refnr", "link", "queries", "lat", "lon", "near_of")
+
+    def __init__(self, title, company, location, refnr, link, queries=None, lat=NAN, lon=NAN, near_of=None):
+        self.title = title
+        self.company = company
+        self.location = location
+        self.refnr = refnr
+        self.link = link
+        self.queries = queries if queries is not None else []
+        self.lat = lat
+        self.lon = lon
+        self.near_of = near_of
+
+    @classmethod
+    def from_api(cls, job, query=None):
+        refnr = str(job.get("refnr") or NO_REFNR)
+        lat, lon = coordinates(job.get("arbeitsort"))
+        return cls(
+            str(job.get("titel") or ""),
+            str(job.get("arbeitgeber") or ""),
+            format_location(job.get("arbeitsort")),
+            refnr,
+            job_link(job.get("refnr", "")),
+            [query] if query is not None else None,
+            lat,
+            lon,
+        )
+
+    def to_dict(self):
+        """Plain fields for JSON files, e.g. the new postings of a saved search; see from_dict()."""
+        return {
+            "title": self.title,
+            "company": self.company,
+            "location": self.location,
+            "refnr": self.refnr,
+            "link": self.link,
+            "queries": list(self.queries),
+            "lat": None if self.lat != self.lat else self.lat,
+            "lon": None if self.lon != self.lon else self.lon,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        lat, lon = data.get("lat"), data.get("lon")
+        return cls(
+            data.get("title", ""),
+            data.get("company", ""),
+            data.get("location", ""),
+            data.get("refnr") or NO_REFNR,
+            data.get("link", ""),
+            list(data.get("queries") or ()),
+            NAN if lat is None else lat,
+            NAN if lon is None else lon,
+        )
+
+    def index_values(self):
+        return {"title": self.title, "company": self.company, "location": self.location, "refnr": self.refnr}
+
+    def to_entry(self, status="New", notes=""):
+        """Saved job entry for this result."""
+        return {
+            "title": self.title,
+            "company": self.company,
+            "location": self.location,
+            "status": status,
+            "notes": notes,
+            "refnr": entry_refnr(self.refnr),
+            "link": self.link,
+            "files": []
+        }
+
+def split_terms(text):
+    """Comma- or semicolon-separated entries of a search field, without blanks or repeats."""
+    terms = []
+    seen = set()
+    for part in text.replace(";", ",").split(","):
+        part = part.strip()
+        if part and part.lower() not in seen:
+            seen.add(part.lower())
+            terms.append(part)
+    return terms
+
+def build_search_queries(was="", wo="", berufsfeld="", angebotsart="", umkreis=""):
+    """
+    (label, params) for every combination of the titles and locations
+    entered, e.g. "Koch, Bäcker" in "Berlin, Hamburg" gives four queries.
+    """
+    titles = split_terms(was) or [""]
+    places = split_terms(wo) or [""]
+    queries = []
+    for place in places:
+        for title in titles:
+            label = " in ".join(v for v in (title, place) if v)
+            queries.append((label, build_search_params(title, place, berufsfeld, angebotsart, umkreis)))
+    return queries
+
+def build_search_params(was="", wo="", berufsfeld="", angebotsart="", umkreis=""):
+    """API parameters for a search; empty values are left out. umkreis is the radius around wo in km."""
+    params = {
+        "wo": wo.strip(),
+        "was": was.strip(),
+        "berufsfeld": berufsfeld.strip(),
+        "angebotsart": angebotsart,
+        "umkreis": str(umkreis) if umkreis else "",
+    }
+    return {k: v for k, v in params.items() if v}
@@ -0,0 +1,192 @@
+# job_repository.py
+# Saved jobs list with hash indexes for refnr and (title, company) lookups
+
+from job_data import get_storage
+from job_records import has_refnr, is_valid_job
+
+def _key(job):
+    return (job.get("title"), job.get("company"))
+
+class SavedJobRepository:
+    """
+    Keeps the saved jobs in display order plus three indexes:
+    refnr -> job, (title, company) -> job and refnr -> row.
+
+    All mutations go through this class so the indexes never drift from the
+    list. Lookups and duplicate checks are constant time. Removing a row
+    shifts the rows behind it; their row numbers are refreshed lazily on the
+    next row lookup.
+    """
+
+    def __init__(self, jobs=None):
+        self.jobs = []
+        self.reset(jobs or [])
+
+    def reset(self, jobs):
+        # The list object stays the same so views holding it see the new content
+        self.jobs[:] = jobs
+        self._by_ref = {}
+        self._by_key = {}
+        self._rows = {}
+        for row, job in enumerate(self.jobs):
+            self._index(job, row)
+        self._stale_from = len(self.jobs)
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def __iter__(self):
+        return iter(self.jobs)
+
+    def __getitem__(self, row):
+        return self.jobs[row]
+
+    def _index(self, job, row):
+        ref = str(job.get("refnr", ""))
+        if ref:
+            self._by_ref.setdefault(ref, job)
+            self._rows.setdefault(ref, row)
+        self._by_key.setdefault(_key(job), job)
+
+    def _unindex(self, job):
+        ref = str(job.get("refnr", ""))
+        if self._by_ref.get(ref) is job:
+            del self._by_ref[ref]
+            self._rows.pop(ref, None)
+        if self._by_key.get(_key(job)) is job:
+            del self._by_key[_key(job)]
+
+    def find(self, refnr):
+        """Job with this refnr or None."""
+        return self._by_ref.get(str(refnr))
+
+    def find_by_title_company(self, title, company):
+        return self._by_key.get((title, company))
+
+    def row_of(self, refnr):
+        """Row index of the job with this refnr or None."""
+        ref = str(refnr)
+        if ref not in self._by_ref:
+            return None
+        if self._stale_from < len(self.jobs):
+            # Renumber only the rows behind the earliest removal
+            for row in range(self._stale_from, len(self.jobs)):
+                job_ref = str(self.jobs[row].get("refnr", ""))
+                if self._by_ref.get(job_ref) is self.jobs[row]:
+                    self._rows[job_ref] = row
+            self._stale_from = len(self.jobs)
+        return self._rows.get(ref)
+
+    def is_duplicate(self, job):
+        """Same refnr (unless there is none) or same title and company as a saved job."""
+        ref = str(job.get("refnr", ""))
+        if has_refnr(ref) and ref in self._by_ref:
+            return True
+        return _key(job) in self._by_key
+
+    def add(self, job):
+        """Append a job and return its row."""
+        row = len(self.jobs)
+        self.jobs.append(job)
+        self._index(job, row)
+        if self._stale_from == row:
+            self._stale_from = row + 1
+        return row
+
+    def extend(self, jobs):
+        for job in jobs:
+            self.add(job)
+
+    def remove_row(self, row):
+        """Remove the job at row and return it."""
+        job = self.jobs[row]
+        self._unindex(job)
+        del self.jobs[row]
+        self._stale_from = min(self._stale_from, row)
+        return job
+
+    def remove(self, refnr):
+        """Remove the job with this refnr; returns (row, job) or (None, None)."""
+        row = self.row_of(refnr)
+        if row is None:
+            return None, None
+        return row, self.remove_row(row)
+
+    def update(self, job, **fields):
+        """Change fields of a job and keep the (title, company) index current."""
+        row = self.row_of(job.get("refnr", ""))
+        self._unindex(job)
+        job.update(fields)
+        self._index(job, row if row is not None else self.jobs.index(job))
+
+class SavedJobStore:
+    """
+    Saved jobs loaded from storage, for use without the GUI.
+
+    Changes are collected and written in one batch by commit(). With a
+    JobJournal, edits go through it like in the GUI: the journal of an
+    earlier session is replayed on load, added jobs and status changes get
+    their status history, and commit() folds the journal into the store.
+    """
+
+    def __init__(self, storage=None, journal=None):
+        self.storage = storage or get_storage()
+        self.repository = SavedJobRepository([job for job in self.storage.load() if is_valid_job(job)])
+        self.journal = journal
+        self._changed = {}
+        self._deleted = set()
+        if journal is not None:
+            for job in journal.replay(self.repository.jobs):
+                self._changed[job["refnr"]] = job
+
+    @property
+    def jobs(self):
+        return self.repository.jobs
+
+    def add(self, entry):
+        """Add a new entry; returns False for invalid entries and duplicates."""
+        if not is_valid_job(entry) or self.repository.is_duplicate(entry):
+            return False
+        if self.journal is not None:
+            self.journal.added([entry])
+        self.repository.add(entry)
+        self._changed[entry["refnr"]] = entry
+        self._deleted.discard(entry["refnr"])
+        return True
+
+    def update(self, refnr, **fields):
+        job = self.repository.find(refnr)
+        if job is None:
+            return False
+        old_status, old_notes = job.get("status", "New"), job.get("notes")
+        self.repository.update(job, **fields)
+        if self.journal is not None:
+            if "status" in fields:
+                self.journal.status_changed(job, old_status)
+            if "notes" in fields and fields["notes"] != old_notes:
+                self.journal.notes_changed(job)
+        self._changed[job["refnr"]] = job
+        return True
+
+    def delete(self, refnr):
+        row, job = self.repository.remove(refnr)
+        if job is None:
+            return False
+        if self.journal is not None:
+            self.journal.deleted(job)
+        self._changed.pop(job["refnr"], None)
+        self._deleted.add(job["refnr"])
+        return True
+
+    def commit(self):
+        """Write all collected changes in one go."""
+        if self._changed or self._deleted:
+            self.storage.apply(list(self._changed.values()), set(self._deleted), self.jobs)
+        self._changed.clear()
+        self._deleted.clear()
+        if self.journal is not None:
+            # The journal is only removed once the scheduler has stored its jobs
+            from persistence import SaveScheduler
+            scheduler = SaveScheduler(self.storage, delay=0, max_delay=0)
+            self.journal.close(scheduler, self.jobs)
+            scheduler.close()
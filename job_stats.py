@@ -0,0 +1,121 @@
+# job_stats.py
+# Pipeline statistics of the saved jobs, kept up to date from journal events (no Qt imports)
+
+import bisect
+from collections import Counter
+
+from job_records import STATUSES
+from job_journal import status_history
+from instrumentation import percentile
+
+PIPELINE = ["New", "Interested", "Applied", "Interview", "Accepted"]  # Funnel stages; Rejected ends the pipeline
+DAY = 24 * 60 * 60
+
+def _stage(status):
+    return PIPELINE.index(status) if status in PIPELINE else -1
+
+class PipelineStats:
+    """
+    Per-status counts, a funnel and time-in-stage distributions.
+
+    Built once from the loaded jobs, then updated by apply() for each journal
+    event without looking at the other jobs. Durations of finished stays are
+    kept sorted, so percentiles are a lookup. Jobs saved before the journal
+    existed have no history and only count towards the current status.
+    """
+
+    def __init__(self, jobs=()):
+        self.counts = Counter()       # status -> jobs currently in it
+        self.furthest = Counter()     # pipeline stage index -> jobs that got this far and no further
+        self.durations = {status: [] for status in STATUSES}   # status -> sorted seconds of finished stays
+        self._jobs = {}               # refnr -> [status, since, furthest stage, [(status, seconds), ...]]
+        for job in jobs:
+            self.add_job(job)
+
+    def add_job(self, job):
+        history = status_history(job)
+        status = job.get("status", "New")
+        stays = [(old, end - start) for (start, old), (end, _) in zip(history, history[1:])]
+        since = history[-1][0] if history else None
+        furthest = max([_stage(s) for _, s in history] + [_stage(status)])
+        self._track(job.get("refnr"), status, since, furthest, stays)
+
+    def _track(self, refnr, status, since, furthest, stays):
+        self._untrack(refnr)
+        self._jobs[refnr] = [status, since, furthest, stays]
+        self.counts[status] += 1
+        if furthest >= 0:
+            self.furthest[furthest] += 1
+        for old, seconds in stays:
+            bisect.insort(self.durations.setdefault(old, []), seconds)
+
+    def _untrack(self, refnr):
+        entry = self._jobs.pop(refnr, None)
+        if entry is None:
+            return
+        status, since, furthest, stays = entry
+        self.counts[status] -= 1
+        if furthest >= 0:
+            self.furthest[furthest] -= 1
+        for old, seconds in stays:
+            values = self.durations.get(old, [])
+            i = bisect.bisect_left(values, seconds)
+            if i < len(values) and values[i] == seconds:
+                del values[i]
+
+    def apply(self, event):
+        """Update from one journal event (JobJournal listener)."""
+        kind = event.get("event")
+        refnr = event.get("refnr")
+        if kind == "added":
+            status = event.get("status", "New")
+            self._track(refnr, status, event["ts"], _stage(status), [])
+        elif kind == "deleted":
+            self._untrack(refnr)
+        elif kind == "status":
+            entry = self._jobs.get(refnr)
+            if entry is None:
+                return
+            old, since, furthest, stays = entry
+            new = event["new"]
+            self.counts[old] -= 1
+            self.counts[new] += 1
+            if since is not None:
+                seconds = event["ts"] - since
+                stays.append((old, seconds))
+                bisect.insort(self.durations.setdefault(old, []), seconds)
+            stage = _stage(new)
+            if stage > furthest:
+                if furthest >= 0:
+                    self.furthest[furthest] -= 1
+                self.furthest[stage] += 1
+                furthest = stage
+            entry[:] = [new, event["ts"], furthest, stays]
+
+    def total(self):
+        return len(self._jobs)
+
+    def funnel(self):
+        """[(stage, jobs that got at least this far)] in pipeline order."""
+        reached = []
+        running = 0
+        for index in range(len(PIPELINE) - 1, -1, -1):
+            running += self.furthest[index]
+            reached.append((PIPELINE[index], running))
+        return reached[::-1]
+
+    def interview_rate(self):
+        """Share of applications that led to an interview, None before the first application."""
+        reached = dict(self.funnel())
+        return reached["Interview"] / reached["Applied"] if reached["Applied"] else None
+
+    def time_in_stage(self, points=(50, 90)):
+        """{status: {"count", "p50", ...}} in days over the finished stays."""
+        summary = {}
+        for status in STATUSES:
+            ordered = self.durations.get(status, [])
+            row = {"count": len(ordered)}
+            for p in points:
+                row[f"p{p}"] = percentile(ordered, p) / DAY if ordered else None
+            summary[status] = row
+        return summary
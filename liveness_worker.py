@@ -0,0 +1,44 @@
+# liveness_worker.py
+# Runs the online check of saved postings off the GUI thread
+
+import time
+
+from PyQt5 import QtCore
+from job_liveness import check_jobs
+
+class LivenessWorker(QtCore.QThread):
+    results_ready = QtCore.pyqtSignal(list)      # [(refnr, online, etag, checked), ...]
+    progress = QtCore.pyqtSignal(int, int)       # checked, total
+    check_done = QtCore.pyqtSignal(int, int)     # checked, offline
+
+    def __init__(self, refnrs, etags=None, batch_size=25, parent=None):
+        super().__init__(parent)
+        self.refnrs = list(refnrs)
+        self.etags = dict(etags or {})
+        self.batch_size = batch_size
+        self._cancelled = False
+
+    def cancel(self):
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def run(self):
+        batch = []
+        done = offline = 0
+        last_emit = time.monotonic()
+        for result in check_jobs(self.refnrs, etags=self.etags, is_cancelled=self.is_cancelled):
+            batch.append(result)
+            done += 1
+            offline += result[1] is False
+            # Hand results over in batches so the table is not repainted per row
+            if len(batch) >= self.batch_size or time.monotonic() - last_emit > 0.5:
+                self.results_ready.emit(batch)
+                self.progress.emit(done, len(self.refnrs))
+                batch = []
+                last_emit = time.monotonic()
+        if batch:
+            self.results_ready.emit(batch)
+        self.progress.emit(done, len(self.refnrs))
+        self.check_done.emit(done, offline)
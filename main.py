@@ -1,18 +1,36 @@
-import csv
-import os
-import requests
+import time
+_START = time.perf_counter()  # Reference point for --profile-startup
+
+import sys
 from PyQt5 import QtWidgets, QtCore, QtGui
-from job_data import load_jobs, save_jobs  # Module to load and save job data
-
-def is_valid_job(job):
-    return bool(
-        job and
-        job.get("title") and
-        job.get("company") and
-        job.get("refnr") and
-        isinstance(job.get("title"), str) and
-        isinstance(job.get("company"), str)
-    )
+from job_data import load_jobs  # Module to load and save job data
+from persistence import SaveScheduler  # Debounced background saving
+from job_repository import SavedJobRepository  # Indexed saved jobs
+from search_worker import SearchWorker  # Background worker for API searches
+import job_api
+from table_models import ResultsTableModel, SavedJobsModel, JobFilterProxyModel, ButtonDelegate, StatusDelegate
+from job_records import STATUSES, is_valid_job, has_refnr, format_details, build_search_queries
+from export_worker import ExportWorker
+from job_import import read_records, collect_new
+from detail_fetcher import DetailFetcher
+from job_geo import parse_home, load_home, save_home
+from paged_results import PagedResultsModel
+from job_dedupe import NearDuplicateGrouper
+from job_liveness import due_jobs
+from liveness_worker import LivenessWorker
+from job_journal import JobJournal
+from job_stats import PipelineStats
+from stats_dialog import StatsDialog
+from saved_searches import SavedSearchStore
+from search_scheduler import SearchScheduler, SavedSearchesDialog
+import instrumentation
+from instrumentation import span
+from trace_panel import TracePanel
+
+SAVED_CHUNK = 2000  # Saved rows added per event loop turn at startup
+FILTER_DELAY = 150         # ms after the last keystroke before a filter runs
+FILTER_DELAY_SHORT = 400   # ... while a word of the filter is shorter than three letters
+PREFETCH_DELAY = 300       # ms after scrolling stops before details of the visible rows are prefetched
 
 # Custom list widget for handling file drops
 class FileListWidget(QtWidgets.QListWidget):
@@ -58,16 +76,81 @@ class MainWindow(QtWidgets.QMainWindow):
         self.resize(1680, 1080)
 
         # Initialize data containers
+        self.persistence = SaveScheduler()
         self.search_results = []
-        self.saved_jobs = load_jobs()  # Load saved jobs from file
+        self.search_total = 0
+        self.search_truncated = []      # Queries cut off at MAX_PAGES: (label, hits fetched, hits)
+        self.saved_repo = SavedJobRepository()  # Filled from storage once the window is shown
+        self.saved_jobs = self.saved_repo.jobs
         self.active_saved_row = None
         self.current_link = ""
 
+        # Background search state; the generation counter marks results of older searches as stale
+        self.search_generation = 0
+        self.search_worker = None
+        self.running_workers = set()
+        self.export_worker = None
+        self.liveness_worker = None
+
+        # Status and note edits are appended to a journal and folded into storage periodically
+        self.journal = JobJournal()
+        self.pipeline_stats = PipelineStats()
+        self.stats_dialog = None
+        self.compact_timer = QtCore.QTimer(self)
+        self.compact_timer.timeout.connect(self.compact_journal)
+        self.compact_timer.start(30000)
+
+        # Full postings from the jobdetails endpoint, prefetched for visible result rows
+        self.detail_fetcher = DetailFetcher(parent=self)
+        self.detail_fetcher.details_ready.connect(self.on_details_ready)
+        self.detail_fetcher.details_failed.connect(self.on_details_failed)
+        self.detail_refnr = None
+
+        # Saved searches are re-run in the background; new postings show up as a badge
+        self.saved_searches = SavedSearchStore()
+        self.search_scheduler = SearchScheduler(self.saved_searches, parent=self)
+        self.search_scheduler.badge_changed.connect(self.update_saved_searches_button)
+        self.search_scheduler.search_finished.connect(self.on_saved_search_finished)
+        self.saved_searches_dialog = None
+
         # Install an event filter to detect clicks outside the detail panel
         QtWidgets.QApplication.instance().installEventFilter(self)
 
         self.init_ui()          # Set up UI components
-        self.load_saved_table() # Populate the saved jobs table
+        self.init_menu()
+
+        # Populate the saved jobs table after the first paint
+        self.pending_saved = []
+        self.pending_saved_pos = 0
+        self.saved_fill_timer = QtCore.QTimer(self)
+        self.saved_fill_timer.setInterval(0)
+        self.saved_fill_timer.timeout.connect(self.fill_saved_chunk)
+        QtCore.QTimer.singleShot(20, self.load_saved_table)
+
+        self.update_saved_searches_button(self.saved_searches.unread())
+        self.search_scheduler.start()
+
+        # Show save metrics in the status bar
+        self.save_stats_label = QtWidgets.QLabel()
+        self.statusBar().addPermanentWidget(self.save_stats_label)
+        self.save_stats_timer = QtCore.QTimer(self)
+        self.save_stats_timer.timeout.connect(self.update_save_stats)
+        self.save_stats_timer.start(2000)
+
+    def init_menu(self):
+        tools = self.menuBar().addMenu("Extras")
+        self.trace_action = tools.addAction("Messung aktiv")
+        self.trace_action.setCheckable(True)
+        self.trace_action.setChecked(instrumentation.enabled)
+        self.trace_action.toggled.connect(instrumentation.enable)
+        tools.addAction("Messwerte anzeigen...", self.show_trace_panel)
+        self.trace_panel = None
+
+    def show_trace_panel(self):
+        if self.trace_panel is None:
+            self.trace_panel = TracePanel(self)
+        self.trace_panel.show()
+        self.trace_panel.raise_()
 
     def init_ui(self):
         # Central widget and main layout
@@ -77,9 +160,14 @@ class MainWindow(QtWidgets.QMainWindow):
 
         # --- Search input fields ---
         self.input_title = QtWidgets.QLineEdit()
-        self.input_title.setPlaceholderText("Was (Jobtitel)")
+        self.input_title.setPlaceholderText("Was (Jobtitel, mehrere mit Komma)")
         self.input_location = QtWidgets.QLineEdit()
-        self.input_location.setPlaceholderText("Wo (Ort)")
+        self.input_location.setPlaceholderText("Wo (Ort, mehrere mit Komma)")
+        self.umkreis_input = QtWidgets.QComboBox()
+        self.umkreis_input.addItem("Umkreis", "")
+        for km in (10, 25, 50, 100, 200):
+            self.umkreis_input.addItem(f"{km} km", str(km))
+        self.umkreis_input.setToolTip("Suchradius um den Ort")
         self.input_field = QtWidgets.QLineEdit()
         self.input_field.setPlaceholderText("Berufsfeld (z.B. Informatik)")
 
@@ -92,11 +180,21 @@ class MainWindow(QtWidgets.QMainWindow):
         self.offer_type_input.addItem("Praktikum/Trainee", "34")
 
         self.search_button = QtWidgets.QPushButton("Search")
+        self.cancel_search_button = QtWidgets.QPushButton("Abbrechen")
+        self.cancel_search_button.setEnabled(False)
+        self.force_refresh_input = QtWidgets.QCheckBox("Neu laden")
+        self.force_refresh_input.setToolTip("Ergebnisse nicht aus dem Cache lesen")
+        self.paged_input = QtWidgets.QCheckBox("Seitenweise")
+        self.paged_input.setToolTip("Ergebnisse erst beim Scrollen laden, für sehr große Trefferzahlen "
+                                    "(ohne Filter und Sortierung)")
+        self.save_search_button = QtWidgets.QPushButton("Suche speichern")
+        self.saved_searches_button = QtWidgets.QPushButton("Gespeicherte Suchen")
 
         # Layout the search bar
         search_layout = QtWidgets.QHBoxLayout()
         search_layout.addWidget(self.input_title)
         search_layout.addWidget(self.input_location)
+        search_layout.addWidget(self.umkreis_input)
         search_layout.addWidget(self.input_field)
 
         # Label for offer type dropdown
@@ -104,25 +202,62 @@ class MainWindow(QtWidgets.QMainWindow):
         search_layout.addWidget(offer_type_label)
         search_layout.addWidget(self.offer_type_input)
 
+        search_layout.addWidget(self.force_refresh_input)
+        search_layout.addWidget(self.paged_input)
         search_layout.addWidget(self.search_button)
+        search_layout.addWidget(self.cancel_search_button)
+        search_layout.addWidget(self.save_search_button)
+        search_layout.addWidget(self.saved_searches_button)
         layout.addLayout(search_layout)
 
-        # --- Results table ---
-        self.results_table = QtWidgets.QTableWidget(0, 7)
-        self.results_table.setHorizontalHeaderLabels([
-            "Title", "Details", "Company", "Location", "RefNr", "Link", "Speichern"
-        ])
+        # --- Results table (model/view, buttons are drawn by a delegate) ---
+        self.results_model = ResultsTableModel(self)
+        self.full_results_model = self.results_model  # Replaced by a PagedResultsModel in paged mode
+        self.search_results = self.results_model.jobs
+        self.results_proxy = JobFilterProxyModel(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_table = QtWidgets.QTableView()
+        self.results_table.setModel(self.results_proxy)
         self.results_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
         self.results_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
         self.results_table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
         self.results_table.horizontalHeader().setStretchLastSection(True)
-
-        layout.addWidget(QtWidgets.QLabel("Suchergebnisse:"))
+        self.results_table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        self.results_table.verticalHeader().setDefaultSectionSize(30)
+        self.results_table.setSortingEnabled(True)
+        self.results_table.setColumnHidden(ResultsTableModel.COL_QUERIES, True)
+        self.results_table.sortByColumn(-1, QtCore.Qt.AscendingOrder)
+        self.results_buttons = ButtonDelegate(self.results_table)
+        for column in ResultsTableModel.BUTTON_COLUMNS:
+            self.results_table.setItemDelegateForColumn(column, self.results_buttons)
+        self.results_buttons.clicked.connect(self.on_results_button)
+
+        results_header = QtWidgets.QHBoxLayout()
+        results_header.addWidget(QtWidgets.QLabel("Suchergebnisse:"))
+        results_header.addStretch()
+        self.search_status = QtWidgets.QLabel()
+        results_header.addWidget(self.search_status)
+        layout.addLayout(results_header)
 
         # Filter field above results table
         self.results_filter = QtWidgets.QLineEdit()
-        self.results_filter.setPlaceholderText("Filter Ergebnisse")
-        layout.addWidget(self.results_filter)
+        self.results_filter.setPlaceholderText("Filter Ergebnisse (z.B. company:GmbH Berlin)")
+        # Local radius filter around the home location, no new API request
+        self.home = load_home()
+        self.radius_input = QtWidgets.QSpinBox()
+        self.radius_input.setRange(0, 1000)
+        self.radius_input.setSingleStep(5)
+        self.radius_input.setSuffix(" km")
+        self.radius_input.setSpecialValueText("beliebig")
+        self.radius_input.setToolTip("Nur Ergebnisse bis zu dieser Entfernung vom Wohnort zeigen")
+        self.home_button = QtWidgets.QPushButton()
+        self.home_button.clicked.connect(self.choose_home)
+        filter_layout = QtWidgets.QHBoxLayout()
+        filter_layout.addWidget(self.results_filter)
+        filter_layout.addWidget(QtWidgets.QLabel("Entfernung bis:"))
+        filter_layout.addWidget(self.radius_input)
+        filter_layout.addWidget(self.home_button)
+        layout.addLayout(filter_layout)
         layout.addWidget(self.results_table)
 
         # --- Detail panel (initially hidden) ---
@@ -149,16 +284,19 @@ class MainWindow(QtWidgets.QMainWindow):
         self.label_company = QtWidgets.QLabel()
         self.label_location = QtWidgets.QLabel()
         self.label_refnr = QtWidgets.QLabel()
+        self.detail_text = QtWidgets.QTextBrowser()
+        self.detail_text.setMinimumHeight(140)
         self.link_button = QtWidgets.QPushButton("Zur Anzeige")
         self.link_button.clicked.connect(self.open_job_link)
         self.note_input = QtWidgets.QTextEdit()
         self.status_input = QtWidgets.QComboBox()
-        self.status_input.addItems(["New", "Interested", "Applied", "Interview", "Rejected", "Accepted"])
+        self.status_input.addItems(STATUSES)
         self.save_button = QtWidgets.QPushButton("Save Job")
 
         detail_form.addRow("Title:", self.label_title)
         detail_form.addRow("Company:", self.label_company)
         detail_form.addRow("Location:", self.label_location)
+        detail_form.addRow("Beschreibung:", self.detail_text)
         detail_form.addRow("Status:", self.status_input)
         detail_form.addRow("Notes:", self.note_input)
         detail_form.addRow("RefNr:", self.label_refnr)
@@ -187,36 +325,82 @@ class MainWindow(QtWidgets.QMainWindow):
         self.detail_box.setLayout(detail_form)
         layout.addWidget(self.detail_box)
 
-        # --- Saved jobs table ---
-        self.saved_table = QtWidgets.QTableWidget(0, 10)
-        self.saved_table.setHorizontalHeaderLabels([
-            "Title", "Details", "Company", "Location",
-            "Status", "Notes", "RefNr", "Link", "Dokumente", "Löschen"
-        ])
-        self.saved_table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        # --- Saved jobs table (model/view with delegates for status and buttons) ---
+        self.saved_model = SavedJobsModel(self.saved_repo, self)
+        self.saved_proxy = JobFilterProxyModel(self)
+        self.saved_proxy.setSourceModel(self.saved_model)
+        self.saved_table = QtWidgets.QTableView()
+        self.saved_table.setModel(self.saved_proxy)
+        self.saved_table.setEditTriggers(
+            QtWidgets.QAbstractItemView.DoubleClicked | QtWidgets.QAbstractItemView.EditKeyPressed
+        )
         self.saved_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
-        self.saved_table.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.saved_table.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self.saved_table.horizontalHeader().setStretchLastSection(True)
+        self.saved_table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        self.saved_table.verticalHeader().setDefaultSectionSize(30)
+        self.saved_table.setSortingEnabled(True)
+        self.saved_table.sortByColumn(-1, QtCore.Qt.AscendingOrder)
+        self.saved_buttons = ButtonDelegate(self.saved_table)
+        for column in SavedJobsModel.BUTTON_COLUMNS:
+            self.saved_table.setItemDelegateForColumn(column, self.saved_buttons)
+        self.saved_table.setItemDelegateForColumn(SavedJobsModel.COL_STATUS, StatusDelegate(self.saved_table))
+        self.saved_buttons.clicked.connect(self.on_saved_button)
+        self.saved_model.job_edited.connect(self.on_saved_job_edited)
+        # Results are marked when they look like a saved job under another refnr
+        self.results_model.near_saved = self.saved_model.near_index
+        self.saved_model.near_changed.connect(self.on_saved_near_changed)
 
         layout.addWidget(QtWidgets.QLabel("Gespeicherte Jobs:"))
 
         # Filter field above saved table
         self.saved_filter = QtWidgets.QLineEdit()
-        self.saved_filter.setPlaceholderText("Filter gespeicherte Jobs")
+        self.saved_filter.setPlaceholderText("Filter gespeicherte Jobs (z.B. status:Applied Berlin)")
         layout.addWidget(self.saved_filter)
         layout.addWidget(self.saved_table)
 
-        # Export to CSV button
+        # Import and export buttons
+        file_buttons = QtWidgets.QHBoxLayout()
+        self.import_button = QtWidgets.QPushButton("Importieren...")
         self.export_button = QtWidgets.QPushButton("Export to CSV")
-        layout.addWidget(self.export_button)
+        self.check_button = QtWidgets.QPushButton("Online prüfen")
+        self.check_button.setToolTip("Prüft, ob die gespeicherten Anzeigen noch online sind")
+        self.stats_button = QtWidgets.QPushButton("Statistik")
+        file_buttons.addWidget(self.import_button)
+        file_buttons.addWidget(self.export_button)
+        file_buttons.addWidget(self.check_button)
+        file_buttons.addWidget(self.stats_button)
+        layout.addLayout(file_buttons)
 
         # Connect signals for buttons and inputs
         self.search_button.clicked.connect(self.search_jobs)
+        self.cancel_search_button.clicked.connect(self.cancel_search)
+        self.save_search_button.clicked.connect(self.save_current_search)
+        self.saved_searches_button.clicked.connect(self.show_saved_searches)
         self.save_button.clicked.connect(self.save_job)
-        self.saved_table.itemChanged.connect(self.update_saved_note)
-        self.saved_filter.textChanged.connect(self.apply_saved_filter)
-        self.results_filter.textChanged.connect(self.apply_results_filter)
+        # Filters run shortly after typing stops instead of on every keystroke
+        self.saved_filter_timer = QtCore.QTimer(self)
+        self.saved_filter_timer.setSingleShot(True)
+        self.saved_filter_timer.timeout.connect(self.apply_saved_filter)
+        self.results_filter_timer = QtCore.QTimer(self)
+        self.results_filter_timer.setSingleShot(True)
+        self.results_filter_timer.timeout.connect(self.apply_results_filter)
+        self.saved_filter.textChanged.connect(lambda text: self.restart_filter_timer(self.saved_filter_timer, text))
+        self.results_filter.textChanged.connect(
+            lambda text: self.restart_filter_timer(self.results_filter_timer, text))
+        self.radius_input.valueChanged.connect(self.apply_radius_filter)
+        self.apply_home()
+        self.prefetch_timer = QtCore.QTimer(self)
+        self.prefetch_timer.setSingleShot(True)
+        self.prefetch_timer.setInterval(PREFETCH_DELAY)
+        self.prefetch_timer.timeout.connect(self.prefetch_visible_details)
+        # Not on every inserted batch: a running search prefetches nothing, see prefetch_visible_details
+        self.results_table.verticalScrollBar().valueChanged.connect(self.prefetch_timer.start)
+        self.results_proxy.modelReset.connect(self.prefetch_timer.start)
         self.export_button.clicked.connect(self.export_to_csv)
+        self.import_button.clicked.connect(self.import_jobs)
+        self.check_button.clicked.connect(self.check_saved_jobs)
+        self.stats_button.clicked.connect(self.show_stats)
         self.input_title.returnPressed.connect(self.search_jobs)
         self.input_location.returnPressed.connect(self.search_jobs)
         self.input_field.returnPressed.connect(self.search_jobs)
@@ -227,64 +411,264 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.warning(self, "Fehler", "Bitte gib mindestens einen Ort an.")
             return
 
+        # Stop a search that is still running; its results are stale from now on
+        self.cancel_search()
+        self.search_generation += 1
+
+        # One query per combination of the entered titles and locations
+        queries = self.current_search_queries()
+
         # Clear previous search results
-        self.results_table.setSortingEnabled(False)
-        self.results_table.setRowCount(0)
-        self.search_results = []
+        self.close_detail_panel()
+        self.search_total = 0
+        self.search_truncated = []
+        if self.paged_input.isChecked():
+            if len(queries) == 1:
+                self.start_paged_search(queries[0][1])
+                return
+            self.statusBar().showMessage("Seitenweises Laden geht nur mit einer Suchanfrage, "
+                                         "es werden alle Ergebnisse geladen", 10000)
+        self.set_results_model(self.full_results_model)
+        self.results_model.clear()
+        self.search_results = self.results_model.jobs
+
+        self.search_queries_done = 0
+        self.search_queries_total = len(queries)
+        self.results_table.setColumnHidden(ResultsTableModel.COL_QUERIES, len(queries) == 1)
+
+        # Run the API calls in a worker thread, results arrive through signals
+        worker = SearchWorker(self.search_generation, queries,
+                              force_refresh=self.force_refresh_input.isChecked())
+        worker.batch_ready.connect(self.on_search_batch)
+        worker.matches_found.connect(self.on_search_matches)
+        worker.query_done.connect(self.on_search_query_done)
+        worker.query_failed.connect(self.on_search_query_failed)
+        worker.total_known.connect(self.on_search_total)
+        worker.truncated.connect(self.on_search_truncated)
+        worker.search_failed.connect(self.on_search_failed)
+        worker.search_done.connect(self.on_search_done)
+        worker.finished.connect(lambda w=worker: self.running_workers.discard(w))
+        self.running_workers.add(worker)
+        self.search_worker = worker
+
+        self.search_status.setText("Suche läuft...")
+        self.cancel_search_button.setEnabled(True)
+        worker.start()
+
+    def start_paged_search(self, params):
+        # Only the first page is requested now, the view asks for more while scrolling
+        model = PagedResultsModel(params, force_refresh=self.force_refresh_input.isChecked(), parent=self)
+        model.total_known.connect(self.on_paged_total)
+        model.page_loaded.connect(self.on_paged_loaded)
+        model.page_failed.connect(self.on_paged_failed)
+        self.set_results_model(model)
+        self.paged_sized = False
+        self.results_table.setColumnHidden(ResultsTableModel.COL_QUERIES, True)
+        self.search_status.setText("Suche läuft...")
+        model.start()
+
+    def set_results_model(self, model):
+        # Swap the source of the results table between the full and the paged model
+        old = self.results_model
+        if old is model:
+            return
+        if isinstance(model, PagedResultsModel):
+            # Sorting and filtering would need every page
+            self.results_filter.clear()
+            self.results_proxy.set_filter_text("")
+            self.radius_input.setValue(0)
+            self.results_table.sortByColumn(-1, QtCore.Qt.AscendingOrder)
+            model.set_home(self.home[:2] if self.home else None)
+        self.results_table.setSortingEnabled(not isinstance(model, PagedResultsModel))
+        self.results_filter.setEnabled(not isinstance(model, PagedResultsModel))
+        self.radius_input.setEnabled(self.home is not None and not isinstance(model, PagedResultsModel))
+        model.near_saved = self.saved_model.near_index
+        self.results_model = model
+        self.results_proxy.setSourceModel(model)
+        self.search_results = model.jobs
+        if isinstance(old, PagedResultsModel):
+            old.shutdown()
+            old.deleteLater()
+
+    def on_paged_total(self, total):
+        self.search_total = total
+
+    def on_paged_loaded(self, rows):
+        model = self.results_model
+        if not isinstance(model, PagedResultsModel):
+            return
+        if rows and not self.paged_sized:
+            # Size the columns once, on the first page
+            self.paged_sized = True
+            self.finish_results_table()
+        pages = len(model.pages_in_memory())
+        if model.complete:
+            self.search_status.setText(f"{rows} Ergebnisse ({pages} Seiten im Speicher)")
+        else:
+            self.search_status.setText(f"{rows} von {self.search_total} Ergebnissen geladen, "
+                                       f"weitere beim Scrollen ({pages} Seiten im Speicher)")
+
+    def on_paged_failed(self, page, message):
+        if not isinstance(self.results_model, PagedResultsModel):
+            return
+        if self.results_model.total is None:
+            self.search_status.setText("")
+            QtWidgets.QMessageBox.critical(self, "Error", f"API error:\n{message}")
+        else:
+            self.statusBar().showMessage(f"Seite {page} konnte nicht geladen werden: {message}", 10000)
+
+    def current_search_queries(self):
+        return build_search_queries(
+            was=self.input_title.text(),
+            wo=self.input_location.text(),
+            berufsfeld=self.input_field.text(),
+            angebotsart=self.offer_type_input.currentData(),
+            umkreis=self.umkreis_input.currentData(),
+        )
 
-        # Prepare API request
-        url = "https://rest.arbeitsagentur.de/jobboerse/jobsuche-service/pc/v4/jobs"
-        headers = {"X-API-Key": "jobboerse-jobsuche"}
-        params = {
-            "wo": self.input_location.text().strip(),
-            "was": self.input_title.text().strip(),
-            "berufsfeld": self.input_field.text().strip(),
-            "angebotsart": self.offer_type_input.currentData(),
-            "size": 250,
-        }
-        params = {k: v for k, v in params.items() if v}  # Remove empty parameters
-
-        # Call the API and handle errors
-        try:
-            res = requests.get(url, headers=headers, params=params)
-            res.raise_for_status()
-            jobs = res.json().get("stellenangebote", [])
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Error", f"API error:\n{e}")
-            return
-
-        # Fill the results table with job offers
-        for row, job in enumerate(jobs):
-            self.search_results.append(job)
-            title = str(job.get("titel", "N/A"))
-            company = str(job.get("arbeitgeber", "N/A"))
-            loc = job.get("arbeitsort", {})
-            location = f"{loc.get('region', '')}, {loc.get('ort', '')}".strip(", ")
-            refnr = job.get("refnr", "N/A")
-            link = f"https://www.arbeitsagentur.de/jobsuche/jobdetail/{refnr}"
-
-            self.results_table.insertRow(row)
-            self.results_table.setItem(row, 0, QtWidgets.QTableWidgetItem(title))
-
-            # Details button
-            detail_btn = QtWidgets.QPushButton("Details")
-            detail_btn.clicked.connect(lambda _, r=row: self.toggle_detail_panel_from_search(r))
-            self.results_table.setCellWidget(row, 1, detail_btn)
-            self.results_table.setItem(row, 2, QtWidgets.QTableWidgetItem(location))
-            self.results_table.setItem(row, 3, QtWidgets.QTableWidgetItem(refnr))
-
-            link_button = QtWidgets.QPushButton("Zur Anzeige")
-            link_button.clicked.connect(lambda _, url=link: QtGui.QDesktopServices.openUrl(QtCore.QUrl(url)))
-            self.results_table.setCellWidget(row, 4, link_button)
-
-            save_button = QtWidgets.QPushButton("Speichern")
-            save_button.clicked.connect(lambda _, r=row: self.save_job(r))
-            self.results_table.setCellWidget(row, 5, save_button)
-
-        # Finish table setup
-        self.results_table.resizeColumnsToContents()
-        self.results_table.setSortingEnabled(True)
-        self.results_table.resizeRowsToContents()
+    def save_current_search(self):
+        # Store the current form as a search that is re-run on an interval
+        if not self.input_location.text().strip():
+            QtWidgets.QMessageBox.warning(self, "Fehler", "Bitte gib mindestens einen Ort an.")
+            return
+        queries = self.current_search_queries()
+        default = " in ".join(v for v in (self.input_title.text().strip(), self.input_location.text().strip()) if v)
+        name, ok = QtWidgets.QInputDialog.getText(self, "Suche speichern", "Name:", text=default)
+        if not ok or not name.strip():
+            return
+        interval, ok = QtWidgets.QInputDialog.getInt(
+            self, "Suche speichern", "Alle wie viele Minuten prüfen?", 60, 5, 24 * 60)
+        if not ok:
+            return
+        self.saved_searches.add(name.strip(), queries, interval)
+        self.saved_searches.save()
+        # The first run only records what exists today
+        self.search_scheduler.run_now(name.strip())
+
+    def show_saved_searches(self):
+        if self.saved_searches_dialog is None:
+            self.saved_searches_dialog = SavedSearchesDialog(self.search_scheduler, self)
+            self.saved_searches_dialog.show_new.connect(self.show_new_postings)
+        self.saved_searches_dialog.refresh()
+        self.saved_searches_dialog.show()
+        self.saved_searches_dialog.raise_()
+
+    def show_new_postings(self, name):
+        # Put the postings found since the last look into the results table
+        search = self.saved_searches.find(name)
+        if search is None:
+            return
+        self.cancel_search()
+        self.search_generation += 1
+        self.close_detail_panel()
+        self.set_results_model(self.full_results_model)
+        self.results_model.clear()
+        self.search_results = self.results_model.jobs
+        self.results_table.setColumnHidden(ResultsTableModel.COL_QUERIES, True)
+        records = list(search.new)
+        NearDuplicateGrouper().assign(records)
+        self.results_model.append_jobs(records)
+        self.search_total = len(search.new)
+        self.finish_results_table()
+        self.search_status.setText(f"{len(search.new)} neue Stellen für „{name}“")
+        search.mark_read()
+        self.saved_searches.save()
+        self.update_saved_searches_button(self.saved_searches.unread())
+
+    def on_saved_search_finished(self, name, count):
+        if count:
+            self.statusBar().showMessage(f"{name}: {count} neue Stellen", 10000)
+
+    def update_saved_searches_button(self, unread):
+        self.saved_searches_button.setText(f"Gespeicherte Suchen ({unread})" if unread else "Gespeicherte Suchen")
+
+    def cancel_search(self):
+        # Cancel the running search; rows that already arrived stay in the table
+        if self.search_worker is None:
+            return
+        self.search_worker.cancel()
+        self.search_worker = None
+        self.cancel_search_button.setEnabled(False)
+        self.finish_results_table()
+        self.search_status.setText(f"Abgebrochen ({len(self.search_results)} Ergebnisse)")
+
+    def on_search_batch(self, generation, jobs):
+        # Ignore batches from searches that were replaced or cancelled
+        if generation != self.search_generation or self.search_worker is None:
+            return
+        self.results_model.append_jobs(jobs)
+        self.search_status.setText(f"{len(self.search_results)} von {self.search_total} Ergebnissen geladen...")
+
+    def on_search_matches(self, generation, matches):
+        if generation == self.search_generation and self.search_worker is not None:
+            self.results_model.add_matches(matches)
+
+    def on_search_query_done(self, generation, label, count):
+        if generation != self.search_generation or self.search_queries_total == 1:
+            return
+        self.search_queries_done += 1
+        self.statusBar().showMessage(
+            f"{label}: {count} Treffer ({self.search_queries_done} von {self.search_queries_total} Suchanfragen fertig)",
+            5000)
+
+    def on_search_query_failed(self, generation, label, message):
+        if generation == self.search_generation and self.search_queries_total > 1:
+            self.search_queries_done += 1
+            self.statusBar().showMessage(f"{label}: Fehler – {message}", 10000)
+
+    def on_search_total(self, generation, total):
+        if generation == self.search_generation:
+            self.search_total = total
+
+    def on_search_truncated(self, generation, label, limit, total):
+        if generation == self.search_generation:
+            self.search_truncated.append((label, limit, total))
+
+    def on_search_failed(self, generation, message):
+        if generation != self.search_generation or self.search_worker is None:
+            return
+        self.search_worker = None
+        self.cancel_search_button.setEnabled(False)
+        self.search_status.setText("")
+        QtWidgets.QMessageBox.critical(self, "Error", f"API error:\n{message}")
+
+    def on_search_done(self, generation, count):
+        if generation != self.search_generation or self.search_worker is None:
+            return
+        self.search_worker = None
+        self.cancel_search_button.setEnabled(False)
+        self.finish_results_table()
+        status = f"{len(self.search_results)} Ergebnisse"
+        cache = job_api.get_client().cache
+        if cache:
+            status += f" (Cache: {cache.hits} Treffer, {cache.misses} Fehlgriffe)"
+        if self.search_truncated:
+            # Only MAX_PAGES pages per query are fetched; say so instead of showing a short list silently
+            status += " – gekürzt"
+            self.statusBar().showMessage("Nur die ersten Treffer geladen: " + ", ".join(
+                f"{label + ' ' if label else ''}{limit} von {total}" for label, limit, total in self.search_truncated
+            ) + ". Suche eingrenzen oder seitenweise laden.", 15000)
+        self.search_status.setText(status)
+
+    def on_results_button(self, index):
+        # Button clicks arrive as proxy indexes; work on the underlying result row
+        row = self.results_proxy.mapToSource(index).row()
+        column = index.column()
+        if column == ResultsTableModel.COL_DETAILS:
+            self.toggle_detail_panel_from_search(row)
+        elif column == ResultsTableModel.COL_LINK:
+            QtGui.QDesktopServices.openUrl(QtCore.QUrl(self.results_model.link(row)))
+        elif column == ResultsTableModel.COL_SAVE:
+            self.save_job(row)
+
+    def on_saved_near_changed(self):
+        self.results_model.saved_changed()
+
+    def finish_results_table(self):
+        # Size columns once all rows are in; only visible rows are measured
+        with span("table.resize_columns", table="results"):
+            self.results_table.resizeColumnsToContents()
+        self.prefetch_timer.start()
 
     def toggle_detail_panel_from_search(self, row):
         if self.detail_box.isVisible() and self.active_saved_row is None and getattr(self, "active_search_row",
@@ -294,17 +678,19 @@ class MainWindow(QtWidgets.QMainWindow):
             self.active_search_row = None
             return
 
+        job = self.search_results[row]
+        if job is None:  # Page of a paged search still loading
+            return
+
         # Save currently open row to toggle
         self.active_search_row = row
 
-        job = self.search_results[row]
-        self.label_title.setText(job.get("titel", ""))
-        self.label_company.setText(job.get("arbeitgeber", ""))
-        loc = job.get("arbeitsort", {})
-        self.label_location.setText(f"{loc.get('region', '')}, {loc.get('ort', '')}".strip(", "))
-        refnr = job.get("refnr", "N/A")
-        self.label_refnr.setText(refnr)
-        self.current_link = f"https://www.arbeitsagentur.de/jobsuche/jobdetail/{refnr}"
+        self.label_title.setText(job.title)
+        self.label_company.setText(job.company)
+        self.label_location.setText(job.location)
+        self.label_refnr.setText(job.refnr)
+        self.current_link = job.link
+        self.show_details(job.refnr)
 
         self.status_input.setCurrentIndex(0)
         self.note_input.clear()
@@ -321,52 +707,104 @@ class MainWindow(QtWidgets.QMainWindow):
         self.detail_box.setVisible(True)
         self.update_detail_button_text(row, "Details schließen")
 
+    def show_details(self, refnr):
+        self.detail_refnr = refnr
+        if not has_refnr(refnr):
+            self.detail_text.setPlainText("")
+            return
+        details = self.detail_fetcher.cached(refnr)
+        if details is not None:
+            self.detail_text.setPlainText(format_details(details))
+        else:
+            self.detail_text.setPlainText("Lade Details...")
+            self.detail_fetcher.request(refnr)
+
+    def on_details_ready(self, refnr, details):
+        if refnr == self.detail_refnr:
+            self.detail_text.setPlainText(format_details(details))
+
+    def on_details_failed(self, refnr, message):
+        if refnr == self.detail_refnr:
+            self.detail_text.setPlainText(f"Details konnten nicht geladen werden:\n{message}")
+
+    def prefetch_visible_details(self):
+        # Rows on screen plus one screen below, so scrolling on shows cached postings.
+        # While a search runs its pages go first; the search end starts the prefetch.
+        rows = self.results_proxy.rowCount()
+        if not rows or self.search_worker is not None:
+            self.detail_fetcher.prefetch([])
+            return
+        viewport = self.results_table.viewport()
+        top = max(self.results_table.rowAt(0), 0)
+        bottom = self.results_table.rowAt(viewport.height() - 1)
+        bottom = rows - 1 if bottom < 0 else bottom
+        last = min(rows - 1, bottom + (bottom - top + 1))
+        jobs = self.results_model.jobs
+        refnrs = []
+        for proxy_row in range(top, last + 1):
+            row = self.results_proxy.mapToSource(self.results_proxy.index(proxy_row, 0)).row()
+            job = jobs[row]
+            if job is not None:
+                refnrs.append(job.refnr)
+        self.detail_fetcher.prefetch(refnrs)
+
     def update_detail_button_text(self, row, text):
-        btn = self.results_table.cellWidget(row, 1)
-        if isinstance(btn, QtWidgets.QPushButton):
-            btn.setText(text)
+        # The label is derived from the open row in the model
+        self.results_model.set_open_row(row if text != "Details" else None)
 
     def save_job(self, row=None):
         # If editing an existing saved job, update it
         if self.active_saved_row is not None and row is None:
-            self.saved_jobs[self.active_saved_row]["status"] = self.status_input.currentText()
-            self.saved_jobs[self.active_saved_row]["notes"] = self.note_input.toPlainText()
-            save_jobs(self.saved_jobs)
-            self.refresh_saved_table()
+            job = self.saved_jobs[self.active_saved_row]
+            old_status, old_notes = job.get("status", "New"), job.get("notes", "")
+            job["status"] = self.status_input.currentText()
+            job["notes"] = self.note_input.toPlainText()
+            self.journal.status_changed(job, old_status)
+            if job["notes"] != old_notes:
+                self.journal.notes_changed(job)
+            self.saved_model.row_changed(self.active_saved_row)
             self.active_saved_row = None
             self.detail_box.setVisible(False)
             return
 
         # Otherwise, save a new job from search results
+        self.finish_saved_load()  # duplicate check needs every saved job
         if row is None or row >= len(self.search_results):
             return
         job = self.search_results[row]
-        loc = job.get("arbeitsort", {})
-        entry = {
-            "title": job.get("titel", ""),
-            "company": job.get("arbeitgeber", ""),
-            "location": f"{loc.get('region', '')}, {loc.get('ort', '')}".strip(", "),
-            "status": self.status_input.currentText(),
-            "notes": self.note_input.toPlainText(),
-            "refnr": job.get("refnr", "N/A"),
-            "link": f"https://www.arbeitsagentur.de/jobsuche/jobdetail/{job.get('refnr', '')}",
-            "files": []
-        }
+        if job is None:
+            return
+        entry = job.to_entry(
+            status=self.status_input.currentText(),
+            notes=self.note_input.toPlainText(),
+        )
 
         if not entry["title"] or not entry["company"]:
             QtWidgets.QMessageBox.warning(self, "Ungültiger Eintrag", "Titel und Firma dürfen nicht leer sein.")
             return
 
         # Do not save duplicates (same refnr or title/company)
-        if any(saved.get("refnr") == entry["refnr"] and saved.get("refnr") != "N/A" for saved in self.saved_jobs) or \
-           any(saved["title"] == entry["title"] and saved["company"] == entry["company"] for saved in self.saved_jobs):
+        if self.saved_repo.is_duplicate(entry):
             QtWidgets.QMessageBox.warning(self, "Schon gespeichert", "Dieser Job wurde bereits gespeichert.")
             return
 
+        # Ask before saving what looks like a saved job under another refnr
+        self.saved_model.near_builder.finish()
+        similar = self.results_model.saved_matches(job)
+        if similar:
+            lines = "\n".join(f"• {s.get('title', '')} – {s.get('company', '')}, {s.get('location', '')}"
+                              for s in similar[:5])
+            answer = QtWidgets.QMessageBox.question(
+                self, "Ähnlicher Job gespeichert",
+                f"Diese Anzeige ähnelt schon gespeicherten Jobs:\n{lines}\n\nTrotzdem speichern?"
+            )
+            if answer != QtWidgets.QMessageBox.Yes:
+                return
+
         # Add to saved jobs list and table
-        self.saved_jobs.append(entry)
+        self.journal.added([entry])
         self.add_saved_row(entry)
-        save_jobs(self.saved_jobs)
+        self.persistence.upsert(entry, self.saved_jobs)
 
     def toggle_saved_detail_panel(self, row):
         if self.detail_box.isVisible() and self.active_saved_row == row:
@@ -382,6 +820,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.label_location.setText(job.get("location", ""))
         self.label_refnr.setText(job.get("refnr", "N/A"))
         self.current_link = job.get("link", "")
+        self.show_details(job.get("refnr"))
         self.status_input.setCurrentText(job.get("status", "New"))
         self.note_input.setText(job.get("notes", ""))
 
@@ -399,69 +838,45 @@ class MainWindow(QtWidgets.QMainWindow):
         self.detail_box.setVisible(True)
 
     def add_saved_row(self, job):
+        # Append a job to the saved list; the model announces the single new row
         if not is_valid_job(job):
             return
+        self.saved_model.append_job(job)
 
-        row = self.saved_table.rowCount()
-        self.saved_table.insertRow(row)
-
-        # Title
-        self.saved_table.setItem(row, 0, QtWidgets.QTableWidgetItem(job.get("title", "")))
-
-        # Details button
-        details_btn = QtWidgets.QPushButton("Details")
-        details_btn.clicked.connect(lambda _, r=row: self.toggle_saved_detail_panel(r))
-        self.saved_table.setCellWidget(row, 1, details_btn)
-
-        # Company
-        self.saved_table.setItem(row, 2, QtWidgets.QTableWidgetItem(job.get("company", "")))
-
-        # Location
-        self.saved_table.setItem(row, 3, QtWidgets.QTableWidgetItem(job.get("location", "")))
-
-        # Status
-        combo = QtWidgets.QComboBox()
-        combo.addItems(["New", "Interested", "Applied", "Interview", "Rejected", "Accepted"])
-        combo.setCurrentText(job.get("status", "New"))
-        combo.setProperty("job_ref", job.get("refnr", ""))
-        combo.currentIndexChanged.connect(self.update_saved_status)
-        self.saved_table.setCellWidget(row, 4, combo)
-
-        # Notes
-        note_item = QtWidgets.QTableWidgetItem(job.get("notes", ""))
-        note_item.setFlags(note_item.flags() | QtCore.Qt.ItemIsEditable)
-        self.saved_table.setItem(row, 5, note_item)
-
-        # RefNr
-        self.saved_table.setItem(row, 6, QtWidgets.QTableWidgetItem(job.get("refnr", "N/A")))
-
-        # Link button
-        link_btn = QtWidgets.QPushButton("Zur Anzeige")
-        if job.get("link"):
-            link_btn.clicked.connect(lambda _, url=job["link"]: QtGui.QDesktopServices.openUrl(QtCore.QUrl(url)))
-        self.saved_table.setCellWidget(row, 7, link_btn)
-
-        # Manage files
-        manage_btn = QtWidgets.QPushButton("Dateien verwalten")
-        manage_btn.clicked.connect(lambda _, ref=job.get("refnr", ""): self.manage_files_dialog_by_ref(ref))
-        self.saved_table.setCellWidget(row, 8, manage_btn)
-
-        # Delete
-        delete_btn = QtWidgets.QPushButton("Löschen")
-        delete_btn.clicked.connect(lambda _, ref=job.get("refnr", ""): self.delete_saved_job_by_ref(ref))
-        self.saved_table.setCellWidget(row, 9, delete_btn)
-
-        self.saved_table.resizeColumnsToContents()
-        self.saved_table.resizeRowsToContents()
+    def on_saved_button(self, index):
+        # Button clicks arrive as proxy indexes; work on the underlying saved row
+        row = self.saved_proxy.mapToSource(index).row()
+        if row >= len(self.saved_jobs):
+            return
+        job = self.saved_jobs[row]
+        column = index.column()
+        if column == SavedJobsModel.COL_DETAILS:
+            self.toggle_saved_detail_panel(row)
+        elif column == SavedJobsModel.COL_LINK:
+            if job.get("link"):
+                QtGui.QDesktopServices.openUrl(QtCore.QUrl(job["link"]))
+        elif column == SavedJobsModel.COL_FILES:
+            self.manage_files_dialog_by_ref(job.get("refnr", ""))
+        elif column == SavedJobsModel.COL_DELETE:
+            self.delete_saved_job_by_ref(job.get("refnr", ""))
+
+    def on_saved_job_edited(self, row, field, old):
+        # Status or notes changed directly in the table
+        job = self.saved_jobs[row]
+        if field == "status":
+            self.journal.status_changed(job, old)
+        else:
+            self.journal.notes_changed(job)
+        if row == self.active_saved_row:
+            if field == "status":
+                self.status_input.setCurrentText(job.get("status", "New"))
+            elif field == "notes":
+                self.note_input.setText(job.get("notes", ""))
 
 
     def manage_files_dialog_by_ref(self, ref):
         # Find job index by its reference and open file dialog
-        idx = None
-        for i, j in enumerate(self.saved_jobs):
-            if str(j.get("refnr", "")) == str(ref):
-                idx = i
-                break
+        idx = self.saved_repo.row_of(ref)
         if idx is None:
             return
         self.manage_files_dialog(idx)
@@ -513,7 +928,7 @@ class MainWindow(QtWidgets.QMainWindow):
         add_btn.clicked.connect(add_files)
         open_btn.clicked.connect(open_file)
         remove_btn.clicked.connect(remove_file)
-        close_btn.clicked.connect(lambda: (save_jobs(self.saved_jobs), dialog.accept()))
+        close_btn.clicked.connect(lambda: (self.persistence.upsert(job, self.saved_jobs), dialog.accept()))
 
         dialog.exec_()
         # Refresh file list if this job is currently open
@@ -524,61 +939,20 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def delete_saved_job_by_ref(self, ref):
         # Remove a job by its reference number
-        idx = None
-        for i, j in enumerate(self.saved_jobs):
-            if str(j.get("refnr", "")) == str(ref):
-                idx = i
-                break
+        idx = self.saved_repo.row_of(ref)
         if idx is None:
             return
 
-        # Remove from data and file
-        del self.saved_jobs[idx]
-        save_jobs(self.saved_jobs)
-
-        # Remove from table view
-        for r in range(self.saved_table.rowCount()):
-            item = self.saved_table.item(r, 6)
-            if item and item.text() == str(ref):
-                self.saved_table.removeRow(r)
-                break
-
-    def update_saved_status(self):
-        # Update job status when a combobox changes
-        combo = self.sender()
-        if not combo:
-            return
-        ref = combo.property("job_ref")
-        new_status = combo.currentText()
-
-        # Update the saved job data
-        for job in self.saved_jobs:
-            if str(job.get("refnr", "")) == str(ref):
-                job["status"] = new_status
-                break
-        save_jobs(self.saved_jobs)
-
-        # Update the status text in the table for sorting purposes
-        for r in range(self.saved_table.rowCount()):
-            cell_widget = self.saved_table.cellWidget(r, 3)
-            if cell_widget is combo:
-                item = self.saved_table.item(r, 3)
-                if item:
-                    item.setText(new_status)
-                break
-
-    def update_saved_note(self, item):
-        # Save updated notes when edited in the table
-        if item.column() == 4:
-            ref_item = self.saved_table.item(item.row(), 5)
-            if not ref_item:
-                return
-            ref = ref_item.text()
-            for job in self.saved_jobs:
-                if str(job.get("refnr", "")) == str(ref):
-                    job["notes"] = item.text()
-                    break
-            save_jobs(self.saved_jobs)
+        # Keep the detail panel pointing at the right row
+        if self.active_saved_row == idx:
+            self.close_detail_panel()
+        elif self.active_saved_row is not None and self.active_saved_row > idx:
+            self.active_saved_row -= 1
+
+        # Remove from table view, data and file
+        self.journal.deleted(self.saved_jobs[idx])
+        self.saved_model.remove_row(idx)
+        self.persistence.delete(ref, self.saved_jobs)
 
     def open_job_link(self):
         # Open current job link in browser
@@ -587,51 +961,197 @@ class MainWindow(QtWidgets.QMainWindow):
 
 
     def load_saved_table(self):
-        self.saved_jobs = [job for job in load_jobs() if is_valid_job(job)]
-        self.saved_table.setSortingEnabled(False)
-        for job in self.saved_jobs:
-            self.add_saved_row(job)
-        self.saved_table.setSortingEnabled(True)
-        self.saved_table.resizeColumnsToContents()
+        # Parse storage once, then hand rows to the table in chunks
+        self.pending_saved = [job for job in load_jobs() if is_valid_job(job)]
+        # Edits of a session that ended before its journal was compacted
+        self.journal.replay(self.pending_saved)
+        self.pipeline_stats = PipelineStats(self.pending_saved)
+        self.journal.listeners = [self.pipeline_stats.apply]
+        self.pending_saved_pos = 0
+        self.saved_model.set_jobs([])
+        self.saved_fill_timer.start()
+
+    def fill_saved_chunk(self):
+        start = self.pending_saved_pos
+        chunk = self.pending_saved[start:start + SAVED_CHUNK]
+        self.pending_saved_pos += len(chunk)
+        self.saved_model.append_jobs(chunk)
+        if start == 0:
+            with span("table.resize_columns", table="saved"):
+                self.saved_table.resizeColumnsToContents()
+        if self.pending_saved_pos >= len(self.pending_saved):
+            self.saved_fill_timer.stop()
+            self.pending_saved = []
+            self.saved_loaded()
+
+    def finish_saved_load(self):
+        # Add the rows still waiting from startup right away
+        while self.saved_fill_timer.isActive():
+            self.fill_saved_chunk()
+
+    def saved_loaded(self):
+        # Hook for work that needs the complete saved list
+        self.compact_journal(force=True)
+
+    def compact_journal(self, force=False):
+        # Fold journaled edits into storage once enough of them piled up
+        if self.pending_saved or not (force or self.journal.due()):
+            return
+        self.journal.compact(self.persistence, self.saved_jobs)
 
-
-    def refresh_saved_table(self):
-        # Refresh the saved jobs table after any changes
-        self.saved_table.setSortingEnabled(False)
-        self.saved_table.setRowCount(0)
-        for job in self.saved_jobs:
-            self.add_saved_row(job)
-        self.saved_table.setSortingEnabled(True)
-        self.apply_saved_filter()
-        self.saved_table.resizeColumnsToContents()
+    def show_stats(self):
+        if self.stats_dialog is None or self.stats_dialog.stats is not self.pipeline_stats:
+            self.stats_dialog = StatsDialog(self.pipeline_stats, self)
+        self.stats_dialog.show()
+        self.stats_dialog.raise_()
 
     def export_to_csv(self):
-        # Export saved jobs to CSV file
+        # Export saved jobs (all, the filtered view or the selection) on a background thread
         if not self.saved_jobs:
             QtWidgets.QMessageBox.information(
                 self, "Keine Daten", "Es gibt keine gespeicherten Jobs zum Exportieren."
             )
             return
+        if self.export_worker is not None:
+            QtWidgets.QMessageBox.information(self, "Export läuft", "Es läuft bereits ein Export.")
+            return
 
-        path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self, "CSV speichern", "saved_jobs.csv", "CSV-Dateien (*.csv)"
+        jobs = self.choose_export_jobs()
+        if jobs is None:
+            return
+
+        path, selected = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Export speichern", "saved_jobs.csv",
+            "CSV-Dateien (*.csv);;CSV gzip (*.csv.gz);;JSON Lines (*.jsonl);;JSON Lines gzip (*.jsonl.gz)"
         )
         if not path:
             return
+        suffix = selected[selected.find("*") + 1:selected.find(")")] if "*" in selected else ""
+        if suffix and not path.lower().endswith(suffix):
+            path += suffix
+
+        progress = QtWidgets.QProgressDialog("Exportiere Jobs...", "Abbrechen", 0, len(jobs), self)
+        progress.setWindowTitle("Export")
+        progress.setMinimumDuration(300)
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
+
+        worker = ExportWorker(jobs, path, self)
+        worker.progress.connect(lambda done, total: progress.setValue(done))
+        worker.export_done.connect(self.on_export_done)
+        worker.export_failed.connect(self.on_export_failed)
+        worker.export_cancelled.connect(lambda: self.statusBar().showMessage("Export abgebrochen", 5000))
+        worker.finished.connect(progress.close)
+        worker.finished.connect(self.on_export_finished)
+        progress.canceled.connect(worker.cancel)
+        self.export_worker = worker
+        worker.start()
+
+    def import_jobs(self):
+        # Add jobs from a CSV/JSONL export; duplicates and invalid rows are skipped
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self, "Jobs importieren", "",
+            "Exporte (*.csv *.csv.gz *.jsonl *.jsonl.gz);;Alle Dateien (*)"
+        )
+        if not path:
+            return
+        self.finish_saved_load()  # duplicate check needs every saved job
 
+        QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.WaitCursor)
         try:
-            with open(path, mode='w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=[
-                    "title", "company", "location", "status", "notes", "refnr", "link", "files"
-                ])
-                writer.writeheader()
-                for job in self.saved_jobs:
-                    row = job.copy()
-                    row["files"] = "; ".join(job.get("files", []))
-                    writer.writerow(row)
-            QtWidgets.QMessageBox.information(self, "Erfolg", f"Datei wurde gespeichert:\n{path}")
+            with span("import.read", path=path):
+                result = collect_new(read_records(path), self.saved_repo)
+            # One insert for the table and one batched write for storage
+            self.journal.added(result.jobs)
+            self.saved_model.append_jobs(result.jobs)
+            self.persistence.upsert_many(result.jobs, self.saved_jobs)
         except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "Fehler", f"Export fehlgeschlagen:\n{e}")
+            QtWidgets.QMessageBox.critical(self, "Fehler", f"Import fehlgeschlagen:\n{e}")
+            return
+        finally:
+            QtWidgets.QApplication.restoreOverrideCursor()
+        QtWidgets.QMessageBox.information(self, "Import", result.summary())
+
+    def check_saved_jobs(self):
+        # Second click cancels a running check
+        if self.liveness_worker is not None:
+            self.liveness_worker.cancel()
+            self.check_button.setEnabled(False)
+            return
+        self.finish_saved_load()
+        jobs = due_jobs(self.saved_jobs)
+        if not jobs:
+            self.statusBar().showMessage("Alle gespeicherten Jobs wurden in den letzten 24 Stunden geprüft", 5000)
+            return
+        etags = {job["refnr"]: job["etag"] for job in jobs if job.get("etag")}
+        worker = LivenessWorker([job["refnr"] for job in jobs], etags, parent=self)
+        worker.results_ready.connect(self.on_liveness_results)
+        worker.progress.connect(
+            lambda done, total: self.statusBar().showMessage(f"Prüfe Anzeigen: {done} von {total}"))
+        worker.check_done.connect(self.on_liveness_done)
+        worker.finished.connect(self.on_liveness_finished)
+        self.liveness_worker = worker
+        self.check_button.setText("Prüfung abbrechen")
+        worker.start()
+
+    def on_liveness_results(self, results):
+        changed = []
+        rows = []
+        for refnr, online, etag, checked in results:
+            job = self.saved_repo.find(refnr)
+            if job is None or online is None:  # deleted meanwhile, or the check failed
+                continue
+            job["online"] = online
+            job["last_checked"] = checked
+            if etag:
+                job["etag"] = etag
+            changed.append(job)
+            rows.append(self.saved_repo.row_of(refnr))
+        self.saved_model.rows_flagged(row for row in rows if row is not None)
+        if changed:
+            self.persistence.upsert_many(changed, self.saved_jobs)
+
+    def on_liveness_done(self, checked, offline):
+        self.statusBar().showMessage(f"{checked} Anzeigen geprüft, {offline} nicht mehr online", 10000)
+
+    def on_liveness_finished(self):
+        self.liveness_worker = None
+        self.check_button.setText("Online prüfen")
+        self.check_button.setEnabled(True)
+
+    def choose_export_jobs(self):
+        # Tuple of the job dicts to export; only references, rows are built while writing
+        choices = [(f"Alle gespeicherten Jobs ({len(self.saved_jobs)})", "all")]
+        if self.saved_proxy.rowCount() != len(self.saved_jobs):
+            choices.append((f"Gefilterte Ansicht ({self.saved_proxy.rowCount()})", "view"))
+        selected = self.saved_table.selectionModel().selectedRows()
+        if selected:
+            choices.append((f"Auswahl ({len(selected)})", "selection"))
+
+        scope = "all"
+        if len(choices) > 1:
+            label, ok = QtWidgets.QInputDialog.getItem(
+                self, "Export", "Welche Jobs exportieren?", [c[0] for c in choices], 0, False
+            )
+            if not ok:
+                return None
+            scope = dict(choices)[label]
+
+        if scope == "view":
+            return tuple(self.saved_jobs[row] for row in self.saved_proxy.source_rows())
+        if scope == "selection":
+            rows = sorted(self.saved_proxy.mapToSource(index).row() for index in selected)
+            return tuple(self.saved_jobs[row] for row in rows)
+        return tuple(self.saved_jobs)
+
+    def on_export_done(self, count, path):
+        QtWidgets.QMessageBox.information(self, "Erfolg", f"{count} Jobs gespeichert:\n{path}")
+
+    def on_export_failed(self, message):
+        QtWidgets.QMessageBox.critical(self, "Fehler", f"Export fehlgeschlagen:\n{message}")
+
+    def on_export_finished(self):
+        self.export_worker = None
 
     def add_file_to_current_job(self, filepath):
         # Add a file to the current job's file list
@@ -645,7 +1165,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if filepath and filepath not in files:
             files.append(filepath)
             self.file_list_widget.addItem(filepath)
-            save_jobs(self.saved_jobs)
+            self.persistence.upsert(job, self.saved_jobs)
 
     def add_files_dialog(self):
         # Open file dialog to add files to current job
@@ -681,7 +1201,7 @@ class MainWindow(QtWidgets.QMainWindow):
             if file_path in files:
                 files.remove(file_path)
             self.file_list_widget.takeItem(self.file_list_widget.row(it))
-        save_jobs(self.saved_jobs)
+        self.persistence.upsert(job, self.saved_jobs)
 
     def close_detail_panel(self):
         self.detail_box.setVisible(False)
@@ -689,64 +1209,154 @@ class MainWindow(QtWidgets.QMainWindow):
         self.saved_table.clearSelection()
         self.active_saved_row = None
 
-        if hasattr(self, "active_search_row"):
+        if getattr(self, "active_search_row", None) is not None:
             self.update_detail_button_text(self.active_search_row, "Details")
             self.active_search_row = None
 
+    def restart_filter_timer(self, timer, text):
+        # One or two letters match most rows and have no trigrams to look up: wait longer for more
+        words = text.split()
+        timer.start(FILTER_DELAY_SHORT if words and min(map(len, words)) < 3 else FILTER_DELAY)
+
     def apply_saved_filter(self):
         # Filter saved jobs table based on text input
-        text = self.saved_filter.text().strip().lower()
-        for r in range(self.saved_table.rowCount()):
-            row_visible = True
-            if text:
-                row_visible = False
-                for c in [0, 1, 2, 3, 4, 5]:
-                    item = self.saved_table.item(r, c)
-                    if item and text in item.text().lower():
-                        row_visible = True
-                        break
-            self.saved_table.setRowHidden(r, not row_visible)
+        with span("filter.saved"):
+            self.saved_proxy.set_filter_text(self.saved_filter.text())
+
+    def choose_home(self):
+        # Coordinates or a place from the current results; an empty entry removes the home location
+        text, ok = QtWidgets.QInputDialog.getText(
+            self, "Wohnort", "Breitengrad, Längengrad oder ein Ort aus den Suchergebnissen\n"
+            "(leer lassen zum Entfernen):", text=self.home[2] if self.home else "")
+        if not ok:
+            return
+        home = None
+        if text.strip():
+            home = parse_home(text, self.results_model.jobs)
+            if home is None:
+                QtWidgets.QMessageBox.warning(
+                    self, "Wohnort", "Ort nicht gefunden. Gib Koordinaten ein (z.B. 52.52, 13.40) "
+                    "oder einen Ort, der in den Suchergebnissen vorkommt.")
+                return
+        self.home = home
+        save_home(home)
+        self.apply_home()
+
+    def apply_home(self):
+        # Distances of the whole result set are recomputed in one pass
+        home = self.home[:2] if self.home else None
+        self.results_model.set_home(home)
+        if self.full_results_model is not self.results_model:
+            self.full_results_model.set_home(home)
+        self.results_table.setColumnHidden(ResultsTableModel.COL_DISTANCE, home is None)
+        self.home_button.setText(f"Wohnort: {self.home[2]}" if self.home else "Wohnort festlegen...")
+        self.radius_input.setEnabled(home is not None and not isinstance(self.results_model, PagedResultsModel))
+        self.apply_radius_filter()
+
+    def apply_radius_filter(self):
+        radius = self.radius_input.value()
+        model = self.results_model
+        if not radius or model.home is None:
+            if self.results_proxy.row_filter is not None:
+                self.results_proxy.set_row_filter(None)
+            return
+
+        def within(row):
+            distance = model.distance(row)
+            return distance is not None and distance <= radius
+
+        with span("filter.radius"):
+            self.results_proxy.set_row_filter(within)
 
     def apply_results_filter(self):
         # Filter search results table based on text input
-        text = self.results_filter.text().strip().lower()
-        for r in range(self.results_table.rowCount()):
-            row_visible = True
-            if text:
-                row_visible = False
-                for c in [0, 1, 2, 3]:
-                    item = self.results_table.item(r, c)
-                    if item and text in item.text().lower():
-                        row_visible = True
-                        break
-            self.results_table.setRowHidden(r, not row_visible)
+        with span("filter.results"):
+            self.results_proxy.set_filter_text(self.results_filter.text())
 
     def eventFilter(self, source, event):
         # Close detail panel when clicking outside of tables
         if event.type() == QtCore.QEvent.MouseButtonPress:
-            if self.detail_box.isVisible():
-                if source == self.results_table:
-                    idx = source.indexAt(event.pos())
-                    if not idx.isValid():  # Clicked empty area
-                        self.close_detail_panel()
-                elif source == self.saved_table:
-                    idx = source.indexAt(event.pos())
-                    if not idx.isValid():  # Clicked empty area
-                        self.close_detail_panel()
-                elif isinstance(source, QtWidgets.QHeaderView):
-                    # Clicked header (sorting) – do nothing
-                    pass
-                else:
-                    # Click outside tables and detail
-                    detail_rect = QtCore.QRect(
-                        self.detail_box.mapToGlobal(QtCore.QPoint(0, 0)), self.detail_box.size()
-                    )
-                    if not detail_rect.contains(event.globalPos()):
-                        self.close_detail_panel()
+            with span("ui.event_filter"):
+                if self.detail_box.isVisible():
+                    if source in (self.results_table, self.results_table.viewport()):
+                        idx = self.results_table.indexAt(event.pos())
+                        if not idx.isValid():  # Clicked empty area
+                            self.close_detail_panel()
+                    elif source in (self.saved_table, self.saved_table.viewport()):
+                        idx = self.saved_table.indexAt(event.pos())
+                        if not idx.isValid():  # Clicked empty area
+                            self.close_detail_panel()
+                    elif isinstance(source, QtWidgets.QHeaderView):
+                        # Clicked header (sorting) – do nothing
+                        pass
+                    else:
+                        # Click outside tables and detail
+                        detail_rect = QtCore.QRect(
+                            self.detail_box.mapToGlobal(QtCore.QPoint(0, 0)), self.detail_box.size()
+                        )
+                        if not detail_rect.contains(event.globalPos()):
+                            self.close_detail_panel()
         return super().eventFilter(source, event)
 
+    def update_save_stats(self):
+        stats = self.persistence.stats()
+        if stats["requests"]:
+            self.save_stats_label.setText(
+                f"Gespeichert: {stats['writes']} Schreibvorgänge, {stats['writes_avoided']} eingespart, "
+                f"Ø {stats['avg_latency_ms']} ms"
+            )
+
+    def closeEvent(self, event):
+        # Let running search threads finish before the window goes away
+        self.cancel_search()
+        for worker in list(self.running_workers):
+            worker.wait(2000)
+        if self.export_worker is not None:
+            self.export_worker.cancel()
+            self.export_worker.wait(2000)
+        self.detail_fetcher.shutdown()
+        if isinstance(self.results_model, PagedResultsModel):
+            self.results_model.shutdown()
+        if self.liveness_worker is not None:
+            self.liveness_worker.cancel()
+            self.liveness_worker.wait(2000)
+        self.search_scheduler.stop()
+        # Write everything that is still pending
+        self.finish_saved_load()
+        self.journal.close(self.persistence, self.saved_jobs)
+        if instrumentation.enabled:
+            instrumentation.write_trace()
+        super().closeEvent(event)
+
+class StartupProfiler(QtCore.QObject):
+    """Reports time to first paint and time until the saved table is filled, then quits."""
+
+    def __init__(self, window):
+        super().__init__(window)
+        self.window = window
+        self.first_paint = None
+        window.installEventFilter(self)
+        loaded = window.saved_loaded
+        window.saved_loaded = lambda: (loaded(), QtCore.QTimer.singleShot(0, self.interactive))
+
+    def eventFilter(self, source, event):
+        if self.first_paint is None and event.type() == QtCore.QEvent.Paint:
+            self.first_paint = time.perf_counter() - _START
+        return False
+
+    def interactive(self):
+        ready = time.perf_counter() - _START
+        # No Paint event reaches the filter with a minimised window or some platform plugins
+        paint = "n/a" if self.first_paint is None else f"{self.first_paint * 1000:.1f} ms"
+        print(f"time-to-first-paint: {paint}", file=sys.stderr)
+        print(f"time-to-interactive: {ready * 1000:.1f} ms ({len(self.window.saved_jobs)} saved jobs)",
+              file=sys.stderr)
+        QtWidgets.QApplication.instance().quit()
+
 if __name__ == "__main__":
-    app = QtWidgets.QApplication([])
+    app = QtWidgets.QApplication(sys.argv)
     win = MainWindow()
+    if "--profile-startup" in sys.argv:
+        profiler = StartupProfiler(win)
     win.show()
     app.exec_()
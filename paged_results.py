@@ -0,0 +1,259 @@
+# paged_results.py
+# Results model that loads API pages on demand and keeps only a window of them in memory
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5 import QtCore
+import job_api
+from job_api import PAGE_SIZE, total_hits
+from job_records import JobRecord
+from job_geo import distances_km
+from job_index import SearchIndex
+from table_models import ResultColumns, ResultCells
+from instrumentation import span
+
+WINDOW_PAGES = 8         # Pages kept in memory, the ones farthest from the viewed rows are dropped
+PAGE_WORKERS = 2         # Parallel page requests
+PREFETCH_ROWS = 50       # Request the next page this many rows before the end
+RETRY_DELAY = 5.0        # Seconds before a failed page is requested again
+
+class PagedRows:
+    """Sequence view over the loaded rows; rows of evicted pages are None until they are back."""
+
+    def __init__(self, model):
+        self._model = model
+
+    def __len__(self):
+        return self._model.loaded_rows
+
+    def __getitem__(self, row):
+        if not 0 <= row < self._model.loaded_rows:
+            raise IndexError(row)
+        return self._model.record(row)
+
+    def __iter__(self):
+        return (self._model.record(row, fetch=False) for row in range(self._model.loaded_rows))
+
+class PagedResultsModel(QtCore.QAbstractTableModel, ResultColumns):
+    """
+    Search results for one query, fetched a page at a time as the view scrolls.
+
+    The view asks for more rows through canFetchMore()/fetchMore() when it
+    reaches the bottom; painting rows close to the end requests the next page
+    a little earlier. At most window_pages pages are held; the pages farthest
+    from the rows last painted are dropped and fetched again (through the
+    client's response cache) when they scroll back into view. Filtering and
+    sorting need every row and are not offered in this mode; search_index
+    stays empty and only serves the proxy. Cells are drawn by ResultCells,
+    like in ResultsTableModel; near-duplicate groups need every row as well,
+    so only the marker for saved look-alikes is shown.
+    """
+
+    total_known = QtCore.pyqtSignal(int)
+    page_loaded = QtCore.pyqtSignal(int)          # loaded rows
+    page_failed = QtCore.pyqtSignal(int, str)     # page, error
+
+    # Results from the pool threads, delivered on the GUI thread
+    _page_ready = QtCore.pyqtSignal(int, int, list)   # page, hit count, records
+    _page_error = QtCore.pyqtSignal(int, str)
+
+    def __init__(self, params, client=None, page_size=PAGE_SIZE, window_pages=WINDOW_PAGES,
+                 force_refresh=False, parent=None):
+        super().__init__(parent)
+        self.params = dict(params)
+        self.client = client
+        self.page_size = page_size
+        self.window_pages = max(2, window_pages)
+        self.force_refresh = force_refresh
+        self.jobs = PagedRows(self)
+        self.search_index = SearchIndex()
+        self.open_row = None       # Row whose detail panel is open
+        self.home = None           # (lat, lon) or None
+        self.near_saved = None
+        self.cells = ResultCells(self)
+        self.total = None          # Hit count, known after the first page
+        self.loaded_rows = 0       # Rows the view knows about
+        self.complete = False      # The last page has arrived
+        self._pages = {}           # page number -> list of JobRecords
+        self._pending = set()      # pages requested but not back yet
+        self._failed = {}          # page -> time of the failure
+        self._focus = 1            # page of the row painted last
+        self._closed = False
+        self._pool = ThreadPoolExecutor(max_workers=PAGE_WORKERS, thread_name_prefix="pages")
+        self._page_ready.connect(self._store_page)
+        self._page_error.connect(self._page_error_received)
+
+    def start(self):
+        """Request the first page."""
+        self._request(1)
+
+    def shutdown(self):
+        self._closed = True
+        self._pool.shutdown(wait=False)
+
+    # --- Pages ---
+
+    def _page_of(self, row):
+        return row // self.page_size + 1
+
+    def _request(self, page, force_refresh=False):
+        if self._closed or page in self._pending:
+            return
+        failed = self._failed.get(page)
+        if failed is not None and time.monotonic() - failed < RETRY_DELAY:
+            return
+        self._pending.add(page)
+        self._pool.submit(self._fetch, page, force_refresh)
+
+    def _fetch(self, page, force_refresh):
+        # Runs on a pool thread; records are decoded here, off the GUI thread
+        try:
+            client = self.client or job_api.get_client()
+            payload = client.search_page(self.params, page, self.page_size, force_refresh)
+            records = [JobRecord.from_api(job) for job in payload.get("stellenangebote", [])]
+            total = total_hits(payload)
+        except Exception as e:
+            if not self._closed:
+                self._page_error.emit(page, str(e))
+            return
+        if not self._closed:
+            self._page_ready.emit(page, total, records)
+
+    def _store_page(self, page, total, records):
+        if self._closed:
+            return
+        self._pending.discard(page)
+        self._failed.pop(page, None)
+        with span("table.paged_store", page=page, rows=len(records)):
+            if self.total is None:
+                self.total = total
+                self.total_known.emit(total)
+            self._pages[page] = records
+            self._evict()
+            first = (page - 1) * self.page_size
+            if first == self.loaded_rows:
+                # The next page at the end: new rows for the view
+                if len(records) < self.page_size or first + len(records) >= self.total:
+                    self.complete = True
+                if records:
+                    self.beginInsertRows(QtCore.QModelIndex(), first, first + len(records) - 1)
+                    self.loaded_rows += len(records)
+                    self.endInsertRows()
+            elif first < self.loaded_rows:
+                # A page that was dropped earlier is back
+                last = min(first + self.page_size, self.loaded_rows) - 1
+                self.dataChanged.emit(self.index(first, 0), self.index(last, self.columnCount() - 1))
+        self.page_loaded.emit(self.loaded_rows)
+
+    def _page_error_received(self, page, message):
+        if self._closed:
+            return
+        self._pending.discard(page)
+        self._failed[page] = time.monotonic()
+        self.page_failed.emit(page, message)
+
+    def _evict(self):
+        # Drop the pages farthest from where the user is looking
+        while len(self._pages) > self.window_pages:
+            far = max(self._pages, key=lambda p: abs(p - self._focus))
+            del self._pages[far]
+
+    def record(self, row, fetch=True):
+        """JobRecord for row, or None while its page is (re)loading."""
+        page = self._page_of(row)
+        records = self._pages.get(page)
+        if fetch:
+            self._focus = page
+            if records is None:
+                self._request(page)
+            elif row >= self.loaded_rows - PREFETCH_ROWS and self.canFetchMore():
+                self.fetchMore()
+        if records is None:
+            return None
+        offset = row - (page - 1) * self.page_size
+        return records[offset] if offset < len(records) else None
+
+    def pages_in_memory(self):
+        return sorted(self._pages)
+
+    # --- Lazy loading interface of QAbstractItemModel ---
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()):
+        if parent.isValid() or self._closed or self.total is None or self.complete:
+            return False
+        return self.loaded_rows < self.total
+
+    def fetchMore(self, parent=QtCore.QModelIndex()):
+        if not parent.isValid():
+            self._request(self._page_of(self.loaded_rows), self.force_refresh)
+
+    # --- Table model ---
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else self.loaded_rows
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        header = self.cells.header(section, orientation, role)
+        return header if header is not None else super().headerData(section, orientation, role)
+
+    def text(self, row, column):
+        job = self.record(row)
+        if job is None:
+            return "Lade..." if column == self.COL_TITLE else ""
+        return self.cells.text(row, job, column)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        return self.cells.data(index, role)
+
+    def sort_key(self, row, column):
+        job = self.record(row, fetch=False)
+        return self.cells.sort_key(row, job, column) if job is not None else ""
+
+    def link(self, row):
+        job = self.record(row)
+        return job.link if job is not None else ""
+
+    def saved_matches(self, job):
+        """Saved job dicts that look like near duplicates of job (a JobRecord)."""
+        return self.cells.saved_matches(job)
+
+    def group_of(self, row):
+        return None
+
+    def group_members(self, row):
+        return ()
+
+    def distance(self, row):
+        # Computed per row; only the rows in view are ever asked for
+        job = self.record(row, fetch=False)
+        if self.home is None or job is None:
+            return None
+        distance = distances_km(self.home, [job.lat], [job.lon])[0]
+        return None if distance != distance else distance
+
+    def set_home(self, home):
+        self.beginResetModel()
+        self.home = home
+        self.endResetModel()
+
+    def set_open_row(self, row):
+        self.cells.set_open_row(row)
+
+    def saved_changed(self):
+        self.cells.saved_changed()
+
+    def clear(self):
+        self.beginResetModel()
+        self._pages.clear()
+        self._pending.clear()
+        self._failed.clear()
+        self.total = None
+        self.loaded_rows = 0
+        self.complete = False
+        self.open_row = None
+        self.cells.clear()
+        self.endResetModel()
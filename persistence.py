@@ -0,0 +1,211 @@
+# persistence.py
+# Write-behind saving: edits are collected for a short moment and written on a background thread
+
+import time
+import atexit
+import threading
+
+from job_data import get_storage
+from instrumentation import span
+
+def _snapshot(job):
+    # Shallow copy with copied lists, so later edits do not race with the writer
+    return {k: (list(v) if isinstance(v, list) else v) for k, v in job.items()}
+
+class SaveScheduler:
+    """
+    Collects changes to saved jobs and writes them in batches.
+
+    A write happens once no new change arrived for `delay` seconds, but at
+    the latest `max_delay` seconds after the first pending change. Several
+    edits of the same job end up as one write. flush() blocks until all
+    pending changes are on disk and is also called at interpreter exit.
+
+    Every scheduling call returns a generation number; stored(generation)
+    tells whether that change is on disk. A failed write is queued again
+    and retried with the next batch.
+    """
+
+    def __init__(self, storage=None, delay=0.5, max_delay=2.0):
+        self.storage = storage or get_storage()
+        self._rewrites_all = getattr(self.storage, "rewrites_all", False)
+        self.delay = delay
+        self.max_delay = max_delay
+
+        self._cond = threading.Condition()
+        self._upserts = {}      # refnr -> job snapshot
+        self._deletes = set()
+        self._jobs = None       # Copy of the full list, for backends that rewrite everything
+        self._first_change = None
+        self._last_change = None
+        self._writing = False
+        self._closed = False
+        self._generation = 0    # Changes scheduled so far
+        self._attempted = 0     # Generation of the last write that finished, successful or not
+        self._stored = 0        # Generation of the last successful write
+
+        # Metrics
+        self.requests = 0
+        self.writes = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.last_latency = 0.0
+
+        self._thread = threading.Thread(target=self._run, name="SaveScheduler", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def upsert(self, job, jobs):
+        """Schedule a write of one added or changed job."""
+        ref = job.get("refnr")
+        with self._cond:
+            if ref:
+                self._upserts[ref] = _snapshot(job)
+                self._deletes.discard(ref)
+            return self._mark(jobs)
+
+    def delete(self, refnr, jobs):
+        """Schedule the removal of one job."""
+        with self._cond:
+            self._upserts.pop(refnr, None)
+            self._deletes.add(refnr)
+            return self._mark(jobs)
+
+    def upsert_many(self, changed, jobs):
+        """Schedule a write of several added or changed jobs as one batch."""
+        with self._cond:
+            for job in changed:
+                if job.get("refnr"):
+                    self._upserts[job["refnr"]] = _snapshot(job)
+                    self._deletes.discard(job["refnr"])
+            return self._mark(jobs)
+
+    def save_all(self, jobs):
+        """Schedule a write of every job, e.g. after a bulk change."""
+        with self._cond:
+            for job in jobs:
+                if job.get("refnr"):
+                    self._upserts[job["refnr"]] = _snapshot(job)
+            return self._mark(jobs)
+
+    def _mark(self, jobs):
+        now = time.monotonic()
+        self.requests += 1
+        if self._rewrites_all:
+            # Copied here, on the caller's thread, so the writer never reads the live dicts
+            self._jobs = [_snapshot(job) for job in jobs]
+        if self._first_change is None:
+            self._first_change = now
+        self._last_change = now
+        self._generation += 1
+        self._cond.notify_all()
+        return self._generation
+
+    def _pending(self):
+        return self._first_change is not None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending() and not self._closed:
+                    self._cond.wait()
+                if not self._pending() and self._closed:
+                    return
+                # Debounce: wait until changes stop coming in, bounded by max_delay
+                while not self._closed:
+                    now = time.monotonic()
+                    due = min(self._last_change + self.delay, self._first_change + self.max_delay)
+                    if now >= due:
+                        break
+                    self._cond.wait(due - now)
+                upserts = list(self._upserts.values())
+                deletes = set(self._deletes)
+                jobs, self._jobs = self._jobs, None
+                generation = self._generation
+                self._upserts.clear()
+                self._deletes.clear()
+                self._first_change = self._last_change = None
+                self._writing = True
+
+            start = time.perf_counter()
+            try:
+                with span("save.apply", upserts=len(upserts), deletes=len(deletes)):
+                    ok = self.storage.apply(upserts, deletes, jobs) is not False
+            except Exception as e:
+                print(f"Fehler beim Speichern: {e}")
+                ok = False
+            latency = time.perf_counter() - start
+
+            with self._cond:
+                self._writing = False
+                self._attempted = generation
+                if ok:
+                    self._stored = generation
+                elif not self._closed:
+                    self._requeue(upserts, deletes, jobs)
+                self.writes += 1
+                self.last_latency = latency
+                self.total_latency += latency
+                self.max_latency = max(self.max_latency, latency)
+                self._cond.notify_all()
+
+    def _requeue(self, upserts, deletes, jobs):
+        # Put a failed batch back, behind changes that were scheduled during the write
+        for job in upserts:
+            if job["refnr"] not in self._upserts and job["refnr"] not in self._deletes:
+                self._upserts[job["refnr"]] = job
+        self._deletes.update(ref for ref in deletes if ref not in self._upserts)
+        if self._jobs is None:
+            self._jobs = jobs
+        now = time.monotonic()
+        if self._first_change is None:
+            self._first_change = now
+        self._last_change = now
+
+    def flush(self, timeout=None):
+        """Write pending changes now and wait for the write; False if it failed or timed out."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            target = self._generation
+            # Also waits for the retry of a failed batch, which keeps its generation
+            writes = self.writes + self._writing + self._pending()
+            if self._pending():
+                self._first_change = time.monotonic() - self.max_delay
+                self._cond.notify_all()
+            while self._attempted < target or self.writes < writes or self._writing:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return self._stored >= target
+
+    def stored(self, generation):
+        """True once the change that returned generation was written successfully."""
+        with self._cond:
+            return self._stored >= generation
+
+    def idle(self):
+        """True when no change is waiting or being written."""
+        with self._cond:
+            return not self._pending() and not self._writing
+
+    def close(self):
+        """Flush and stop the writer thread."""
+        if self._closed:
+            return
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join()
+
+    def stats(self):
+        with self._cond:
+            return {
+                "requests": self.requests,
+                "writes": self.writes,
+                "writes_avoided": max(0, self.requests - self.writes),
+                "last_latency_ms": round(self.last_latency * 1000, 2),
+                "avg_latency_ms": round(self.total_latency / self.writes * 1000, 2) if self.writes else 0.0,
+                "max_latency_ms": round(self.max_latency * 1000, 2),
+            }
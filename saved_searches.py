@@ -0,0 +1,110 @@
+# saved_searches.py
+# Saved search definitions and the per-search diff of new postings (no Qt imports)
+
+import os
+import json
+import time
+
+from job_data import SAVE_DIR
+from job_records import JobRecord, build_search_queries, has_refnr
+
+SEARCHES_FILE = os.path.join(SAVE_DIR, "saved_searches.json")
+DEFAULT_INTERVAL = 60     # Minutes between runs
+
+class SavedSearch:
+    """
+    One search definition plus what the last run saw.
+
+    queries is the fan-out of the search form, [(label, params)] as built by
+    build_search_queries(), and runs like an interactive search. seen holds
+    the refnrs of the last successful result list only, so it stays as large
+    as one result list; a posting that vanished and comes back counts as new
+    again. seen is None until a run succeeded: that run is the baseline and
+    reports nothing new.
+    new holds the JobRecords found since the user last looked.
+    """
+
+    def __init__(self, name, queries, interval=DEFAULT_INTERVAL, last_run=0.0, seen=None, new=None):
+        self.name = name
+        self.queries = [(label, dict(params)) for label, params in queries]
+        self.interval = interval
+        self.last_run = last_run
+        self.seen = set(seen) if seen is not None else None
+        self.new = list(new or ())
+
+    def to_dict(self):
+        return {"name": self.name, "queries": [[label, params] for label, params in self.queries],
+                "interval": self.interval, "last_run": self.last_run, "seen": sorted(self.seen) if self.seen is not None else None,
+                "new": [record.to_dict() for record in self.new]}
+
+    @classmethod
+    def from_dict(cls, data):
+        queries = data.get("queries")
+        if queries is None:
+            # Older files kept the form fields, "Koch, Bäcker" as one string
+            params = data.get("params", {})
+            queries = build_search_queries(**{key: params.get(key, "") for key in
+                                              ("was", "wo", "berufsfeld", "angebotsart", "umkreis")})
+        # Older files kept new postings as API results
+        new = [JobRecord.from_api(item) if "titel" in item else JobRecord.from_dict(item)
+               for item in data.get("new") or ()]
+        return cls(data["name"], queries, data.get("interval", DEFAULT_INTERVAL),
+                   data.get("last_run", 0.0), data.get("seen"), new)
+
+    def due(self, now=None):
+        return (now or time.time()) >= self.last_run + self.interval * 60
+
+    def merge_results(self, records, now=None):
+        """Record a run's JobRecords and return the ones not seen before."""
+        refnrs = {record.refnr for record in records if has_refnr(record.refnr)}
+        fresh = [] if self.seen is None else [r for r in records if has_refnr(r.refnr) and r.refnr not in self.seen]
+        known = {record.refnr for record in self.new}
+        self.new.extend(r for r in fresh if r.refnr not in known)
+        self.seen = refnrs
+        self.last_run = now or time.time()
+        return fresh
+
+    def run_failed(self, now=None):
+        """Try again after the normal interval; seen, and so the baseline, stays as it was."""
+        self.last_run = now or time.time()
+
+    def mark_read(self):
+        self.new = []
+
+class SavedSearchStore:
+    """Saved searches in a small JSON file next to the saved jobs."""
+
+    def __init__(self, path=SEARCHES_FILE):
+        self.path = path
+        self.searches = []
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.searches = [SavedSearch.from_dict(d) for d in json.load(f)]
+        except (OSError, ValueError, KeyError):
+            self.searches = []
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump([s.to_dict() for s in self.searches], f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def find(self, name):
+        return next((s for s in self.searches if s.name == name), None)
+
+    def add(self, name, queries, interval=DEFAULT_INTERVAL):
+        """Add or replace the search with this name; queries as built by build_search_queries()."""
+        self.remove(name)
+        search = SavedSearch(name, queries, interval)
+        self.searches.append(search)
+        return search
+
+    def remove(self, name):
+        self.searches = [s for s in self.searches if s.name != name]
+
+    def unread(self):
+        return sum(len(s.new) for s in self.searches)
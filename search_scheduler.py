@@ -0,0 +1,171 @@
+# search_scheduler.py
+# Re-runs saved searches in the background and keeps the count of new postings
+
+import time
+
+from PyQt5 import QtCore, QtWidgets
+from search_worker import SearchWorker
+
+class SearchScheduler(QtCore.QObject):
+    """
+    Runs due saved searches one at a time in the background.
+
+    Each run is a SearchWorker over the search's queries, like an interactive
+    fan-out search, and goes through the shared API client, so it uses the
+    same connection pool and rate limit. Two runs start at least `stagger`
+    seconds apart, so searches that fall due together are spread out instead
+    of firing at once. Results are merged into the SavedSearch objects on
+    the GUI thread.
+    """
+
+    search_finished = QtCore.pyqtSignal(str, int)    # name, new postings
+    search_failed = QtCore.pyqtSignal(str, str)
+    badge_changed = QtCore.pyqtSignal(int)
+
+    def __init__(self, store, check_interval=30, stagger=20, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.stagger = stagger
+        self._worker = None
+        self._running = None
+        self._records = []         # JobRecords of the running search
+        self._errors = []          # Failed queries of the running search
+        self._forced = []
+        self._next_start = 0.0
+        self._stopped = False
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(check_interval * 1000)
+        self.timer.timeout.connect(self._tick)
+
+    def start(self, delay=10):
+        # The first check waits a little so start-up work comes first
+        self.timer.start()
+        QtCore.QTimer.singleShot(delay * 1000, self._tick)
+
+    def stop(self):
+        self._stopped = True
+        self.timer.stop()
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker.wait(2000)
+
+    def run_now(self, name):
+        if name not in self._forced:
+            self._forced.append(name)
+        self._next_start = 0.0
+        self._tick()
+
+    def unread(self):
+        return self.store.unread()
+
+    def _tick(self):
+        if self._stopped or self._running is not None or time.monotonic() < self._next_start:
+            return
+        search = None
+        while self._forced and search is None:
+            search = self.store.find(self._forced.pop(0))
+        if search is None:
+            due = [s for s in self.store.searches if s.due()]
+            if not due:
+                return
+            search = min(due, key=lambda s: s.last_run)
+        self._running = search.name
+        self._records = []
+        self._errors = []
+        # Saved searches look for what is new, so the response cache is bypassed
+        worker = SearchWorker(0, search.queries, force_refresh=True, parent=self)
+        worker.batch_ready.connect(lambda generation, records: self._records.extend(records))
+        worker.query_failed.connect(lambda generation, label, error: self._errors.append(
+            f"{label}: {error}" if label else error))
+        worker.search_done.connect(lambda generation, count: self._done(worker))
+        worker.search_failed.connect(lambda generation, error: self._done(worker))
+        worker.finished.connect(worker.deleteLater)
+        self._worker = worker
+        worker.start()
+
+    def _done(self, worker):
+        # A run with a failed query counts as failed, so missing postings do not turn up as new later
+        if worker is not self._worker:
+            return
+        self._worker = None
+        self._finish(self._running, self._records, "\n".join(self._errors))
+
+    def _finish(self, name, records, error):
+        self._running = None
+        self._records = []
+        self._next_start = time.monotonic() + self.stagger
+        search = self.store.find(name)
+        if self._stopped or search is None:
+            return
+        if error:
+            # Try again after the normal interval instead of on every tick
+            search.run_failed()
+            self.search_failed.emit(name, error)
+        else:
+            fresh = search.merge_results(records)
+            self.search_finished.emit(name, len(fresh))
+        self.store.save()
+        self.badge_changed.emit(self.store.unread())
+        if self._forced:
+            QtCore.QTimer.singleShot(self.stagger * 1000, self._tick)
+
+class SavedSearchesDialog(QtWidgets.QDialog):
+    """List of saved searches with their new postings."""
+
+    show_new = QtCore.pyqtSignal(str)
+
+    def __init__(self, scheduler, parent=None):
+        super().__init__(parent)
+        self.scheduler = scheduler
+        self.setWindowTitle("Gespeicherte Suchen")
+        self.resize(520, 360)
+        layout = QtWidgets.QVBoxLayout(self)
+        self.list = QtWidgets.QListWidget()
+        self.list.itemDoubleClicked.connect(lambda item: self.open_selected())
+        layout.addWidget(self.list)
+
+        buttons = QtWidgets.QHBoxLayout()
+        for text, slot in (("Neue anzeigen", self.open_selected), ("Jetzt ausführen", self.run_selected),
+                           ("Löschen", self.delete_selected), ("Schließen", self.close)):
+            button = QtWidgets.QPushButton(text)
+            button.clicked.connect(slot)
+            buttons.addWidget(button)
+        layout.addLayout(buttons)
+
+        scheduler.badge_changed.connect(lambda count: self.refresh())
+        scheduler.search_failed.connect(lambda name, message: self.refresh())
+        self.refresh()
+
+    def refresh(self):
+        current = self.selected_name()
+        self.list.clear()
+        for search in self.scheduler.store.searches:
+            last = time.strftime("%d.%m. %H:%M", time.localtime(search.last_run)) if search.last_run else "noch nie"
+            item = QtWidgets.QListWidgetItem(
+                f"{search.name} – {len(search.new)} neu (alle {search.interval} min, zuletzt {last})")
+            item.setData(QtCore.Qt.UserRole, search.name)
+            self.list.addItem(item)
+            if search.name == current:
+                self.list.setCurrentItem(item)
+
+    def selected_name(self):
+        item = self.list.currentItem()
+        return item.data(QtCore.Qt.UserRole) if item else None
+
+    def open_selected(self):
+        name = self.selected_name()
+        if name:
+            self.show_new.emit(name)
+            self.refresh()
+
+    def run_selected(self):
+        name = self.selected_name()
+        if name:
+            self.scheduler.run_now(name)
+
+    def delete_selected(self):
+        name = self.selected_name()
+        if name:
+            self.scheduler.store.remove(name)
+            self.scheduler.store.save()
+            self.scheduler.badge_changed.emit(self.scheduler.unread())
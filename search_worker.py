@@ -0,0 +1,132 @@
+# search_worker.py
+# Runs job searches off the GUI thread and hands results back in batches
+
+import queue
+from concurrent.futures import ThreadPoolExecutor
+
+from PyQt5 import QtCore
+from job_api import fetch_all_pages, MAX_WORKERS, MAX_IN_FLIGHT
+from job_dedupe import NearDuplicateGrouper
+from job_records import JobRecord
+
+MAX_PARALLEL_QUERIES = 3  # Queries of a fan-out search fetched at the same time
+
+class SearchWorker(QtCore.QThread):
+    """
+    Runs one or more queries and merges their results.
+
+    queries is a list of (label, params). The queries run concurrently; each
+    posting is decoded into a JobRecord here, off the GUI thread, and emitted
+    once, the first time any query returns it. Later matches of an already
+    emitted posting arrive through matches_found. Near duplicates are
+    grouped here as well (JobRecord.near_of), so the table only numbers them.
+    """
+
+    # Every signal carries the search generation so the window can drop stale results
+    batch_ready = QtCore.pyqtSignal(int, list)
+    matches_found = QtCore.pyqtSignal(int, list)     # [(refnr, label), ...]
+    total_known = QtCore.pyqtSignal(int, int)
+    truncated = QtCore.pyqtSignal(int, str, int, int)  # label, hits fetched, hits of the query (MAX_PAGES)
+    query_done = QtCore.pyqtSignal(int, str, int)    # label, postings returned by that query
+    query_failed = QtCore.pyqtSignal(int, str, str)  # label, error
+    search_failed = QtCore.pyqtSignal(int, str)
+    search_done = QtCore.pyqtSignal(int, int)
+
+    def __init__(self, generation, queries, batch_size=50, max_workers=MAX_WORKERS,
+                 max_in_flight=MAX_IN_FLIGHT, force_refresh=False, parent=None):
+        super().__init__(parent)
+        self.generation = generation
+        self.queries = [(label, dict(params)) for label, params in queries]
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight
+        self.force_refresh = force_refresh
+        self._cancelled = False
+        self._totals = {}
+
+    def cancel(self):
+        # Running requests cannot be interrupted, but nothing is emitted afterwards
+        self._cancelled = True
+
+    def is_cancelled(self):
+        return self._cancelled
+
+    def _on_total(self, label, total):
+        self._totals[label] = total
+        self.total_known.emit(self.generation, sum(self._totals.values()))
+
+    def _fetch(self, label, params, results):
+        # Runs on a pool thread; pages go through the queue to run()
+        try:
+            for jobs in fetch_all_pages(
+                params,
+                max_workers=self.max_workers,
+                max_in_flight=self.max_in_flight,
+                is_cancelled=self.is_cancelled,
+                on_total=lambda total: self._on_total(label, total),
+                on_truncated=lambda limit, total: self.truncated.emit(self.generation, label, limit, total),
+                force_refresh=self.force_refresh,
+            ):
+                results.put((label, jobs, None))
+        except Exception as e:
+            results.put((label, None, e))
+            return
+        results.put((label, None, None))
+
+    def run(self):
+        results = queue.Queue()
+        seen = {}        # refnr -> labels of the queries that returned it
+        counts = {}      # label -> postings returned
+        grouper = NearDuplicateGrouper()
+        sent = 0
+        errors = []
+        running = len(self.queries)
+        pool = ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_QUERIES, running) or 1,
+                                  thread_name_prefix="search")
+        for label, params in self.queries:
+            pool.submit(self._fetch, label, params, results)
+        try:
+            while running:
+                label, jobs, error = results.get()
+                if jobs is None:
+                    # One query finished (or failed); the others keep going
+                    running -= 1
+                    if error is not None:
+                        errors.append(f"{label}: {error}" if label else str(error))
+                        if not self._cancelled:
+                            self.query_failed.emit(self.generation, label, str(error))
+                    elif not self._cancelled:
+                        self.query_done.emit(self.generation, label, counts.get(label, 0))
+                    continue
+                if self._cancelled:
+                    continue
+                counts[label] = counts.get(label, 0) + len(jobs)
+                fresh = []
+                matches = []
+                for job in jobs:
+                    ref = job.get("refnr")
+                    labels = seen.get(ref) if ref else None
+                    if labels is None:
+                        if ref:
+                            seen[ref] = {label}
+                        fresh.append(JobRecord.from_api(job, label))
+                    elif label not in labels:
+                        labels.add(label)
+                        matches.append((ref, label))
+                if matches:
+                    self.matches_found.emit(self.generation, matches)
+                grouper.assign(fresh)
+                # Hand rows over in small batches so the table fills while the UI stays responsive
+                for start in range(0, len(fresh), self.batch_size):
+                    batch = fresh[start:start + self.batch_size]
+                    self.batch_ready.emit(self.generation, batch)
+                    sent += len(batch)
+        finally:
+            pool.shutdown(wait=False)
+
+        if self._cancelled:
+            return
+        if errors and not sent:
+            self.search_failed.emit(self.generation, "\n".join(errors))
+            return
+        self.search_done.emit(self.generation, sent)
@@ -0,0 +1,66 @@
+# stats_dialog.py
+# Window with status counts, the application funnel and time spent in each stage
+
+from PyQt5 import QtWidgets, QtCore
+
+from job_records import STATUSES
+from job_stats import PIPELINE
+
+class StatsDialog(QtWidgets.QDialog):
+    """Non-modal view of a PipelineStats, refreshed every second while shown."""
+
+    HEADERS = ["Status", "Aktuell", "Erreicht", "Anteil", "Tage Median", "Tage p90", "Abgeschlossen"]
+
+    def __init__(self, stats, parent=None):
+        super().__init__(parent)
+        self.stats = stats
+        self.setWindowTitle("Statistik")
+        self.resize(640, 320)
+        layout = QtWidgets.QVBoxLayout(self)
+
+        self.table = QtWidgets.QTableWidget(len(STATUSES), len(self.HEADERS))
+        self.table.setHorizontalHeaderLabels(self.HEADERS)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+        self.summary_label = QtWidgets.QLabel()
+        self.summary_label.setWordWrap(True)
+        layout.addWidget(self.summary_label)
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.timer.start(1000)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        stats = self.stats
+        total = stats.total()
+        reached = dict(stats.funnel())
+        stays = stats.time_in_stage()
+        for row, status in enumerate(STATUSES):
+            count = reached.get(status)
+            share = f"{count / total:.0%}" if count is not None and total else ""
+            stay = stays[status]
+            cells = [status, str(stats.counts[status]), "" if count is None else str(count), share,
+                     "" if stay["p50"] is None else f"{stay['p50']:.1f}",
+                     "" if stay["p90"] is None else f"{stay['p90']:.1f}", str(stay["count"])]
+            for column, text in enumerate(cells):
+                item = QtWidgets.QTableWidgetItem(text)
+                if column:
+                    item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+                self.table.setItem(row, column, item)
+        rate = stats.interview_rate()
+        funnel = " → ".join(f"{stage} {reached[stage]}" for stage in PIPELINE)
+        text = f"{total} Jobs. Funnel: {funnel}."
+        if rate is not None:
+            text += f" Interviewquote: {rate:.0%} der Bewerbungen."
+        self.summary_label.setText(text)
@@ -0,0 +1,859 @@
+# table_models.py
+# Table models and delegates for the results and saved jobs views
+
+import time
+import bisect
+from array import array
+
+from PyQt5 import QtWidgets, QtCore, QtGui
+from job_repository import SavedJobRepository
+from job_index import SearchIndex, narrows, parse_query
+from job_records import STATUSES
+from job_geo import distances_km
+from job_dedupe import NearDuplicateIndex, signature
+from instrumentation import span, traced
+
+SIMILAR_TOOLTIP_ROWS = 10   # Near duplicates listed in the tooltip of the "Ähnlich" column
+BUILD_BUDGET = 0.008        # Seconds of index building per idle step
+BUILD_SLICE = 10            # Documents built between two checks of the clock
+
+class IndexBuilder(QtCore.QObject):
+    """
+    Builds a SearchIndex's postings in small chunks while the event loop is idle.
+    Works for any index with `pending` and `build_pending(limit)`, e.g. a NearDuplicateIndex.
+    Each step stops after `budget` seconds, however cheap or costly a document is.
+    """
+
+    built = QtCore.pyqtSignal()   # Nothing is pending any more
+
+    def __init__(self, search_index, parent=None, budget=BUILD_BUDGET):
+        super().__init__(parent)
+        self.search_index = search_index
+        self.budget = budget
+        self.timer = QtCore.QTimer(self)
+        self.timer.setInterval(0)
+        self.timer.timeout.connect(self._step)
+
+    def schedule(self):
+        if self.search_index.pending and not self.timer.isActive():
+            self.timer.start()
+
+    def finish(self):
+        # Build the rest right away, for callers that need a complete index
+        if self.search_index.pending:
+            self.search_index.build_pending(len(self.search_index.pending))
+            self.timer.stop()
+            self.built.emit()
+
+    @traced("index.build_chunk")
+    def _step(self):
+        deadline = time.perf_counter() + self.budget
+        while self.search_index.build_pending(BUILD_SLICE):
+            if time.perf_counter() >= deadline:
+                return
+        self.timer.stop()
+        self.built.emit()
+
+class ResultColumns:
+    """Columns of the search results table."""
+
+    COLUMNS = ["Title", "Details", "Company", "Location", "Entfernung", "Suchanfragen", "Ähnlich",
+               "RefNr", "Link", "Speichern"]
+    (COL_TITLE, COL_DETAILS, COL_COMPANY, COL_LOCATION, COL_DISTANCE, COL_QUERIES, COL_SIMILAR,
+     COL_REFNR, COL_LINK, COL_SAVE) = range(10)
+    BUTTON_COLUMNS = (COL_DETAILS, COL_LINK, COL_SAVE)
+
+class ResultCells(ResultColumns):
+    """
+    How JobRecords are shown in the results table, shared by the results
+    models. Row state (open detail panel, distance, near-duplicate group)
+    comes from the model: open_row, distance(row), group_of(row) and
+    group_members(row). Saved jobs that look like a row are looked up in the
+    model's near_saved index and cached until saved_changed().
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self._saved_hits = {}     # row -> saved_matches() of the row
+
+    def header(self, section, orientation, role):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.COLUMNS[section]
+        return None
+
+    def text(self, row, job, column):
+        if column == self.COL_TITLE:
+            return job.title or "N/A"
+        if column == self.COL_DETAILS:
+            return "Details schließen" if row == self.model.open_row else "Details"
+        if column == self.COL_COMPANY:
+            return job.company or "N/A"
+        if column == self.COL_LOCATION:
+            return job.location
+        if column == self.COL_DISTANCE:
+            distance = self.model.distance(row)
+            return "" if distance is None else f"{distance:.0f} km"
+        if column == self.COL_QUERIES:
+            return ", ".join(job.queries)
+        if column == self.COL_SIMILAR:
+            return self.similar_text(row, job)
+        if column == self.COL_REFNR:
+            return job.refnr
+        if column == self.COL_LINK:
+            return "Zur Anzeige"
+        if column == self.COL_SAVE:
+            return "Speichern"
+        return ""
+
+    def data(self, index, role):
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return self.model.text(index.row(), index.column())
+        if role == QtCore.Qt.ToolTipRole and index.column() == self.COL_TITLE:
+            return self.model.text(index.row(), index.column())
+        if role == QtCore.Qt.ToolTipRole and index.column() == self.COL_SIMILAR:
+            return self.similar_tooltip(index.row()) or None
+        if role == QtCore.Qt.TextAlignmentRole and index.column() == self.COL_DISTANCE:
+            return QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter
+        return None
+
+    def sort_key(self, row, job, column):
+        if column == self.COL_DISTANCE:
+            # Numeric, postings without coordinates last
+            distance = self.model.distance(row)
+            return float("inf") if distance is None else distance
+        if column == self.COL_SIMILAR:
+            # Groups together in order, marked saved duplicates first
+            group = self.model.group_of(row)
+            return (not self.saved_hits(row, job), float("inf") if group is None else group)
+        return self.text(row, job, column).lower()
+
+    def saved_matches(self, job):
+        """Saved job dicts that look like near duplicates of job (a JobRecord)."""
+        near_saved = self.model.near_saved
+        if near_saved is None or job is None:
+            return []
+        items = near_saved.items
+        return [items[key] for _, key in near_saved.similar(signature(job.title, job.company, job.location))
+                if key in items]
+
+    def saved_hits(self, row, job):
+        # saved_matches() for a row, cached until the saved jobs change
+        hits = self._saved_hits.get(row)
+        if hits is None:
+            hits = self.saved_matches(job)
+            if job is not None:
+                self._saved_hits[row] = hits
+        return hits
+
+    def similar_text(self, row, job):
+        parts = []
+        group = self.model.group_of(row)
+        if group is not None:
+            parts.append(f"Gruppe {group} ({len(self.model.group_members(row))})")
+        if self.saved_hits(row, job):
+            parts.append("≈ gespeichert")
+        return ", ".join(parts)
+
+    def similar_tooltip(self, row):
+        job = self.model.jobs[row]
+        lines = [f"Gespeichert: {saved.get('title', '')} – {saved.get('company', '')}"
+                 for saved in self.saved_hits(row, job)]
+        others = [other for other in self.model.group_members(row) if other != row]
+        for other in others[:SIMILAR_TOOLTIP_ROWS]:
+            record = self.model.jobs[other]
+            lines.append(f"{record.title} – {record.company} ({record.refnr})")
+        if len(others) > SIMILAR_TOOLTIP_ROWS:
+            lines.append(f"… und {len(others) - SIMILAR_TOOLTIP_ROWS} weitere")
+        return "\n".join(lines)
+
+    def saved_changed(self):
+        # The saved jobs changed: repaint the marker column
+        self._saved_hits = {}
+        rows = self.model.rowCount()
+        if rows:
+            self.model.dataChanged.emit(self.model.index(0, self.COL_SIMILAR),
+                                        self.model.index(rows - 1, self.COL_SIMILAR))
+
+    def set_open_row(self, row):
+        # Switch the "Details" / "Details schließen" label between rows
+        old, self.model.open_row = self.model.open_row, row
+        for r in (old, row):
+            if r is not None and r < self.model.rowCount():
+                idx = self.model.index(r, self.COL_DETAILS)
+                self.model.dataChanged.emit(idx, idx)
+
+    def clear(self):
+        self._saved_hits = {}
+
+class ResultsTableModel(QtCore.QAbstractTableModel, ResultColumns):
+    """
+    Search results, one JobRecord per row.
+
+    Distances to the home location are computed per appended batch in one
+    vectorized pass and kept in an array parallel to the rows; changing the
+    home recomputes them all at once.
+
+    Near duplicates (same position under different refnrs) arrive grouped:
+    the search worker's NearDuplicateGrouper sets each record's near_of, and
+    rows with the same representative share a group number. near_saved is
+    an optional NearDuplicateIndex of the saved jobs, keyed by saved job dict
+    id, used to mark postings that look like something already saved.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.jobs = []
+        self.rows_by_ref = {}
+        self.open_row = None  # Row whose detail panel is open
+        self.home = None      # (lat, lon) or None
+        self.distances = array("d")
+        self.search_index = SearchIndex()
+        self.index_builder = IndexBuilder(self.search_index, self)
+        self.near_saved = None
+        self.cells = ResultCells(self)
+        self.representative_rows = {}            # id(record) -> row, records with near_of None
+        self.groups = {}                         # row -> group number, only rows with near duplicates
+        self.group_rows = {}                     # group number -> rows
+        self.next_group = 1
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.jobs)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        header = self.cells.header(section, orientation, role)
+        return header if header is not None else super().headerData(section, orientation, role)
+
+    def text(self, row, column):
+        return self.cells.text(row, self.jobs[row], column)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        return self.cells.data(index, role)
+
+    def sort_key(self, row, column):
+        return self.cells.sort_key(row, self.jobs[row], column)
+
+    def link(self, row):
+        return self.jobs[row].link
+
+    def saved_matches(self, job):
+        """Saved job dicts that look like near duplicates of job (a JobRecord)."""
+        return self.cells.saved_matches(job)
+
+    def group_of(self, row):
+        return self.groups.get(row)
+
+    def group_members(self, row):
+        return self.group_rows.get(self.groups.get(row), ())
+
+    def _group(self, first, jobs):
+        # Number the groups of the new rows from their near_of (set by
+        # NearDuplicateGrouper); returns the older rows whose group label changed
+        touched = set()
+        for row, job in enumerate(jobs, first):
+            if job.near_of is None:
+                self.representative_rows[id(job)] = row
+                continue
+            other = self.representative_rows.get(id(job.near_of))
+            if other is None:
+                continue
+            group = self.groups.get(other)
+            if group is None:
+                group = self.next_group
+                self.next_group += 1
+                self.groups[other] = group
+                self.group_rows[group] = [other]
+            self.groups[row] = group
+            self.group_rows[group].append(row)
+            touched.add(group)
+        return [r for group in touched for r in self.group_rows[group] if r < first]
+
+    def saved_changed(self):
+        self.cells.saved_changed()
+
+    def distance(self, row):
+        """Distance of row from the home location in km, None if unknown."""
+        if self.home is None or row >= len(self.distances):
+            return None
+        distance = self.distances[row]
+        return None if distance != distance else distance
+
+    def set_home(self, home):
+        """Set the home location (lat, lon) or None and recompute every distance."""
+        self.beginResetModel()
+        self.home = home
+        with span("table.distances", rows=len(self.jobs)):
+            self.distances = distances_km(home, [job.lat for job in self.jobs], [job.lon for job in self.jobs])
+        self.endResetModel()
+
+    def append_jobs(self, jobs):
+        # One insert notification per batch
+        if not jobs:
+            return
+        with span("table.append_results", rows=len(jobs)):
+            for job in jobs:
+                self.search_index.add(id(job), job.index_values())
+            self.index_builder.schedule()
+            first = len(self.jobs)
+            for row, job in enumerate(jobs, first):
+                self.rows_by_ref.setdefault(job.refnr, row)
+            if self.home is not None:
+                self.distances.extend(distances_km(self.home, [job.lat for job in jobs], [job.lon for job in jobs]))
+            with span("table.near_duplicates", rows=len(jobs)):
+                changed = self._group(first, jobs)
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(jobs) - 1)
+            self.jobs.extend(jobs)
+            self.endInsertRows()
+            if changed:
+                self.dataChanged.emit(self.index(min(changed), self.COL_SIMILAR),
+                                      self.index(max(changed), self.COL_SIMILAR))
+
+    def add_matches(self, matches):
+        # Further queries of a fan-out search returned postings that are already listed
+        for refnr, label in matches:
+            row = self.rows_by_ref.get(refnr)
+            if row is None:
+                continue
+            labels = self.jobs[row].queries
+            if label not in labels:
+                labels.append(label)
+                idx = self.index(row, self.COL_QUERIES)
+                self.dataChanged.emit(idx, idx)
+
+    def clear(self):
+        self.beginResetModel()
+        self.jobs = []
+        self.rows_by_ref = {}
+        self.open_row = None
+        self.distances = array("d")
+        self.search_index.clear()
+        self.cells.clear()
+        self.representative_rows = {}
+        self.groups = {}
+        self.group_rows = {}
+        self.next_group = 1
+        self.endResetModel()
+
+    def set_open_row(self, row):
+        self.cells.set_open_row(row)
+
+class JobFilterProxyModel(QtCore.QAbstractProxyModel):
+    """
+    Sorting and filtering proxy for the job tables.
+
+    Filtering goes through the source model's SearchIndex: several words must
+    all match, "status:applied" restricts a word to one field. Visible rows are
+    kept as a sorted list of (sort key, source row) tuples, so a new filter is
+    one pass over a set plus a model reset, and single inserts, removals and
+    edits are bisected into place instead of re-filtering the whole table.
+    Source models provide `jobs`, `search_index` and `sort_key(row, column)`.
+    An optional row filter (source row -> bool) narrows the view further,
+    e.g. to postings within a radius.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.filter_terms = []
+        self.accepted = None       # None: no filter active
+        self.row_filter = None
+        self.query_version = 0
+        self.sort_column = -1
+        self.sort_order = QtCore.Qt.AscendingOrder
+        self._keys = {}            # source row -> sort key tuple
+        self._order = []           # sort keys of all rows, ascending
+        self._visible = []         # sort keys of visible rows, ascending
+
+    # --- Source model wiring ---
+
+    def setSourceModel(self, model):
+        self.beginResetModel()
+        old = self.sourceModel()
+        if old is not None:
+            for signal, slot in ((old.modelAboutToBeReset, self.beginResetModel),
+                                 (old.modelReset, self._source_reset),
+                                 (old.rowsInserted, self._source_rows_inserted),
+                                 (old.rowsAboutToBeRemoved, self._source_rows_about_to_be_removed),
+                                 (old.rowsRemoved, self._source_rows_removed),
+                                 (old.dataChanged, self._source_data_changed)):
+                signal.disconnect(slot)
+        super().setSourceModel(model)
+        model.modelAboutToBeReset.connect(self.beginResetModel)
+        model.modelReset.connect(self._source_reset)
+        model.rowsInserted.connect(self._source_rows_inserted)
+        model.rowsAboutToBeRemoved.connect(self._source_rows_about_to_be_removed)
+        model.rowsRemoved.connect(self._source_rows_removed)
+        model.dataChanged.connect(self._source_data_changed)
+        self._rebuild()
+        self.endResetModel()
+
+    def _sort_key(self, source_row):
+        if self.sort_column < 0:
+            return (source_row,)
+        return (self.sourceModel().sort_key(source_row, self.sort_column), source_row)
+
+    def _accepts(self, source_row):
+        if self.row_filter is not None and not self.row_filter(source_row):
+            return False
+        if self.accepted is None:
+            return True
+        model = self.sourceModel()
+        key = id(model.jobs[source_row])
+        index = model.search_index
+        if index.modified.get(key, 0) > self.query_version:
+            return index.matches(key, self.filter_terms)
+        return key in self.accepted
+
+    def _rebuild(self):
+        model = self.sourceModel()
+        count = model.rowCount() if model is not None else 0
+        self._keys = {row: self._sort_key(row) for row in range(count)}
+        self._order = sorted(self._keys.values())
+        self._visible = self._filtered()
+
+    def _filtered(self):
+        # Visible keys in sort order, one set lookup per row
+        row_filter = self.row_filter
+        if self.accepted is None:
+            if row_filter is None:
+                return list(self._order)
+            return [key for key in self._order if row_filter(key[-1])]
+        if self.sourceModel().search_index.version != self.query_version:
+            return [key for key in self._order if self._accepts(key[-1])]
+        jobs = self.sourceModel().jobs
+        accepted = self.accepted
+        if row_filter is None:
+            return [key for key in self._order if id(jobs[key[-1]]) in accepted]
+        return [key for key in self._order if id(jobs[key[-1]]) in accepted and row_filter(key[-1])]
+
+    def _find(self, key):
+        # Position of key in the visible list or -1
+        i = bisect.bisect_left(self._visible, key)
+        if i < len(self._visible) and self._visible[i] == key:
+            return i
+        return -1
+
+    def _proxy_row(self, position, length=None):
+        length = len(self._visible) if length is None else length
+        return position if self.sort_order == QtCore.Qt.AscendingOrder else length - 1 - position
+
+    def _insert_key(self, key):
+        i = bisect.bisect_left(self._visible, key)
+        row = self._proxy_row(i, len(self._visible) + 1)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self._visible.insert(i, key)
+        self.endInsertRows()
+
+    def _remove_position(self, position):
+        row = self._proxy_row(position)
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        del self._visible[position]
+        self.endRemoveRows()
+
+    def _source_reset(self):
+        self._rebuild()
+        self.endResetModel()
+
+    def _source_rows_inserted(self, parent, first, last):
+        if first < len(self._keys):
+            # Inserting in the middle shifts source rows; rare, so rebuild
+            self.beginResetModel()
+            self._rebuild()
+            self.endResetModel()
+            return
+        new_keys = []
+        for row in range(first, last + 1):
+            key = self._sort_key(row)
+            self._keys[row] = key
+            bisect.insort(self._order, key)
+            if self._accepts(row):
+                new_keys.append(key)
+        if not new_keys:
+            return
+        if self.sort_column < 0 and self.sort_order == QtCore.Qt.AscendingOrder:
+            # Unsorted view: new rows simply go to the end in one block
+            start = len(self._visible)
+            self.beginInsertRows(QtCore.QModelIndex(), start, start + len(new_keys) - 1)
+            self._visible.extend(new_keys)
+            self.endInsertRows()
+        else:
+            for key in new_keys:
+                self._insert_key(key)
+
+    def _source_rows_about_to_be_removed(self, parent, first, last):
+        for row in range(last, first - 1, -1):
+            key = self._keys.get(row)
+            position = self._find(key)
+            if position >= 0:
+                self._remove_position(position)
+            i = bisect.bisect_left(self._order, key)
+            if i < len(self._order) and self._order[i] == key:
+                del self._order[i]
+
+    def _source_rows_removed(self, parent, first, last):
+        # Shift the rows behind the removed block; their order does not change
+        count = last - first + 1
+
+        def shifted(key):
+            row = key[-1]
+            return key if row < first else key[:-1] + (row - count,)
+
+        self._keys = {(row - count if row > last else row): shifted(key)
+                      for row, key in self._keys.items() if not first <= row <= last}
+        self._order = [shifted(key) for key in self._order]
+        self._visible = [shifted(key) for key in self._visible]
+
+    def _source_data_changed(self, top_left, bottom_right, roles=None):
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            old_key = self._keys.get(row)
+            new_key = self._sort_key(row)
+            position = self._find(old_key)
+            visible = self._accepts(row)
+            if old_key == new_key and (position >= 0) == visible:
+                if position >= 0:
+                    proxy_row = self._proxy_row(position)
+                    self.dataChanged.emit(self.index(proxy_row, top_left.column()),
+                                          self.index(proxy_row, bottom_right.column()))
+                continue
+            # Key or visibility changed: move the row to its new place
+            if position >= 0:
+                self._remove_position(position)
+            if old_key != new_key:
+                i = bisect.bisect_left(self._order, old_key)
+                if i < len(self._order) and self._order[i] == old_key:
+                    del self._order[i]
+                bisect.insort(self._order, new_key)
+            self._keys[row] = new_key
+            if visible:
+                self._insert_key(new_key)
+
+    # --- Filtering and sorting ---
+
+    def set_filter_text(self, text):
+        index = self.sourceModel().search_index
+        with span("filter.query"):
+            terms = parse_query(text)
+            # A longer query only hides rows: nothing changed since the last filter,
+            # so the rows still visible are the only ones to check
+            narrowing = bool(terms and self.accepted is not None and self.query_version == index.version
+                             and narrows(self.filter_terms, terms))
+            previous = self.accepted
+            self.filter_terms = terms
+            self.accepted = index.query(text)
+            self.query_version = index.version
+        if narrowing and len(self.accepted) == len(previous):
+            return   # e.g. "senio" -> "senior": the same rows stay visible
+        with span("filter.reset", narrowed=narrowing):
+            self.beginResetModel()
+            if narrowing:
+                jobs = self.sourceModel().jobs
+                accepted = self.accepted
+                self._visible = [key for key in self._visible if id(jobs[key[-1]]) in accepted]
+            else:
+                self._visible = self._filtered()
+            self.endResetModel()
+
+    def set_row_filter(self, row_filter):
+        """Show only source rows for which row_filter(row) is true; None shows all."""
+        self.row_filter = row_filter
+        with span("filter.reset"):
+            self.beginResetModel()
+            self._visible = self._filtered()
+            self.endResetModel()
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        persistent = self.persistentIndexList()
+        sources = [self.mapToSource(idx) for idx in persistent]
+        self.sort_column = column
+        self.sort_order = order
+        self._keys = {row: self._sort_key(row) for row in self._keys}
+        self._order = sorted(self._keys.values())
+        self._visible = self._filtered()
+        self.changePersistentIndexList(persistent, [self.mapFromSource(src) for src in sources])
+        self.layoutChanged.emit()
+
+    # --- QAbstractProxyModel interface ---
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._visible)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        model = self.sourceModel()
+        return 0 if parent.isValid() or model is None else model.columnCount()
+
+    def hasChildren(self, parent=QtCore.QModelIndex()):
+        return not parent.isValid() and bool(self._visible)
+
+    def index(self, row, column, parent=QtCore.QModelIndex()):
+        if parent.isValid() or not (0 <= row < len(self._visible)) or not (0 <= column < self.columnCount()):
+            return QtCore.QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=None):
+        return QtCore.QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid() or proxy_index.row() >= len(self._visible):
+            return QtCore.QModelIndex()
+        position = self._proxy_row(proxy_index.row())
+        return self.sourceModel().index(self._visible[position][-1], proxy_index.column())
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QtCore.QModelIndex()
+        position = self._find(self._keys.get(source_index.row()))
+        if position < 0:
+            return QtCore.QModelIndex()
+        return self.index(self._proxy_row(position), source_index.column())
+
+    def source_rows(self):
+        """Source rows in display order."""
+        keys = self._visible if self.sort_order == QtCore.Qt.AscendingOrder else reversed(self._visible)
+        return (key[-1] for key in keys)
+
+class ButtonDelegate(QtWidgets.QStyledItemDelegate):
+    """Draws the cell text as a push button and reports clicks on it."""
+
+    clicked = QtCore.pyqtSignal(QtCore.QModelIndex)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pressed = None
+
+    def _button_option(self, option, index):
+        button = QtWidgets.QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = str(index.data(QtCore.Qt.DisplayRole) or "")
+        button.state = QtWidgets.QStyle.State_Enabled
+        if self._pressed == (index.row(), index.column()):
+            button.state |= QtWidgets.QStyle.State_Sunken
+        else:
+            button.state |= QtWidgets.QStyle.State_Raised
+        return button
+
+    def paint(self, painter, option, index):
+        style = option.widget.style() if option.widget else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.CE_PushButton, self._button_option(option, index), painter, option.widget)
+
+    def sizeHint(self, option, index):
+        text = str(index.data(QtCore.Qt.DisplayRole) or "")
+        return QtCore.QSize(option.fontMetrics.horizontalAdvance(text) + 24, option.fontMetrics.height() + 10)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QtCore.QEvent.MouseButtonPress and event.button() == QtCore.Qt.LeftButton:
+            self._pressed = (index.row(), index.column())
+            return True
+        if event.type() == QtCore.QEvent.MouseButtonRelease and event.button() == QtCore.Qt.LeftButton:
+            was_pressed = self._pressed == (index.row(), index.column())
+            self._pressed = None
+            if was_pressed and option.rect.contains(event.pos()):
+                self.clicked.emit(index)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+class SavedJobsModel(QtCore.QAbstractTableModel):
+    """
+    Saved jobs from a SavedJobRepository; edits to status and notes go straight into the job dicts.
+    near_index holds the MinHash signatures of the saved jobs (keyed by dict id) for the
+    near-duplicate check of search results; it is built in idle chunks like the search index.
+    """
+
+    COLUMNS = ["Title", "Details", "Company", "Location", "Status", "Notes", "RefNr", "Link", "Dokumente", "Löschen"]
+    (COL_TITLE, COL_DETAILS, COL_COMPANY, COL_LOCATION, COL_STATUS, COL_NOTES,
+     COL_REFNR, COL_LINK, COL_FILES, COL_DELETE) = range(10)
+    BUTTON_COLUMNS = (COL_DETAILS, COL_LINK, COL_FILES, COL_DELETE)
+    FIELDS = {COL_TITLE: "title", COL_COMPANY: "company", COL_LOCATION: "location",
+              COL_STATUS: "status", COL_NOTES: "notes", COL_REFNR: "refnr"}
+    BUTTON_LABELS = {COL_DETAILS: "Details", COL_LINK: "Zur Anzeige",
+                     COL_FILES: "Dateien verwalten", COL_DELETE: "Löschen"}
+
+    OFFLINE_BRUSH = QtGui.QBrush(QtGui.QColor(255, 220, 220))
+
+    # Emitted after the user changed a field in the table: (row, field name, old value)
+    job_edited = QtCore.pyqtSignal(int, str, object)
+    # Emitted when saved jobs entered or left near_index
+    near_changed = QtCore.pyqtSignal()
+
+    def __init__(self, repository=None, parent=None):
+        super().__init__(parent)
+        self.repository = repository if repository is not None else SavedJobRepository()
+        self.jobs = self.repository.jobs
+        self.search_index = SearchIndex()
+        self.index_builder = IndexBuilder(self.search_index, self)
+        self.near_index = NearDuplicateIndex()
+        self.near_builder = IndexBuilder(self.near_index, self)
+        self.near_builder.built.connect(self.near_changed)
+        self._index_all()
+
+    def _index_all(self):
+        self.search_index.clear()
+        self.near_index.clear()
+        for job in self.jobs:
+            self.search_index.add(id(job), job)
+            self._near_text(job)
+        self.index_builder.schedule()
+        self.near_builder.schedule()
+
+    def _near_text(self, job):
+        self.near_index.add_text(id(job), job.get("title", ""), job.get("company", ""),
+                                 job.get("location", ""), job)
+
+    def _index_job(self, job):
+        self.search_index.add(id(job), job)
+        self.index_builder.schedule()
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.jobs)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role == QtCore.Qt.DisplayRole and orientation == QtCore.Qt.Horizontal:
+            return self.COLUMNS[section]
+        return super().headerData(section, orientation, role)
+
+    def text(self, row, column):
+        if column in self.BUTTON_LABELS:
+            return self.BUTTON_LABELS[column]
+        field = self.FIELDS.get(column)
+        if field is None:
+            return ""
+        default = "New" if field == "status" else ("N/A" if field == "refnr" else "")
+        return str(self.jobs[row].get(field, default))
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
+            return self.text(index.row(), index.column())
+        job = self.jobs[index.row()]
+        offline = job.get("online") is False
+        if role == QtCore.Qt.BackgroundRole and offline:
+            return self.OFFLINE_BRUSH
+        if role == QtCore.Qt.ToolTipRole:
+            if offline:
+                return f"Anzeige nicht mehr online (geprüft {job.get('last_checked', '')})"
+            if index.column() in (self.COL_TITLE, self.COL_NOTES):
+                return self.text(index.row(), index.column())
+        return None
+
+    def sort_key(self, row, column):
+        return self.text(row, column).lower()
+
+    def rows_flagged(self, rows):
+        # Repaint rows whose online flag changed; the flag is not part of the search index
+        last = len(self.COLUMNS) - 1
+        for row in rows:
+            self.dataChanged.emit(self.index(row, 0), self.index(row, last),
+                                  [QtCore.Qt.BackgroundRole, QtCore.Qt.ToolTipRole])
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.column() in (self.COL_STATUS, self.COL_NOTES):
+            flags |= QtCore.Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole):
+        if role != QtCore.Qt.EditRole or index.column() not in (self.COL_STATUS, self.COL_NOTES):
+            return False
+        field = self.FIELDS[index.column()]
+        job = self.jobs[index.row()]
+        old = job.get(field)
+        if old == value:
+            return False
+        job[field] = value
+        self._index_job(job)
+        self.dataChanged.emit(index, index)
+        self.job_edited.emit(index.row(), field, old)
+        return True
+
+    def set_jobs(self, jobs):
+        with span("table.set_saved", rows=len(jobs)):
+            self.beginResetModel()
+            self.repository.reset(jobs)
+            self._index_all()
+            self.endResetModel()
+        self.near_changed.emit()
+
+    def append_job(self, job):
+        row = len(self.jobs)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.repository.add(job)
+        self._index_job(job)
+        self.near_index.add(id(job), signature(job.get("title", ""), job.get("company", ""),
+                                               job.get("location", "")), job)
+        self.endInsertRows()
+        self.near_changed.emit()
+        return row
+
+    def append_jobs(self, jobs):
+        # One insert notification for a block of rows
+        if not jobs:
+            return
+        with span("table.append_saved", rows=len(jobs)):
+            first = len(self.jobs)
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(jobs) - 1)
+            for job in jobs:
+                self.repository.add(job)
+                self.search_index.add(id(job), job)
+                self._near_text(job)
+            self.endInsertRows()
+        self.index_builder.schedule()
+        self.near_builder.schedule()
+
+    def remove_row(self, row):
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        self.search_index.remove(id(self.jobs[row]))
+        self.near_index.remove(id(self.jobs[row]))
+        self.repository.remove_row(row)
+        self.endRemoveRows()
+        self.near_changed.emit()
+
+    def row_changed(self, row):
+        # Reindex and repaint a single row after its job dict was changed elsewhere
+        self._index_job(self.jobs[row])
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.COLUMNS) - 1))
+
+class StatusDelegate(QtWidgets.QStyledItemDelegate):
+    """Status column: shown as text, edited with a combo box that opens on click."""
+
+    def createEditor(self, parent, option, index):
+        combo = QtWidgets.QComboBox(parent)
+        combo.addItems(STATUSES)
+        combo.activated.connect(lambda _, c=combo: self._commit(c))
+        return combo
+
+    def _commit(self, combo):
+        self.commitData.emit(combo)
+        self.closeEditor.emit(combo)
+
+    def setEditorData(self, editor, index):
+        editor.setCurrentText(str(index.data(QtCore.Qt.EditRole) or "New"))
+        QtCore.QTimer.singleShot(0, editor.showPopup)
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), QtCore.Qt.EditRole)
+
+    def paint(self, painter, option, index):
+        # Draw a combo box frame so the cell still looks selectable
+        combo = QtWidgets.QStyleOptionComboBox()
+        combo.rect = option.rect.adjusted(2, 2, -2, -2)
+        combo.currentText = str(index.data(QtCore.Qt.DisplayRole) or "")
+        combo.state = QtWidgets.QStyle.State_Enabled
+        style = option.widget.style() if option.widget else QtWidgets.QApplication.style()
+        style.drawComplexControl(QtWidgets.QStyle.CC_ComboBox, combo, painter, option.widget)
+        style.drawControl(QtWidgets.QStyle.CE_ComboBoxLabel, combo, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        # Open the editor on a single click instead of a double click
+        if event.type() == QtCore.QEvent.MouseButtonRelease and event.button() == QtCore.Qt.LeftButton:
+            view = self.parent()
+            if isinstance(view, QtWidgets.QAbstractItemView):
+                view.edit(index)
+                return True
+        return super().editorEvent(event, model, option, index)
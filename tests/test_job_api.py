@@ -0,0 +1,33 @@
+# test_job_api.py
+# Paging of fetch_all_pages: all hits of a search, and the report when MAX_PAGES cuts it off
+
+import os
+import sys
+
+from job_api import JobApiClient, fetch_all_pages
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+from fake_server import FakeJobsuche  # noqa: E402
+
+def fetch(total, max_pages):
+    truncated = []
+    with FakeJobsuche(total=total, delay=0) as server:
+        client = JobApiClient(url=server.url, cache=False, rate=1000.0, burst=1000)
+        try:
+            jobs = [job for page in fetch_all_pages({"was": "Koch"}, page_size=10, max_pages=max_pages,
+                                                    on_truncated=lambda *args: truncated.append(args),
+                                                    client=client)
+                    for job in page]
+        finally:
+            client.close()
+    return jobs, truncated
+
+def test_all_pages_are_fetched():
+    jobs, truncated = fetch(total=35, max_pages=10)
+    assert len({job["refnr"] for job in jobs}) == 35
+    assert truncated == []
+
+def test_truncation_at_max_pages_is_reported():
+    jobs, truncated = fetch(total=95, max_pages=3)
+    assert len(jobs) == 30
+    assert truncated == [(30, 95)]
@@ -0,0 +1,86 @@
+# test_job_cache.py
+# On-disk response cache: expiry, LRU eviction, counters and the force_refresh bypass
+
+import os
+import sys
+
+import pytest
+
+import job_cache
+from job_api import JobApiClient
+from job_cache import ResponseCache, cache_key
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+from fake_server import FakeJobsuche  # noqa: E402
+
+class FakeClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(job_cache.time, "time", clock)
+    return clock
+
+def test_cache_key_ignores_empty_params_and_order():
+    assert cache_key("u", {"wo": "Berlin", "was": ""}) == cache_key("u", {"wo": "Berlin"})
+    assert cache_key("u", {"a": 1, "b": 2}) == cache_key("u", {"b": "2", "a": "1"})
+    assert cache_key("u", {"wo": "Berlin"}) != cache_key("u", {"wo": "Hamburg"})
+
+def test_entries_expire_after_their_ttl(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path), ttl=60)
+    cache.put("a", {"n": 1})
+    cache.put("b", {"n": 2}, ttl=600)
+    clock.now += 59
+    assert cache.get("a") == {"n": 1}
+    clock.now += 2
+    assert cache.get("a") is None
+    assert cache.get("b") == {"n": 2}
+    assert not os.path.exists(cache._path("a"))
+
+def test_hit_and_miss_counters(tmp_path, clock):
+    cache = ResponseCache(str(tmp_path))
+    assert cache.get("a") is None
+    cache.put("a", [1, 2, 3])
+    assert cache.get("a") == [1, 2, 3]
+    assert cache.get("a") == [1, 2, 3]
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert cache.stats()["entries"] == 1
+
+def test_least_recently_used_entries_are_evicted_over_the_size_limit(tmp_path, clock):
+    probe = ResponseCache(str(tmp_path / "probe"))
+    probe.put("x", {"text": "x" * 200})
+    entry_size = probe.size_bytes()
+
+    cache = ResponseCache(str(tmp_path / "cache"), max_bytes=entry_size * 3 + entry_size // 2)
+    for key in ("a", "b", "c"):
+        cache.put(key, {"text": key * 200})
+        clock.now += 1
+    cache.get("a")               # "b" is now the least recently used
+    clock.now += 1
+    cache.put("d", {"text": "d" * 200})
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in ("a", "c", "d"))
+    assert cache.size_bytes() <= cache.max_bytes
+
+def test_index_is_rebuilt_from_the_files(tmp_path, clock):
+    ResponseCache(str(tmp_path)).put("a", {"n": 1})
+    assert ResponseCache(str(tmp_path)).get("a") == {"n": 1}
+
+def test_force_refresh_bypasses_the_cache(tmp_path):
+    with FakeJobsuche(total=30, delay=0) as server:
+        cache = ResponseCache(str(tmp_path))
+        client = JobApiClient(url=server.url, cache=cache, rate=1000.0, burst=1000)
+        try:
+            first = client.search_page({"was": "Koch"}, 1, 10)
+            assert client.search_page({"was": "Koch"}, 1, 10) == first
+            assert server.requests == 1
+            assert client.search_page({"was": "Koch"}, 1, 10, force_refresh=True) == first
+            assert server.requests == 2
+            assert (cache.hits, cache.misses) == (1, 1)
+        finally:
+            client.close()
@@ -0,0 +1,74 @@
+# test_job_dedupe.py
+# Near-duplicate detection: what counts as the same posting and how groups form
+
+import pytest
+
+from job_dedupe import NearDuplicateGrouper, NearDuplicateIndex, is_near_duplicate, shingles, signature, split
+from job_records import JobRecord
+
+COMPANY = "Muster Handel GmbH"
+LOCATION = "Berlin, Berlin"
+
+def record(title, company=COMPANY, location=LOCATION, refnr="1"):
+    return JobRecord(title, company, location, refnr, "")
+
+def sig(record):
+    return signature(record.title, record.company, record.location)
+
+def near(title1, title2):
+    return is_near_duplicate(split(signature(title1, COMPANY, LOCATION)), split(signature(title2, COMPANY, LOCATION)))
+
+@pytest.mark.parametrize("title1, title2", [
+    ("Java Entwickler (m/w/d)", "Python Entwickler (m/w/d)"),
+    ("Senior Softwareentwickler (m/w/d)", "Junior Softwareentwickler (m/w/d)"),
+    ("Verkäufer (m/w/d) Filiale 12", "Verkäufer (m/w/d) Filiale 13"),
+    ("Marketing Referent (m/w/d) Filiale 11", "Marketing Assistent (m/w/d) Filiale 11"),
+])
+def test_different_positions_at_one_employer_are_kept_apart(title1, title2):
+    assert not near(title1, title2)
+
+@pytest.mark.parametrize("title1, title2", [
+    ("Softwareentwickler (m/w/d)", "Softwareentwickler (w/m/d)"),
+    ("Pflegefachkraft (m/w/d) in Vollzeit", "Pflegefachkraft (m/w/d) Vollzeit"),
+])
+def test_reposts_are_near_duplicates(title1, title2):
+    assert near(title1, title2)
+
+def test_other_company_is_not_a_near_duplicate():
+    sig1 = signature("Koch (m/w/d)", "Gasthaus Adler", LOCATION)
+    sig2 = signature("Koch (m/w/d)", "Hotel Seeblick", LOCATION)
+    assert not is_near_duplicate(split(sig1), split(sig2))
+
+def test_shingles_ignore_case_but_not_numbers():
+    assert shingles("filiale 12") != shingles("filiale 13")
+    assert signature("KOCH", COMPANY, LOCATION) == signature("koch", COMPANY, LOCATION)
+
+def test_grouper_compares_with_the_representative_only():
+    # Each title is one edit away from the previous one, far from the first
+    titles = ["Mitarbeiter Kundenservice Abc", "Mitarbeiter Kundenservice Abd", "Mitarbeiter Kundenservice Aed",
+              "Mitarbeiter Kundenservice Fed", "Mitarbeiter Kundenserwice Fed", "Mitarbeiter Kundenserwixe Fed"]
+    records = [record(title, refnr=str(i)) for i, title in enumerate(titles)]
+    NearDuplicateGrouper().assign(records)
+    first = records[0]
+    assert first.near_of is None
+    for other in records[1:]:
+        if other.near_of is not None:
+            assert other.near_of.near_of is None
+            assert is_near_duplicate(split(sig(other)), split(sig(other.near_of)))
+    assert records[-1].near_of is not first
+
+def test_grouper_keeps_one_group_per_position():
+    reposts = [record("Lagerhelfer (m/w/d)", refnr=str(i)) for i in range(3)]
+    others = [record(f"Verkäufer (m/w/d) Filiale {i}", refnr=f"F{i}") for i in range(20)]
+    NearDuplicateGrouper().assign(reposts + others)
+    assert reposts[0].near_of is None
+    assert reposts[1].near_of is reposts[0] and reposts[2].near_of is reposts[0]
+    assert all(other.near_of is None for other in others)
+
+def test_index_caps_bucket_size():
+    index = NearDuplicateIndex()
+    sig = signature("Koch (m/w/d)", COMPANY, LOCATION)
+    for key in range(200):
+        index.add(key, sig)
+    assert len(index.candidates(split(sig))) < 200
+    assert index.similar(sig)
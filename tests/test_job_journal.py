@@ -0,0 +1,115 @@
+# test_job_journal.py
+# Edit journal: replay at startup, compaction into the store (also when a write fails) and CLI edits
+
+import os
+
+from job_data import SqliteStorage
+from job_journal import JobJournal
+from job_records import JobRecord
+from job_repository import SavedJobStore
+from persistence import SaveScheduler
+
+class FailingStorage(SqliteStorage):
+    """SqliteStorage whose writes fail while `failing` is set, like a full disk."""
+
+    failing = False
+
+    def apply(self, upserts, deletes, jobs=None):
+        if self.failing:
+            print("Fehler beim Speichern der Datenbank: disk full")
+            return False
+        return super().apply(upserts, deletes, jobs)
+
+def saved(storage, *titles):
+    jobs = [JobRecord(title, "Firma", "Berlin", f"10000-{i}-S", "").to_entry() for i, title in enumerate(titles)]
+    storage.apply(jobs, set())
+    return storage.load()
+
+def change_status(journal, job, status):
+    old = job["status"]
+    job["status"] = status
+    journal.status_changed(job, old)
+
+def test_replay_applies_edits_of_the_last_run(tmp_path):
+    storage = SqliteStorage(str(tmp_path / "jobs.db"), str(tmp_path / "jobs.json"))
+    jobs = saved(storage, "A", "B")
+    journal = JobJournal(str(tmp_path / "journal.jsonl"))
+    journal.replay(jobs)
+    change_status(journal, jobs[1], "Applied")
+    jobs[0]["notes"] = "anrufen"
+    journal.notes_changed(jobs[0])
+
+    # The session ends without compaction
+    loaded = storage.load()
+    changed = JobJournal(str(tmp_path / "journal.jsonl")).replay(loaded)
+    assert {job["title"] for job in changed} == {"A", "B"}
+    assert loaded[1]["status"] == "Applied" and [entry[1] for entry in loaded[1]["history"]] == ["Applied"]
+    assert loaded[0]["notes"] == "anrufen"
+    storage.close()
+
+def test_segment_is_kept_until_the_write_succeeds(tmp_path):
+    storage = FailingStorage(str(tmp_path / "jobs.db"), str(tmp_path / "jobs.json"))
+    jobs = saved(storage, "A")
+    scheduler = SaveScheduler(storage, delay=0.01, max_delay=0.05)
+    journal = JobJournal(str(tmp_path / "journal.jsonl"))
+    journal.replay(jobs)
+    change_status(journal, jobs[0], "Applied")
+
+    storage.failing = True
+    assert journal.compact(scheduler, jobs)
+    assert not scheduler.flush()
+    assert not journal.compact(scheduler, jobs)
+    assert os.path.exists(journal.segment_path)
+    assert storage.load()[0]["status"] == "New"
+
+    storage.failing = False
+    assert scheduler.flush()
+    assert journal.compact(scheduler, jobs)
+    assert not os.path.exists(journal.segment_path)
+    assert storage.load()[0]["status"] == "Applied"
+    scheduler.close()
+    storage.close()
+
+def test_segment_left_by_a_failed_run_is_replayed_and_written(tmp_path):
+    storage = FailingStorage(str(tmp_path / "jobs.db"), str(tmp_path / "jobs.json"))
+    jobs = saved(storage, "A")
+    storage.failing = True
+    scheduler = SaveScheduler(storage, delay=0.01, max_delay=0.05)
+    journal = JobJournal(str(tmp_path / "journal.jsonl"))
+    journal.replay(jobs)
+    change_status(journal, jobs[0], "Applied")
+    journal.close(scheduler, jobs)
+    scheduler.close()
+    assert os.path.exists(journal.segment_path)
+
+    storage.failing = False
+    loaded = storage.load()
+    scheduler = SaveScheduler(storage, delay=0.01, max_delay=0.05)
+    journal = JobJournal(str(tmp_path / "journal.jsonl"))
+    journal.replay(loaded)
+    assert loaded[0]["status"] == "Applied"
+    journal.close(scheduler, loaded)
+    scheduler.close()
+    assert not os.path.exists(journal.segment_path)
+    assert storage.load()[0]["status"] == "Applied"
+    storage.close()
+
+def test_store_edits_go_through_the_journal(tmp_path):
+    storage = SqliteStorage(str(tmp_path / "jobs.db"), str(tmp_path / "jobs.json"))
+    jobs = saved(storage, "A")
+    # A GUI session ended before its journal was compacted
+    journal = JobJournal(str(tmp_path / "journal.jsonl"))
+    journal.replay(jobs)
+    change_status(journal, jobs[0], "Interested")
+
+    store = SavedJobStore(storage, JobJournal(str(tmp_path / "journal.jsonl")))
+    assert store.jobs[0]["status"] == "Interested"
+    assert store.update(jobs[0]["refnr"], status="Applied")
+    store.commit()
+    assert not os.path.exists(journal.path) and not os.path.exists(journal.segment_path)
+
+    loaded = storage.load()
+    JobJournal(str(tmp_path / "journal.jsonl")).replay(loaded)
+    assert loaded[0]["status"] == "Applied"
+    assert [entry[1] for entry in loaded[0]["history"]] == ["Interested", "Applied"]
+    storage.close()
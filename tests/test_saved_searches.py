@@ -0,0 +1,34 @@
+# test_saved_searches.py
+# Saved searches keep the fan-out of the search form
+
+from job_records import JobRecord, build_search_queries
+from saved_searches import SavedSearch
+
+def test_saved_search_keeps_one_query_per_term():
+    search = SavedSearch("Küche", build_search_queries(was="Koch, Bäcker", wo="Berlin"))
+    restored = SavedSearch.from_dict(search.to_dict())
+    assert [label for label, _ in restored.queries] == ["Koch in Berlin", "Bäcker in Berlin"]
+    assert restored.queries[1][1] == {"wo": "Berlin", "was": "Bäcker"}
+
+def test_older_files_are_split_into_queries():
+    data = {"name": "Küche", "params": {"was": "Koch, Bäcker", "wo": "Berlin"},
+            "new": [{"titel": "Koch", "arbeitgeber": "Gasthaus", "refnr": "1", "arbeitsort": {"ort": "Berlin"}}]}
+    search = SavedSearch.from_dict(data)
+    assert [params["was"] for _, params in search.queries] == ["Koch", "Bäcker"]
+    assert search.new[0].title == "Koch" and search.new[0].location == "Berlin"
+
+def test_merge_results_reports_postings_not_seen_before():
+    search = SavedSearch("Koch", build_search_queries(was="Koch", wo="Berlin"))
+    first = [JobRecord("Koch", "A", "Berlin", "1", ""), JobRecord("Koch", "B", "Berlin", "2", "")]
+    assert search.merge_results(first, now=1.0) == []
+    later = first + [JobRecord("Koch", "C", "Berlin", "3", "")]
+    assert [record.refnr for record in search.merge_results(later, now=2.0)] == ["3"]
+    assert [record.refnr for record in SavedSearch.from_dict(search.to_dict()).new] == ["3"]
+
+def test_first_successful_run_after_a_failed_one_is_the_baseline():
+    search = SavedSearch("Koch", build_search_queries(was="Koch", wo="Berlin"))
+    search.run_failed(now=1.0)
+    records = [JobRecord("Koch", "A", "Berlin", str(i), "") for i in range(8)]
+    restored = SavedSearch.from_dict(search.to_dict())
+    assert restored.merge_results(records, now=2.0) == []
+    assert restored.new == []
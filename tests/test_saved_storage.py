@@ -0,0 +1,61 @@
+# test_saved_storage.py
+# Saved jobs without a refnr must survive every storage path
+
+from job_data import JsonStorage, SqliteStorage
+from job_records import JobRecord, has_refnr
+from job_repository import SavedJobStore
+from persistence import SaveScheduler
+
+def no_refnr_entries(*titles):
+    return [JobRecord(title, "Firma", "Berlin", "N/A", "").to_entry() for title in titles]
+
+def test_entries_without_refnr_get_distinct_keys():
+    a, b = no_refnr_entries("A", "B")
+    assert a["refnr"] != b["refnr"]
+    assert not has_refnr(a["refnr"]) and not has_refnr("N/A")
+    assert has_refnr("10000-1234567-S")
+
+def test_sqlite_keeps_several_entries_without_refnr(tmp_path):
+    storage = SqliteStorage(str(tmp_path / "jobs.db"), str(tmp_path / "jobs.json"))
+    storage.apply(no_refnr_entries("A", "B"), set())
+    assert [job["title"] for job in storage.load()] == ["A", "B"]
+    storage.close()
+
+def test_save_scheduler_keeps_several_entries_without_refnr(tmp_path):
+    storage = SqliteStorage(str(tmp_path / "jobs.db"), str(tmp_path / "jobs.json"))
+    scheduler = SaveScheduler(storage, delay=0.01, max_delay=0.05)
+    jobs = []
+    for entry in no_refnr_entries("A", "B"):
+        jobs.append(entry)
+        scheduler.upsert(entry, jobs)
+    scheduler.close()
+    assert [job["title"] for job in storage.load()] == ["A", "B"]
+    storage.close()
+
+def test_store_commits_several_entries_without_refnr(tmp_path):
+    storage = SqliteStorage(str(tmp_path / "jobs.db"), str(tmp_path / "jobs.json"))
+    store = SavedJobStore(storage)
+    assert all(store.add(entry) for entry in no_refnr_entries("A", "B"))
+    store.commit()
+    assert [job["title"] for job in storage.load()] == ["A", "B"]
+    storage.close()
+
+def test_json_migration_keeps_entries_without_refnr(tmp_path):
+    legacy = [dict(entry, refnr="N/A") for entry in no_refnr_entries("A", "B")]
+    JsonStorage(str(tmp_path / "jobs.json")).save_all(legacy)
+    storage = SqliteStorage(str(tmp_path / "jobs.db"), str(tmp_path / "jobs.json"))
+    jobs = storage.load()
+    assert [job["title"] for job in jobs] == ["A", "B"]
+    assert len({job["refnr"] for job in jobs}) == 2
+    storage.close()
+
+def test_save_scheduler_writes_the_jobs_as_they_were_when_scheduled(tmp_path):
+    storage = JsonStorage(str(tmp_path / "jobs.json"))
+    scheduler = SaveScheduler(storage, delay=0.01, max_delay=0.05)
+    jobs = no_refnr_entries("A")
+    scheduler.upsert(jobs[0], jobs)
+    # Edits on the GUI thread after scheduling reach storage with their own upsert only
+    jobs[0]["notes"] = "später"
+    jobs[0]["extra"] = 1
+    scheduler.close()
+    assert storage.load()[0]["notes"] == ""
@@ -0,0 +1,73 @@
+# trace_panel.py
+# Small window with rolling latency percentiles from the instrumentation layer
+
+from PyQt5 import QtWidgets, QtCore
+
+import instrumentation
+
+class TracePanel(QtWidgets.QDialog):
+    """Non-modal table of span percentiles and counters, refreshed every second while shown."""
+
+    HEADERS = ["Messpunkt", "Anzahl", "p50 (ms)", "p90 (ms)", "p99 (ms)"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Messwerte")
+        self.resize(620, 420)
+        layout = QtWidgets.QVBoxLayout(self)
+
+        self.table = QtWidgets.QTableWidget(0, len(self.HEADERS))
+        self.table.setHorizontalHeaderLabels(self.HEADERS)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+        self.counter_label = QtWidgets.QLabel()
+        self.counter_label.setWordWrap(True)
+        layout.addWidget(self.counter_label)
+
+        buttons = QtWidgets.QHBoxLayout()
+        save_button = QtWidgets.QPushButton("Trace speichern...")
+        save_button.clicked.connect(self.save_trace)
+        reset_button = QtWidgets.QPushButton("Zurücksetzen")
+        reset_button.clicked.connect(self.reset)
+        buttons.addWidget(save_button)
+        buttons.addWidget(reset_button)
+        buttons.addStretch()
+        layout.addLayout(buttons)
+
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        self.refresh()
+        self.timer.start(1000)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        summary = instrumentation.percentiles()
+        self.table.setRowCount(len(summary))
+        for row, (name, values) in enumerate(summary.items()):
+            cells = [name, str(values["count"])] + [f"{values[p]:.2f}" for p in ("p50", "p90", "p99")]
+            for column, text in enumerate(cells):
+                item = QtWidgets.QTableWidgetItem(text)
+                if column:
+                    item.setTextAlignment(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+                self.table.setItem(row, column, item)
+        counters = instrumentation.counters()
+        self.counter_label.setText(", ".join(f"{name}: {value}" for name, value in sorted(counters.items())))
+
+    def save_trace(self):
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Trace speichern", instrumentation.trace_path, "Chrome Trace (*.json)")
+        if path:
+            instrumentation.write_trace(path)
+
+    def reset(self):
+        instrumentation.reset()
+        self.refresh()